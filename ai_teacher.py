@@ -1,5 +1,6 @@
 import json
 import datetime
+import os
 import random
 import re
 import requests
@@ -11,6 +12,8 @@ import threading
 import time
 from pathlib import Path
 
+from app.core.sqlite import get_sqlite_pragmas, apply_sqlite_pragmas
+
 # Simulated ML/NLP components (in a real implementation, you'd use actual libraries)
 class NLPProcessor:
     """Natural Language Processing for understanding user queries and generating responses"""
@@ -338,13 +341,22 @@ class SmartReminder:
 class DataManager:
     """Manages user data, habits, and learning from interactions"""
     
-    def __init__(self, db_path: str = "ai_teacher.db"):
+    def __init__(self, db_path: str = "ai_teacher.db", sqlite_profile: Optional[str] = None):
         self.db_path = db_path
+        # Opt in with AI_TEACHER_SQLITE_PROFILE=performance: WAL is persistent and
+        # would rewrite the header of the ai_teacher.db checked into the repo
+        self.sqlite_pragmas = get_sqlite_pragmas(sqlite_profile or os.getenv("AI_TEACHER_SQLITE_PROFILE", "default"))
         self.init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with the configured SQLite profile applied"""
+        conn = sqlite3.connect(self.db_path)
+        apply_sqlite_pragmas(conn, self.sqlite_pragmas)
+        return conn
+    
     def init_database(self):
         """Initialize database with required tables"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         # Users table
@@ -403,7 +415,7 @@ class DataManager:
     
     def add_user(self, name: str, preferences: Dict = None) -> int:
         """Add new user and return user ID"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         preferences_json = json.dumps(preferences) if preferences else '{}'
@@ -421,7 +433,7 @@ class DataManager:
     def add_habit(self, user_id: int, name: str, description: str = "", 
                   frequency: str = "daily", reminder_time: str = "morning") -> int:
         """Add new habit for user"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute(
@@ -439,7 +451,7 @@ class DataManager:
     def log_habit_completion(self, habit_id: int, completed: bool, 
                            mood: str = None, notes: str = None):
         """Log habit completion status"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute(
@@ -453,7 +465,7 @@ class DataManager:
     
     def get_habit_data(self, user_id: int, days: int = 30) -> List[Dict]:
         """Get habit data for analysis"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -481,7 +493,7 @@ class DataManager:
     def save_interaction(self, user_id: int, query: str, response: str, 
                         intent: str, sentiment: str):
         """Save user interaction for learning"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute(
@@ -10,6 +10,10 @@ from datetime import datetime, timedelta
 import json
 
 from ai_teacher import AITeacher
+from app.config import settings
+from app.core.interactions import interaction_user_key
+from app.core.ratelimit import RateLimitMiddleware, create_rate_limiter
+from app.core.responses import CompressionMiddleware, DefaultJSONResponse
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -21,9 +25,19 @@ app = FastAPI(
     description="Intelligent AI Teacher for Habit Formation, Guidance, and Motivation",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=DefaultJSONResponse
 )
 
+# Rate limiting, with the AI endpoints costed above plain reads
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(
+        RateLimitMiddleware,
+        limiter=create_rate_limiter(),
+        costs=settings.RATE_LIMIT_ROUTE_COSTS,
+        trusted_proxy_hops=settings.RATE_LIMIT_TRUSTED_PROXY_HOPS
+    )
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -33,6 +47,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress AI answers and other large JSON bodies
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.GZIP_LEVEL,
+    brotli_quality=settings.BROTLI_QUALITY
+)
+
 # Initialize AI Teacher
 ai_teacher = AITeacher()
 
@@ -182,11 +204,8 @@ async def ask_ai(request: Dict[str, Any]):
         if not question:
             raise HTTPException(status_code=400, detail="Question is required")
         
-        # Convert string user_id to int for compatibility
-        try:
-            user_id_int = int(user_id) if user_id.isdigit() else hash(user_id) % 1000000
-        except:
-            user_id_int = hash(user_id) % 1000000
+        # Same key the app's data export reads interactions back by
+        user_id_int = interaction_user_key(str(user_id))
         
         # Process query through AI Teacher
         response = ai_teacher.process_query(
@@ -212,11 +231,8 @@ async def get_ai_insights(request: Dict[str, Any]):
     try:
         user_id = request.get('user_id', 'default_user')
         
-        # Convert string user_id to int for compatibility
-        try:
-            user_id_int = int(user_id) if user_id.isdigit() else hash(user_id) % 1000000
-        except:
-            user_id_int = hash(user_id) % 1000000
+        # Same key the app's data export reads interactions back by
+        user_id_int = interaction_user_key(str(user_id))
         
         # Get insights from AI Teacher
         insights = ai_teacher.get_user_insights(user_id_int)
@@ -255,11 +271,8 @@ async def start_ai_coaching_session(request: Dict[str, Any]):
         user_id = request.get('user_id', 'default_user')
         session_type = request.get('session_type', 'general')
         
-        # Convert string user_id to int for compatibility
-        try:
-            user_id_int = int(user_id) if user_id.isdigit() else hash(user_id) % 1000000
-        except:
-            user_id_int = hash(user_id) % 1000000
+        # Same key the app's data export reads interactions back by
+        user_id_int = interaction_user_key(str(user_id))
         
         # Get user context and insights
         user_context = ai_teacher._get_user_context(user_id_int)
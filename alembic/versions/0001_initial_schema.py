@@ -0,0 +1,152 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'users',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('email', sa.String(length=255), nullable=False),
+        sa.Column('username', sa.String(length=50), nullable=False),
+        sa.Column('hashed_password', sa.String(length=255), nullable=False),
+        sa.Column('first_name', sa.String(length=100), nullable=True),
+        sa.Column('last_name', sa.String(length=100), nullable=True),
+        sa.Column('bio', sa.Text(), nullable=True),
+        sa.Column('avatar_url', sa.String(length=500), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('is_verified', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_login', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+    op.create_index('ix_users_username', 'users', ['username'], unique=True)
+
+    op.create_table(
+        'categories',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('color', sa.String(length=7), nullable=True),
+        sa.Column('icon', sa.String(length=50), nullable=True),
+        sa.Column('is_default', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name')
+    )
+
+    op.create_table(
+        'habits',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('category_id', sa.String(), nullable=False),
+        sa.Column('title', sa.String(length=200), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('frequency_type', sa.Enum('DAILY', 'WEEKLY', 'MONTHLY', 'CUSTOM', name='frequencytype'), nullable=True),
+        sa.Column('frequency_value', sa.Integer(), nullable=True),
+        sa.Column('target_count', sa.Integer(), nullable=True),
+        sa.Column('color', sa.String(length=7), nullable=True),
+        sa.Column('icon', sa.String(length=50), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('is_public', sa.Boolean(), nullable=True),
+        sa.Column('start_date', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('end_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('current_streak', sa.Integer(), nullable=True),
+        sa.Column('longest_streak', sa.Integer(), nullable=True),
+        sa.Column('total_completions', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['category_id'], ['categories.id']),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_habits_category_id', 'habits', ['category_id'], unique=False)
+    op.create_index('ix_habits_user_id', 'habits', ['user_id'], unique=False)
+
+    op.create_table(
+        'completions',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('habit_id', sa.String(), nullable=False),
+        sa.Column('completed_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('mood_rating', sa.Integer(), nullable=True),
+        sa.Column('difficulty_rating', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['habit_id'], ['habits.id']),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_completions_completed_at', 'completions', ['completed_at'], unique=False)
+    op.create_index('ix_completions_habit_id', 'completions', ['habit_id'], unique=False)
+    op.create_index('ix_completions_user_id', 'completions', ['user_id'], unique=False)
+
+    op.create_table(
+        'reminders',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('habit_id', sa.String(), nullable=True),
+        sa.Column('title', sa.String(length=200), nullable=False),
+        sa.Column('message', sa.String(length=500), nullable=True),
+        sa.Column('reminder_time', sa.Time(), nullable=False),
+        sa.Column('days_of_week', sa.String(length=50), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('is_recurring', sa.Boolean(), nullable=True),
+        sa.Column('last_sent', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('next_send', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['habit_id'], ['habits.id']),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_reminders_habit_id', 'reminders', ['habit_id'], unique=False)
+    op.create_index('ix_reminders_next_send', 'reminders', ['next_send'], unique=False)
+    op.create_index('ix_reminders_user_id', 'reminders', ['user_id'], unique=False)
+
+    op.create_table(
+        'streaks',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('habit_id', sa.String(), nullable=False),
+        sa.Column('start_date', sa.Date(), nullable=False),
+        sa.Column('end_date', sa.Date(), nullable=True),
+        sa.Column('current_length', sa.Integer(), nullable=True),
+        sa.Column('longest_length', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['habit_id'], ['habits.id']),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_streaks_habit_id', 'streaks', ['habit_id'], unique=False)
+    op.create_index('ix_streaks_start_date', 'streaks', ['start_date'], unique=False)
+    op.create_index('ix_streaks_user_id', 'streaks', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_table('streaks')
+    op.drop_table('reminders')
+    op.drop_table('completions')
+    op.drop_table('habits')
+    op.drop_table('categories')
+    op.drop_table('users')
+    sa.Enum(name='frequencytype').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,39 @@
+"""composite indexes for completion and reminder queries
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # "completions for habit X in period Y"
+    op.create_index('ix_completions_habit_id_completed_at', 'completions', ['habit_id', 'completed_at'], unique=False)
+    # "completions for user X by date"
+    op.create_index('ix_completions_user_id_completed_at', 'completions', ['user_id', 'completed_at'], unique=False)
+    # "active reminders due before T"
+    op.create_index('ix_reminders_is_active_next_send', 'reminders', ['is_active', 'next_send'], unique=False)
+
+    # The single-column habit_id/user_id indexes are left-prefixes of the composites above
+    op.drop_index('ix_completions_habit_id', table_name='completions')
+    op.drop_index('ix_completions_user_id', table_name='completions')
+
+
+def downgrade() -> None:
+    op.create_index('ix_completions_user_id', 'completions', ['user_id'], unique=False)
+    op.create_index('ix_completions_habit_id', 'completions', ['habit_id'], unique=False)
+    op.drop_index('ix_reminders_is_active_next_send', table_name='reminders')
+    op.drop_index('ix_completions_user_id_completed_at', table_name='completions')
+    op.drop_index('ix_completions_habit_id_completed_at', table_name='completions')
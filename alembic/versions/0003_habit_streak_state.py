@@ -0,0 +1,30 @@
+"""habit streak state for the incremental streak engine
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('habits') as batch_op:
+        batch_op.add_column(sa.Column('streak_period', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('period_completions', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('habits') as batch_op:
+        batch_op.drop_column('period_completions')
+        batch_op.drop_column('streak_period')
@@ -0,0 +1,77 @@
+"""store reminder days_of_week as a 7-bit mask
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ALL_DAYS_MASK = 0b1111111
+
+reminders = sa.table(
+    'reminders',
+    sa.column('days_of_week', sa.String),
+    sa.column('days_mask', sa.Integer),
+)
+
+
+def _days_to_mask(days_of_week) -> int:
+    if days_of_week is None:
+        return ALL_DAYS_MASK
+    mask = 0
+    for day in days_of_week.split(','):
+        day = day.strip()
+        if day.isdigit() and 1 <= int(day) <= 7:
+            mask |= 1 << (int(day) - 1)
+    return mask
+
+
+def _mask_to_days(mask: int) -> str:
+    return ','.join(str(day) for day in range(1, 8) if mask & (1 << (day - 1)))
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('reminders') as batch_op:
+        batch_op.add_column(sa.Column('days_mask', sa.Integer(), nullable=False, server_default=str(ALL_DAYS_MASK)))
+
+    # One UPDATE per distinct day string (at most a few hundred) rather than per row
+    bind = op.get_bind()
+    distinct_days = bind.execute(sa.select(reminders.c.days_of_week).distinct()).scalars().all()
+    for days_of_week in distinct_days:
+        mask = _days_to_mask(days_of_week)
+        condition = (
+            reminders.c.days_of_week.is_(None) if days_of_week is None
+            else reminders.c.days_of_week == days_of_week
+        )
+        bind.execute(reminders.update().where(condition).values(days_mask=mask))
+
+    with op.batch_alter_table('reminders') as batch_op:
+        batch_op.drop_column('days_of_week')
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('reminders') as batch_op:
+        batch_op.add_column(sa.Column('days_of_week', sa.String(length=50), nullable=True))
+
+    bind = op.get_bind()
+    distinct_masks = bind.execute(sa.select(reminders.c.days_mask).distinct()).scalars().all()
+    for mask in distinct_masks:
+        bind.execute(
+            reminders.update()
+            .where(reminders.c.days_mask == mask)
+            .values(days_of_week=_mask_to_days(mask))
+        )
+
+    with op.batch_alter_table('reminders') as batch_op:
+        batch_op.drop_column('days_mask')
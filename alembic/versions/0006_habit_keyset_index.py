@@ -0,0 +1,31 @@
+"""keyset pagination index for habits
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # "habits for user X, newest first, after cursor (created_at, id)"
+    op.create_index('ix_habits_user_id_created_at_id', 'habits', ['user_id', 'created_at', 'id'], unique=False)
+
+    # The single-column user_id index is a left-prefix of the composite above
+    op.drop_index('ix_habits_user_id', table_name='habits')
+
+
+def downgrade() -> None:
+    op.create_index('ix_habits_user_id', 'habits', ['user_id'], unique=False)
+    op.drop_index('ix_habits_user_id_created_at_id', table_name='habits')
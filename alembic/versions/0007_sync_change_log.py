@@ -0,0 +1,54 @@
+"""sync change log
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-16 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, entity_type, has user_id)
+SYNCED_TABLES = [
+    ('categories', 'category', False),
+    ('habits', 'habit', True),
+    ('reminders', 'reminder', True),
+    ('completions', 'completion', True),
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        'sync_changes',
+        sa.Column('id', sa.BigInteger().with_variant(sa.Integer(), 'sqlite'), autoincrement=True, nullable=False),
+        sa.Column('user_id', sa.String(), nullable=True),
+        sa.Column('entity_type', sa.String(length=20), nullable=False),
+        sa.Column('entity_id', sa.String(), nullable=False),
+        sa.Column('operation', sa.String(length=10), nullable=False),
+        sa.Column('changed_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    # "changes for user X after token T"
+    op.create_index('ix_sync_changes_user_id_id', 'sync_changes', ['user_id', 'id'], unique=False)
+
+    # Seed one upsert per existing row so token 0 means "everything"
+    for table, entity_type, has_user_id in SYNCED_TABLES:
+        user_id = 'user_id' if has_user_id else 'NULL'
+        op.execute(
+            f"INSERT INTO sync_changes (user_id, entity_type, entity_id, operation) "
+            f"SELECT {user_id}, '{entity_type}', id, 'upsert' FROM {table}"
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_sync_changes_user_id_id', table_name='sync_changes')
+    op.drop_table('sync_changes')
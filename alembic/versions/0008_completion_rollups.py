@@ -0,0 +1,114 @@
+"""completion rollups for analytics
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-16 13:00:00.000000
+
+Backfills the rollups from existing completions; scripts/rebuild_rollups.py
+does the same for a database already at this revision.
+
+"""
+from datetime import date, datetime, timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008'
+down_revision: Union[str, None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Self-contained copies of the tables as of this revision
+completions = sa.table(
+    'completions',
+    sa.column('habit_id', sa.String()),
+    sa.column('user_id', sa.String()),
+    sa.column('completed_at', sa.DateTime()),
+    sa.column('mood_rating', sa.Integer()),
+    sa.column('difficulty_rating', sa.Integer())
+)
+completion_rollups = sa.table(
+    'completion_rollups',
+    sa.column('habit_id', sa.String()),
+    sa.column('granularity', sa.String()),
+    sa.column('period_start', sa.Date()),
+    sa.column('user_id', sa.String()),
+    sa.column('count', sa.Integer()),
+    sa.column('mood_sum', sa.Integer()),
+    sa.column('mood_count', sa.Integer()),
+    sa.column('difficulty_sum', sa.Integer()),
+    sa.column('difficulty_count', sa.Integer())
+)
+
+HABITS_PER_BATCH = 500
+
+
+def upgrade() -> None:
+    op.create_table(
+        'completion_rollups',
+        sa.Column('habit_id', sa.String(), nullable=False),
+        sa.Column('granularity', sa.String(length=10), nullable=False),
+        sa.Column('period_start', sa.Date(), nullable=False),
+        sa.Column('user_id', sa.String(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.Column('mood_sum', sa.Integer(), nullable=False),
+        sa.Column('mood_count', sa.Integer(), nullable=False),
+        sa.Column('difficulty_sum', sa.Integer(), nullable=False),
+        sa.Column('difficulty_count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['habit_id'], ['habits.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('habit_id', 'granularity', 'period_start')
+    )
+    # "chart for user X by period"
+    op.create_index(
+        'ix_completion_rollups_user_id_granularity_period_start', 'completion_rollups',
+        ['user_id', 'granularity', 'period_start'], unique=False
+    )
+    _backfill(op.get_bind())
+
+
+def _period_start(granularity: str, moment) -> date:
+    day = moment.date() if isinstance(moment, datetime) else moment
+    if granularity == 'week':
+        return day - timedelta(days=day.weekday())
+    if granularity == 'month':
+        return day.replace(day=1)
+    return day
+
+
+def _backfill(connection) -> None:
+    # A chunk of habits at a time, fully fetched before writing, so no
+    # cursor is left open on the connection (MySQL cannot interleave them)
+    habit_ids = connection.execute(sa.select(completions.c.habit_id).distinct()).scalars().all()
+    for index in range(0, len(habit_ids), HABITS_PER_BATCH):
+        rows = connection.execute(
+            sa.select(completions).where(completions.c.habit_id.in_(habit_ids[index:index + HABITS_PER_BATCH]))
+        ).fetchall()
+        periods = {}
+        for row in rows:
+            for granularity in ('day', 'week', 'month'):
+                key = (row.habit_id, granularity, _period_start(granularity, row.completed_at))
+                period = periods.get(key)
+                if period is None:
+                    period = periods[key] = {
+                        'habit_id': row.habit_id, 'user_id': row.user_id,
+                        'granularity': granularity, 'period_start': key[2],
+                        'count': 0, 'mood_sum': 0, 'mood_count': 0, 'difficulty_sum': 0, 'difficulty_count': 0
+                    }
+                period['count'] += 1
+                if row.mood_rating is not None:
+                    period['mood_sum'] += row.mood_rating
+                    period['mood_count'] += 1
+                if row.difficulty_rating is not None:
+                    period['difficulty_sum'] += row.difficulty_rating
+                    period['difficulty_count'] += 1
+        if periods:
+            connection.execute(completion_rollups.insert(), list(periods.values()))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_completion_rollups_user_id_granularity_period_start', table_name='completion_rollups')
+    op.drop_table('completion_rollups')
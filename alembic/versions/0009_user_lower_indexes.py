@@ -0,0 +1,38 @@
+"""case-insensitive unique indexes for user logins
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17 12:00:00.000000
+
+Fails if two existing users differ only in the case of their email or
+username; merge or rename those accounts first.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0009'
+down_revision: Union[str, None] = '0008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Logins look up lower(email) or lower(username), never both
+    op.create_index('ix_users_lower_email', 'users', [sa.text('lower(email)')], unique=True)
+    op.create_index('ix_users_lower_username', 'users', [sa.text('lower(username)')], unique=True)
+
+    # Case-insensitive uniqueness implies exact uniqueness
+    op.drop_index('ix_users_email', table_name='users')
+    op.drop_index('ix_users_username', table_name='users')
+
+
+def downgrade() -> None:
+    op.create_index('ix_users_username', 'users', ['username'], unique=True)
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+    op.drop_index('ix_users_lower_username', table_name='users')
+    op.drop_index('ix_users_lower_email', table_name='users')
@@ -0,0 +1,32 @@
+"""sync change log writer lock
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0010'
+down_revision: Union[str, None] = '0009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Writers of sync_changes lock this row until commit so ids commit in order
+    op.create_table(
+        'sync_log_lock',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.execute("INSERT INTO sync_log_lock (id) VALUES (1)")
+
+
+def downgrade() -> None:
+    op.drop_table('sync_log_lock')
@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import auth, users, habits, categories, completions, reminders, analytics
+from app.api.v1.endpoints import auth, users, habits, categories, completions, reminders, analytics, sync, dashboard, events
 
 # Create main API router
 api_router = APIRouter()
@@ -12,3 +12,6 @@ api_router.include_router(categories.router, prefix="/categories", tags=["Catego
 api_router.include_router(completions.router, prefix="/completions", tags=["Completions"])
 api_router.include_router(reminders.router, prefix="/reminders", tags=["Reminders"])
 api_router.include_router(analytics.router, prefix="/analytics", tags=["Analytics"])
+api_router.include_router(sync.router, prefix="/sync", tags=["Sync"])
+api_router.include_router(dashboard.router, prefix="/dashboard", tags=["Dashboard"])
+api_router.include_router(events.router, prefix="/events", tags=["Events"])
@@ -0,0 +1,49 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date, datetime
+from typing import Literal, Optional
+
+from app.database import get_async_db
+from app.core.analytics import get_heatmap, get_trends
+from app.core.dependencies import AuthenticatedUser, get_current_user
+from app.models.habit import Habit
+from app.schemas.analytics import HeatmapResponse, TrendsResponse
+
+router = APIRouter()
+
+@router.get("/heatmap", response_model=HeatmapResponse)
+async def completion_heatmap(
+    habit_id: Optional[str] = Query(None, description="Limit to one habit (default: all habits)"),
+    year: Optional[int] = Query(None, ge=1970, le=9999, description="Calendar year (default: current)"),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Completions per day for a whole year, as one compact array"""
+    await _check_habit(db, current_user, habit_id)
+    year = year or datetime.utcnow().year
+    return await db.run_sync(get_heatmap, current_user.id, year, habit_id)
+
+@router.get("/trends", response_model=TrendsResponse)
+async def completion_trends(
+    granularity: Literal["day", "week", "month"] = Query("month"),
+    habit_id: Optional[str] = Query(None, description="Limit to one habit (default: all habits)"),
+    start: Optional[date] = Query(None, description="First period start to include"),
+    end: Optional[date] = Query(None, description="Last period start to include"),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Completion count and average mood/difficulty per period"""
+    await _check_habit(db, current_user, habit_id)
+    points = await db.run_sync(get_trends, current_user.id, granularity, habit_id, start, end)
+    return TrendsResponse(granularity=granularity, habit_id=habit_id, points=points)
+
+async def _check_habit(db: AsyncSession, user: AuthenticatedUser, habit_id: Optional[str]):
+    if habit_id is None:
+        return
+    owned = await db.scalar(select(Habit.id).where(Habit.id == habit_id, Habit.user_id == user.id))
+    if owned is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Habit not found"
+        )
@@ -1,14 +1,21 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from fastapi.security import HTTPAuthorizationCredentials, OAuth2PasswordRequestForm
+from sqlalchemy import exists, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
+from typing import Optional
 
-from app.database import get_db
+from app.database import get_async_db
+from app.core.dependencies import AuthenticatedUser, get_current_user, security
 from app.core.security import (
-    verify_password, 
+    verify_and_update_password_async,
     create_access_token, 
     create_refresh_token,
-    get_password_hash
+    hash_password_async,
+    revoke_token,
+    revoke_user_tokens,
+    verify_token
 )
 from app.models.user import User
 from app.schemas.auth import (
@@ -21,28 +28,31 @@ from app.schemas.auth import (
 router = APIRouter()
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def register(user_data: UserRegister, db: Session = Depends(get_db)):
+async def register(user_data: UserRegister, db: AsyncSession = Depends(get_async_db)):
     """Register a new user"""
     
-    # Check if user already exists
-    existing_user = db.query(User).filter(
-        (User.email == user_data.email) | (User.username == user_data.username)
-    ).first()
-    
-    if existing_user:
-        if existing_user.email == user_data.email:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Username already taken"
-            )
+    # Check if user already exists (case-insensitively, one index probe each)
+    result = await db.execute(
+        select(
+            exists().where(func.lower(User.email) == user_data.email.lower()),
+            exists().where(func.lower(User.username) == user_data.username.lower())
+        )
+    )
+    email_taken, username_taken = result.one()
+    
+    if email_taken:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
+    if username_taken:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Username already taken"
+        )
     
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await hash_password_async(user_data.password)
     
     new_user = User(
         email=user_data.email,
@@ -53,8 +63,16 @@ async def register(user_data: UserRegister, db: Session = Depends(get_db)):
     )
     
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # Lost a race with a concurrent registration of the same email or username
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email or username already registered"
+        )
+    await db.refresh(new_user)
     
     return UserResponse(
         id=new_user.id,
@@ -68,14 +86,16 @@ async def register(user_data: UserRegister, db: Session = Depends(get_db)):
     )
 
 @router.post("/login", response_model=TokenResponse)
-async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
+async def login(user_credentials: UserLogin, db: AsyncSession = Depends(get_async_db)):
     """Login user and return access token"""
     
-    # Find user by email or username
-    user = db.query(User).filter(
-        (User.email == user_credentials.email_or_username) | 
-        (User.username == user_credentials.email_or_username)
-    ).first()
+    # Find user by email or username, whichever the identifier looks like
+    user = None
+    for login_filter in User.login_filters(user_credentials.email_or_username):
+        result = await db.execute(select(User).where(login_filter))
+        user = result.scalars().first()
+        if user:
+            break
     
     if not user:
         raise HTTPException(
@@ -83,7 +103,8 @@ async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
             detail="Invalid credentials"
         )
     
-    if not verify_password(user_credentials.password, user.hashed_password):
+    verified, new_hash = await verify_and_update_password_async(user_credentials.password, user.hashed_password)
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials"
@@ -95,10 +116,12 @@ async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
             detail="Inactive user account"
         )
     
-    # Update last login
+    # Update last login, and upgrade a hash made with an older scheme or cost
     from datetime import datetime
     user.last_login = datetime.utcnow()
-    db.commit()
+    if new_hash:
+        user.hashed_password = new_hash
+    await db.commit()
     
     # Create tokens
     access_token = create_access_token(data={"sub": user.id})
@@ -121,7 +144,7 @@ async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
     )
 
 @router.post("/refresh", response_model=TokenResponse)
-async def refresh_token(refresh_token: str, db: Session = Depends(get_db)):
+async def refresh_token(refresh_token: str, db: AsyncSession = Depends(get_async_db)):
     """Refresh access token using refresh token"""
     
     from app.core.security import verify_token, get_user_id_from_token
@@ -135,7 +158,8 @@ async def refresh_token(refresh_token: str, db: Session = Depends(get_db)):
         )
     
     user_id = payload.get("sub")
-    user = db.query(User).filter(User.id == user_id).first()
+    result = await db.execute(select(User).where(User.id == user_id))
+    user = result.scalar_one_or_none()
     
     if not user or not user.is_active:
         raise HTTPException(
@@ -164,6 +188,23 @@ async def refresh_token(refresh_token: str, db: Session = Depends(get_db)):
     )
 
 @router.post("/logout")
-async def logout():
-    """Logout user (client should discard tokens)"""
+async def logout(
+    refresh_token: Optional[str] = None,
+    everywhere: bool = False,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    current_user: AuthenticatedUser = Depends(get_current_user)
+):
+    """Logout user: revoke this access token and, if given, its refresh token
+
+    everywhere=true revokes every token issued to the user so far. Revocation
+    is held by each worker process, so run one worker or keep token
+    lifetimes short.
+    """
+    revoke_token(credentials.credentials)
+    if refresh_token:
+        payload = verify_token(refresh_token)
+        if payload and payload.get("sub") == current_user.id:
+            revoke_token(refresh_token)
+    if everywhere:
+        revoke_user_tokens(current_user.id)
     return {"message": "Successfully logged out"}
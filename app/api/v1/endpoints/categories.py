@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+
+from app.database import get_async_db
+from app.core.etag import CollectionETag, collection_etag
+from app.models.category import Category
+from app.schemas.category import CategoryResponse
+
+router = APIRouter()
+
+categories_etag = collection_etag()
+
+@router.get("", response_model=List[CategoryResponse])
+async def list_categories(
+    response: Response,
+    etag: CollectionETag = Depends(categories_etag),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """List all categories; answers a matching If-None-Match with 304"""
+    if etag.not_modified:
+        return etag.not_modified_response()
+    etag.apply(response)
+
+    categories = await db.scalars(select(Category).order_by(Category.name))
+    return [CategoryResponse.model_validate(category) for category in categories]
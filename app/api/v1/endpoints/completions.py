@@ -0,0 +1,126 @@
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+import io
+import uuid
+
+from app.database import SessionLocal, get_async_db
+from app.core.dependencies import AuthenticatedUser, get_current_user
+from app.core.imports import import_completions_csv, utc_naive
+from app.core.streaks import record_completions
+from app.models.completion import Completion
+from app.models.habit import Habit
+from app.schemas.completion import (
+    CompletionBatchCreate,
+    CompletionBatchResponse,
+    CompletionImportResponse,
+    HabitCounters
+)
+
+router = APIRouter()
+
+@router.post("/batch", response_model=CompletionBatchResponse, status_code=status.HTTP_201_CREATED)
+async def create_completions_batch(
+    batch: CompletionBatchCreate,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Log many completions at once, e.g. everything queued while offline
+
+    Ownership of every habit is checked with one IN query, the completions
+    are inserted with one executemany, and each habit's counters and streak
+    are updated once. Completions whose client-generated ID already exists
+    are skipped, so a retried sync does not double count.
+    """
+    now = datetime.utcnow()
+    habit_ids = {completion.habit_id for completion in batch.completions}
+
+    result = await db.execute(
+        select(Habit)
+        .where(Habit.id.in_(habit_ids), Habit.user_id == current_user.id)
+        .with_for_update()
+    )
+    habits = {habit.id: habit for habit in result.scalars()}
+
+    missing = habit_ids - habits.keys()
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Habits not found: {', '.join(sorted(missing))}"
+        )
+
+    client_ids = [completion.id for completion in batch.completions if completion.id]
+    seen = set()
+    if client_ids:
+        seen.update(await db.scalars(select(Completion.id).where(Completion.id.in_(client_ids))))
+
+    rows = []
+    skipped = 0
+    for completion in batch.completions:
+        if completion.id and completion.id in seen:
+            skipped += 1
+            continue
+        completion_id = completion.id or str(uuid.uuid4())
+        seen.add(completion_id)
+        rows.append({
+            "id": completion_id,
+            "user_id": current_user.id,
+            "habit_id": completion.habit_id,
+            "completed_at": utc_naive(completion.completed_at) or now,
+            "notes": completion.notes,
+            "mood_rating": completion.mood_rating,
+            "difficulty_rating": completion.difficulty_rating
+        })
+
+    created = await db.run_sync(record_completions, habits, rows)
+    await db.commit()
+
+    return CompletionBatchResponse(
+        created=created,
+        skipped=skipped,
+        habits=[
+            HabitCounters(
+                habit_id=habit.id,
+                total_completions=habit.total_completions or 0,
+                current_streak=habit.current_streak or 0,
+                longest_streak=habit.longest_streak or 0
+            )
+            for habit in habits.values()
+        ]
+    )
+
+@router.post("/import", response_model=CompletionImportResponse)
+async def import_completions(
+    file: UploadFile = File(..., description="CSV with habit_id, completed_at[, notes, mood_rating, difficulty_rating]"),
+    current_user: AuthenticatedUser = Depends(get_current_user)
+):
+    """Import historical completions from another tracker
+
+    The upload is parsed as a stream and loaded chunk by chunk (COPY on
+    PostgreSQL), then streaks and counters are rebuilt once per habit.
+    Everything is committed together; invalid rows are skipped and reported.
+    """
+    user_id = current_user.id
+
+    def run_import():
+        db = SessionLocal()
+        try:
+            stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+            result = import_completions_csv(db, user_id, stream)
+            db.commit()
+            return result
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    try:
+        return await run_in_threadpool(run_import)
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="CSV must be UTF-8 encoded"
+        )
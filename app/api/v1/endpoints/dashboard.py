@@ -0,0 +1,93 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from datetime import datetime, timedelta
+
+from app.database import get_async_db
+from app.core.dependencies import AuthenticatedUser, get_current_user
+from app.models.habit import Habit
+from app.models.reminder import Reminder
+from app.models.rollup import CompletionRollup
+from app.schemas.dashboard import DashboardDay, DashboardResponse, DashboardSummary
+from app.schemas.habit import HabitResponse
+from app.schemas.reminder import ReminderResponse
+
+router = APIRouter()
+
+UPCOMING_REMINDERS = 5
+RECENT_DAYS = 7
+
+@router.get("", response_model=DashboardResponse)
+async def get_dashboard(
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Today's habits, summary statistics, upcoming reminders and the last week
+
+    Costs four queries however many habits the user has: active habits
+    joined to their completion counts, a selectinload for their categories,
+    the next reminders, and the daily rollups for the last week. Everything
+    else is derived from those rows in Python.
+    """
+    now = datetime.utcnow()
+    counts = Habit.completion_counts(current_user.id, now)
+
+    rows = (await db.execute(
+        select(Habit, counts.c.today_count, counts.c.week_count, counts.c.month_count)
+        .outerjoin(counts, counts.c.habit_id == Habit.id)
+        .where(Habit.user_id == current_user.id, Habit.is_active.is_(True))
+        .options(selectinload(Habit.category))
+        .order_by(Habit.created_at.desc(), Habit.id.desc())
+    )).all()
+
+    habits = []
+    for habit, today_count, week_count, month_count in rows:
+        habit.set_status_counts(today_count, week_count, month_count)
+        habits.append(HabitResponse.from_habit(habit, now))
+
+    reminders = await db.scalars(
+        select(Reminder)
+        .where(
+            Reminder.user_id == current_user.id,
+            Reminder.is_active.is_(True),
+            Reminder.next_send >= now
+        )
+        .order_by(Reminder.next_send)
+        .limit(UPCOMING_REMINDERS)
+    )
+
+    first_day = now.date() - timedelta(days=RECENT_DAYS - 1)
+    daily = dict((await db.execute(
+        select(CompletionRollup.period_start, func.sum(CompletionRollup.count))
+        .where(
+            CompletionRollup.user_id == current_user.id,
+            CompletionRollup.granularity == "day",
+            CompletionRollup.period_start >= first_day
+        )
+        .group_by(CompletionRollup.period_start)
+    )).all())
+
+    return DashboardResponse(
+        summary=_summarize(habits),
+        habits=habits,
+        upcoming_reminders=[ReminderResponse.model_validate(reminder) for reminder in reminders],
+        last_7_days=[
+            DashboardDay(date=day, count=daily.get(day) or 0)
+            for day in (first_day + timedelta(days=offset) for offset in range(RECENT_DAYS))
+        ]
+    )
+
+def _summarize(habits: list) -> DashboardSummary:
+    if not habits:
+        return DashboardSummary()
+    due_today = sum(habit.is_due_today for habit in habits)
+    return DashboardSummary(
+        total_habits=len(habits),
+        due_today=due_today,
+        completed_today=len(habits) - due_today,
+        completion_rate=round(sum(habit.completion_rate for habit in habits) / len(habits), 1),
+        best_current_streak=max(habit.current_streak for habit in habits),
+        longest_streak=max(habit.longest_streak for habit in habits),
+        total_completions=sum(habit.total_completions for habit in habits)
+    )
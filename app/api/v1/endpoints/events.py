@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+
+from app.config import settings
+from app.database import get_async_db
+from app.core.dependencies import AuthenticatedUser, get_current_user
+from app.core.events import event_hub
+
+router = APIRouter()
+
+@router.get("", response_class=StreamingResponse)
+async def stream_events(
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Server-sent events for the current user's committed changes
+
+    Each `change` event lists the changed entities as {entity_type, id,
+    operation}; fetch them with GET /sync. A `resync` event (or a change
+    with truncated=true) means events were dropped, so call GET /sync
+    anyway. Comment lines keep idle connections open through proxies.
+    Events are not replayed: on (re)connect, call GET /sync first. Run
+    uvicorn with --timeout-graceful-shutdown (GRACEFUL_SHUTDOWN_SECONDS),
+    or a restart waits for every open stream to close.
+    """
+    user_id = current_user.id
+    # The stream can stay open for hours; don't hold a pooled connection for it
+    await db.close()
+    return StreamingResponse(
+        _event_stream(user_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+async def _event_stream(user_id: str):
+    async with event_hub.subscribe(user_id) as queue:
+        yield b": connected\n\n"
+        while True:
+            try:
+                frame = await asyncio.wait_for(queue.get(), settings.EVENTS_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                frame = b": keepalive\n\n"
+            if frame is None:
+                return
+            yield frame
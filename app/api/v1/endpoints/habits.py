@@ -0,0 +1,102 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from datetime import datetime
+from typing import Optional
+import base64
+import binascii
+
+from app.database import get_async_db
+from app.core.dependencies import AuthenticatedUser, get_current_user
+from app.core.etag import CollectionETag, collection_etag
+from app.models.habit import Habit
+from app.schemas.habit import HabitListResponse, HabitResponse
+
+router = APIRouter()
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# today_count, is_due_today and current_streak also change at midnight UTC
+habits_etag = collection_etag(daily=True)
+
+@router.get("", response_model=HabitListResponse)
+async def list_habits(
+    response: Response,
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    category_id: Optional[str] = Query(None),
+    is_active: Optional[bool] = Query(None),
+    etag: CollectionETag = Depends(habits_etag),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """List the current user's habits, newest first, with keyset pagination
+
+    A page costs two queries however many habits the user has: one for the
+    habits joined to their completion counts, one selectinload for categories.
+    A matching If-None-Match is answered with 304 after the ETag query alone.
+    """
+    if etag.not_modified:
+        return etag.not_modified_response()
+    etag.apply(response)
+
+    now = datetime.utcnow()
+    counts = Habit.completion_counts(current_user.id, now)
+
+    query = (
+        select(Habit, counts.c.today_count, counts.c.week_count, counts.c.month_count)
+        .outerjoin(counts, counts.c.habit_id == Habit.id)
+        .where(Habit.user_id == current_user.id)
+        .options(selectinload(Habit.category))
+        .order_by(Habit.created_at.desc(), Habit.id.desc())
+        .limit(limit + 1)
+    )
+    if category_id is not None:
+        query = query.where(Habit.category_id == category_id)
+    if is_active is not None:
+        query = query.where(Habit.is_active.is_(is_active))
+    if cursor:
+        created_at, habit_id = _decode_cursor(cursor)
+        query = query.where(
+            tuple_(Habit.created_at, Habit.id) < tuple_(_created_at_bound(db, created_at), habit_id)
+        )
+
+    rows = (await db.execute(query)).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    items = []
+    for habit, today_count, week_count, month_count in rows:
+        habit.set_status_counts(today_count, week_count, month_count)
+        items.append(HabitResponse.from_habit(habit, now))
+
+    next_cursor = _encode_cursor(rows[-1][0]) if has_more else None
+    return HabitListResponse(items=items, next_cursor=next_cursor, has_more=has_more)
+
+def _encode_cursor(habit: Habit) -> str:
+    raw = f"{habit.created_at.isoformat(sep=' ')}|{habit.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def _decode_cursor(cursor: str):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, habit_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), habit_id
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+def _created_at_bound(db: AsyncSession, created_at: datetime):
+    """Cursor timestamp in a form comparable with stored created_at values
+
+    SQLite keeps DATETIME as text and server-default rows have no fractional
+    seconds, so compare against the same text rather than a bound datetime
+    (which SQLAlchemy always renders with microseconds).
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        return literal(created_at.replace(tzinfo=None).isoformat(sep=" "))
+    return created_at
@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+
+from app.database import get_async_db
+from app.core.dependencies import AuthenticatedUser, get_current_user
+from app.core.etag import CollectionETag, collection_etag
+from app.models.reminder import Reminder
+from app.schemas.reminder import ReminderResponse
+
+router = APIRouter()
+
+def _last_dispatch(user_id: str):
+    # The dispatcher moves last_sent/next_send without writing the change log
+    return select(func.max(Reminder.last_sent)).where(Reminder.user_id == user_id).scalar_subquery()
+
+reminders_etag = collection_etag(extra=_last_dispatch)
+
+@router.get("", response_model=List[ReminderResponse])
+async def list_reminders(
+    response: Response,
+    etag: CollectionETag = Depends(reminders_etag),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """List the current user's reminders; answers a matching If-None-Match with 304"""
+    if etag.not_modified:
+        return etag.not_modified_response()
+    etag.apply(response)
+
+    reminders = await db.scalars(
+        select(Reminder)
+        .where(Reminder.user_id == current_user.id)
+        .order_by(Reminder.reminder_time)
+    )
+    return [ReminderResponse.model_validate(reminder) for reminder in reminders]
@@ -0,0 +1,111 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from datetime import datetime
+from typing import Optional
+
+from app.database import get_async_db
+from app.core.dependencies import AuthenticatedUser, get_current_user
+from app.models.category import Category
+from app.models.completion import Completion
+from app.models.habit import Habit
+from app.models.reminder import Reminder
+from app.models.sync_change import DELETE, SyncChange
+from app.schemas.category import CategoryResponse
+from app.schemas.completion import CompletionResponse
+from app.schemas.habit import HabitResponse
+from app.schemas.reminder import ReminderResponse
+from app.schemas.sync import SyncDeleted, SyncResponse
+
+router = APIRouter()
+
+DEFAULT_PAGE_SIZE = 500
+MAX_PAGE_SIZE = 2000
+
+@router.get("", response_model=SyncResponse)
+async def sync_changes(
+    since: Optional[str] = Query(None, description="token from the previous sync; omit for a full sync"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Maximum changes to apply"),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Rows created, updated or deleted since a sync token
+
+    With nothing new this is a single range scan of ix_sync_changes_user_id_id.
+    Otherwise each changed entity type costs one IN query for its current rows.
+    """
+    since_id = _parse_token(since)
+    changes = (await db.execute(SyncChange.changes_since(current_user.id, since_id, limit + 1))).all()
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+    if not changes:
+        return SyncResponse(token=str(since_id))
+
+    # Only the latest operation per entity matters
+    latest = {}
+    for change in changes:
+        latest[(change.entity_type, change.entity_id)] = change.operation
+
+    changed = {"habit": [], "completion": [], "reminder": [], "category": []}
+    deleted = {"habit": [], "completion": [], "reminder": [], "category": []}
+    for (entity_type, entity_id), operation in latest.items():
+        (deleted if operation == DELETE else changed)[entity_type].append(entity_id)
+
+    now = datetime.utcnow()
+    response = SyncResponse(token=str(changes[-1].id), has_more=has_more)
+
+    if changed["habit"]:
+        habits = (await db.scalars(
+            select(Habit)
+            .where(Habit.id.in_(changed["habit"]), Habit.user_id == current_user.id)
+            .options(selectinload(Habit.category))
+        )).all()
+        await db.run_sync(lambda session: Habit.load_statuses(session, habits, now))
+        response.habits = [HabitResponse.from_habit(habit, now) for habit in habits]
+
+    if changed["completion"]:
+        completions = await db.scalars(
+            select(Completion)
+            .where(Completion.id.in_(changed["completion"]), Completion.user_id == current_user.id)
+        )
+        response.completions = [CompletionResponse.model_validate(completion) for completion in completions]
+
+    if changed["reminder"]:
+        reminders = await db.scalars(
+            select(Reminder)
+            .where(Reminder.id.in_(changed["reminder"]), Reminder.user_id == current_user.id)
+        )
+        response.reminders = [ReminderResponse.model_validate(reminder) for reminder in reminders]
+
+    if changed["category"]:
+        categories = await db.scalars(select(Category).where(Category.id.in_(changed["category"])))
+        response.categories = [CategoryResponse.model_validate(category) for category in categories]
+
+    # An upsert whose row is gone was deleted in a later change
+    found = {
+        "habit": {item.id for item in response.habits},
+        "completion": {item.id for item in response.completions},
+        "reminder": {item.id for item in response.reminders},
+        "category": {item.id for item in response.categories}
+    }
+    for entity_type, entity_ids in changed.items():
+        deleted[entity_type].extend(entity_id for entity_id in entity_ids if entity_id not in found[entity_type])
+
+    response.deleted = SyncDeleted(
+        habits=deleted["habit"],
+        completions=deleted["completion"],
+        reminders=deleted["reminder"],
+        categories=deleted["category"]
+    )
+    return response
+
+def _parse_token(token: Optional[str]) -> int:
+    if not token:
+        return 0
+    if not token.isdigit():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid sync token"
+        )
+    return int(token)
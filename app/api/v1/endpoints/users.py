@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from datetime import datetime
+from typing import Literal
+
+from app.config import settings
+from app.database import SessionLocal
+from app.core.dependencies import AuthenticatedUser, get_current_user
+from app.core.export import iter_export_records, stream_csv, stream_ndjson
+
+router = APIRouter()
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+@router.get("/me/export")
+async def export_history(
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="ndjson or csv"),
+    current_user: AuthenticatedUser = Depends(get_current_user)
+):
+    """Stream the current user's habits, completions and AI interactions
+
+    Rows are read through server-side cursors and written out in chunks,
+    so memory stays flat however long the history is.
+    """
+    user_id = current_user.id
+
+    def generate():
+        db = SessionLocal()
+        try:
+            records = iter_export_records(db, user_id, settings.AI_TEACHER_DB_PATH)
+            yield from (stream_csv(records) if format == "csv" else stream_ndjson(records))
+        finally:
+            db.close()
+
+    filename = f"habit-history-{datetime.utcnow():%Y%m%d}.{format}"
+    return StreamingResponse(
+        generate(),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List, Optional
 import os
 
 class Settings(BaseSettings):
@@ -7,11 +7,36 @@ class Settings(BaseSettings):
     DATABASE_URL: str = "sqlite:///./habit_tracker.db"
     DATABASE_TEST_URL: str = "sqlite:///./habit_tracker_test.db"
     
+    # Connection pool (None = use the per-backend default)
+    DATABASE_POOL_SIZE: Optional[int] = None
+    DATABASE_MAX_OVERFLOW: Optional[int] = None
+    DATABASE_POOL_TIMEOUT: Optional[int] = None
+    DATABASE_POOL_RECYCLE: Optional[int] = None
+    DATABASE_POOL_PRE_PING: Optional[bool] = None
+    
+    # SQLite connect-time profile ("performance" or "default") and its overrides
+    SQLITE_PROFILE: str = "performance"
+    SQLITE_BUSY_TIMEOUT_MS: Optional[int] = None
+    SQLITE_CACHE_SIZE_KB: Optional[int] = None
+    SQLITE_MMAP_SIZE_MB: Optional[int] = None
+    
     # Security
     SECRET_KEY: str = "your-super-secret-key-here-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Password hashing: "bcrypt" or "argon2" (argon2 memory cost in KiB).
+    # Tune with scripts/calibrate_password_hash.py; outdated hashes are
+    # replaced on the user's next successful login.
+    PASSWORD_HASH_SCHEME: str = "bcrypt"
+    BCRYPT_ROUNDS: int = 12
+    ARGON2_TIME_COST: int = 2
+    ARGON2_MEMORY_COST: int = 19456
+    ARGON2_PARALLELISM: int = 1
+    # Threads hashing/verifying passwords (None = min(4, CPU count))
+    PASSWORD_HASH_WORKERS: Optional[int] = None
+    # Decoded claims of recently seen tokens, kept until each token's exp
+    TOKEN_CACHE_SIZE: int = 50000
     
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
@@ -27,6 +52,61 @@ class Settings(BaseSettings):
     APP_VERSION: str = "1.0.0"
     DEBUG: bool = True
     ENVIRONMENT: str = "development"
+    WORKER_PROCESSES: int = 1
+    
+    # Reminder dispatcher (run it in exactly one process per deployment if SQLite)
+    REMINDER_DISPATCHER_ENABLED: bool = False
+    REMINDER_BATCH_SIZE: int = 500
+    REMINDER_POLL_SECONDS: float = 1.0
+    
+    # Response compression (brotli used when installed and accepted)
+    COMPRESSION_MINIMUM_SIZE: int = 500
+    GZIP_LEVEL: int = 6
+    BROTLI_QUALITY: int = 4
+    
+    # AI Teacher database (read by the history export)
+    AI_TEACHER_DB_PATH: str = "ai_teacher.db"
+    
+    # Authenticated user snapshots (per process; the TTL bounds staleness across workers)
+    USER_CACHE_SIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: float = 60.0
+    
+    # Analytics (per-process cache of computed heatmaps)
+    ANALYTICS_CACHE_SIZE: int = 10000
+    
+    # Server-sent change events ("local" for one worker, "redis" to fan out across workers via REDIS_URL)
+    EVENTS_BACKEND: str = "local"
+    EVENTS_QUEUE_SIZE: int = 100
+    EVENTS_KEEPALIVE_SECONDS: float = 15.0
+    # Open event streams never finish on their own, so uvicorn cancels them after this on shutdown
+    GRACEFUL_SHUTDOWN_SECONDS: int = 10
+    
+    # Rate limiting per user (valid bearer token) or client IP; "local" keeps
+    # buckets per worker, "redis" shares them across workers via REDIS_URL
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "local"
+    RATE_LIMIT_PER_MINUTE: int = 60
+    RATE_LIMIT_PER_HOUR: int = 1000
+    # Proxies in front of the app that append to X-Forwarded-For (Railway's
+    # edge is one); anonymous clients are keyed by the address the outermost
+    # of them saw. Set to 0 where clients connect directly, or they can
+    # pick their own key.
+    RATE_LIMIT_TRUSTED_PROXY_HOPS: int = 1
+    # Units of budget per request on expensive paths or route templates (default 1)
+    RATE_LIMIT_ROUTE_COSTS: Dict[str, int] = {
+        "/api/v1/auth/login": 5,
+        "/api/v1/auth/register": 5,
+        "/api/v1/auth/refresh": 2,
+        "/api/v1/completions/import": 10,
+        "/api/v1/users/me/export": 10,
+        "/ai/ask": 5,
+        "/ai/insights": 5,
+        "/ai/coaching-session": 5,
+        "/users/{user_id}/query": 5,
+        "/users/{user_id}/insights": 5,
+        "/users/{user_id}/coaching/session": 5,
+        "/users/{user_id}/reminders/generate": 2
+    }
     
     # CORS
     ALLOWED_ORIGINS: List[str] = [
@@ -0,0 +1,129 @@
+import calendar
+from datetime import date
+from typing import Callable, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.cache import TTLCache
+from app.models.rollup import GRANULARITIES, CompletionRollup
+from app.models.sync_change import SyncChange
+
+# (user_id, kind, *args) -> (change token, result)
+analytics_cache = TTLCache(maxsize=settings.ANALYTICS_CACHE_SIZE)
+
+def get_heatmap(db: Session, user_id: str, year: int, habit_id: Optional[str] = None) -> dict:
+    """Cached compute_heatmap; see _cached for when it is invalidated"""
+    return _cached(db, user_id, ("heatmap", year, habit_id), lambda: compute_heatmap(db, user_id, year, habit_id))
+
+def get_trends(
+    db: Session,
+    user_id: str,
+    granularity: str,
+    habit_id: Optional[str] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None
+) -> list:
+    """Cached compute_trends; see _cached for when it is invalidated"""
+    return _cached(
+        db, user_id, ("trends", granularity, habit_id, start, end),
+        lambda: compute_trends(db, user_id, granularity, habit_id, start, end)
+    )
+
+def compute_heatmap(db: Session, user_id: str, year: int, habit_id: Optional[str] = None) -> dict:
+    """Per-day completion counts for one year from the daily rollups
+
+    Days are UTC calendar days; counts[i] is day i of the year (0 = Jan 1).
+    """
+    start = date(year, 1, 1)
+    query = (
+        select(CompletionRollup.period_start, func.sum(CompletionRollup.count).label("count"))
+        .where(
+            CompletionRollup.user_id == user_id,
+            CompletionRollup.granularity == "day",
+            CompletionRollup.period_start >= start,
+            CompletionRollup.period_start <= date(year, 12, 31)
+        )
+        .group_by(CompletionRollup.period_start)
+    )
+    if habit_id is not None:
+        query = query.where(CompletionRollup.habit_id == habit_id)
+
+    counts = [0] * (366 if calendar.isleap(year) else 365)
+    for row in db.execute(query):
+        counts[(row.period_start - start).days] = row.count
+
+    return {
+        "year": year,
+        "habit_id": habit_id,
+        "start_date": start,
+        "counts": counts,
+        "total": sum(counts),
+        "max_count": max(counts)
+    }
+
+def compute_trends(
+    db: Session,
+    user_id: str,
+    granularity: str,
+    habit_id: Optional[str] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None
+) -> list:
+    """Completion count and average ratings per day/week/month from the rollups
+
+    A monthly chart over several years reads a few dozen rollup rows per
+    habit rather than every completion.
+    """
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"Granularity must be one of {', '.join(GRANULARITIES)}")
+
+    query = (
+        select(
+            CompletionRollup.period_start,
+            func.sum(CompletionRollup.count).label("count"),
+            func.sum(CompletionRollup.mood_sum).label("mood_sum"),
+            func.sum(CompletionRollup.mood_count).label("mood_count"),
+            func.sum(CompletionRollup.difficulty_sum).label("difficulty_sum"),
+            func.sum(CompletionRollup.difficulty_count).label("difficulty_count")
+        )
+        .where(CompletionRollup.user_id == user_id, CompletionRollup.granularity == granularity)
+        .group_by(CompletionRollup.period_start)
+        .order_by(CompletionRollup.period_start)
+    )
+    if habit_id is not None:
+        query = query.where(CompletionRollup.habit_id == habit_id)
+    if start is not None:
+        query = query.where(CompletionRollup.period_start >= start)
+    if end is not None:
+        query = query.where(CompletionRollup.period_start <= end)
+
+    return [
+        {
+            "period_start": row.period_start,
+            "count": row.count,
+            "mood_avg": row.mood_sum / row.mood_count if row.mood_count else None,
+            "difficulty_avg": row.difficulty_sum / row.difficulty_count if row.difficulty_count else None
+        }
+        for row in db.execute(query)
+        if row.count
+    ]
+
+def _cached(db: Session, user_id: str, key: tuple, compute: Callable):
+    """Reuse a result while the user's latest sync change id is unchanged
+
+    Every completion writes to the change log, so results are recomputed
+    after the user's next completion (or other edit). Checking the id is
+    one index lookup and keeps the cache correct when several worker
+    processes each hold their own copy.
+    """
+    token = db.scalar(select(func.max(SyncChange.id)).where(SyncChange.user_id == user_id))
+    cache_key = (user_id,) + key
+    cached = analytics_cache.get(cache_key)
+    if cached is not None and cached[0] == token:
+        return cached[1]
+
+    result = compute()
+    analytics_cache.set(cache_key, (token, result))
+    return result
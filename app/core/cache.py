@@ -0,0 +1,110 @@
+import heapq
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+_MISSING = object()
+
+class TTLCache:
+    """Thread-safe in-process LRU cache with optional per-entry expiry
+
+    Holds at most maxsize entries, evicting the least recently used. With
+    ttl set, entries older than ttl seconds are treated as missing; set()
+    may override it per entry.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING:
+                expires_at, value = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, _MISSING)
+        return default if entry is _MISSING else entry[1]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None
+        }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+class ExpiringDict:
+    """Thread-safe in-process mapping whose entries last exactly until they expire
+
+    Unlike TTLCache there is no size bound and nothing is evicted early, for
+    state that must not be forgotten before its expiry (token revocations).
+    Expired entries are dropped as later ones are set.
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data = {}
+        self._expiries = []  # heap of (expires_at, key)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        ttl = self.ttl if ttl is None else ttl
+        now = time.monotonic()
+        expires_at = now + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            if expires_at is not None:
+                heapq.heappush(self._expiries, (expires_at, key))
+            while self._expiries and self._expiries[0][0] <= now:
+                expired_at, expired_key = heapq.heappop(self._expiries)
+                # Skip heap entries for keys that were set again since
+                entry = self._data.get(expired_key)
+                if entry is not None and entry[0] == expired_at:
+                    del self._data[expired_key]
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,109 @@
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import get_async_db
+from app.core.cache import TTLCache
+from app.core.security import verify_token
+from app.models.user import User
+
+# Security scheme
+security = HTTPBearer()
+
+class AuthenticatedUser:
+    """Slim snapshot of the authenticated user, as cached by get_current_user
+
+    Endpoints that need other user columns load the row themselves.
+    """
+    __slots__ = ("id", "is_active", "is_verified")
+
+    def __init__(self, id: str, is_active: bool, is_verified: bool):
+        self.id = id
+        self.is_active = is_active
+        self.is_verified = is_verified
+
+    def __repr__(self):
+        return f"<AuthenticatedUser(id={self.id})>"
+
+# user_id -> AuthenticatedUser. Changes committed through this process evict
+# the entry at once; the TTL bounds how long other workers may serve it.
+user_cache = TTLCache(maxsize=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS)
+
+# session.info key for users changed in the open transaction
+_CHANGED_USERS_KEY = "changed_user_ids"
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db)
+) -> AuthenticatedUser:
+    """Get current authenticated user"""
+    token = credentials.credentials
+    
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    # Verify token
+    payload = verify_token(token)
+    if not payload:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    user_id = payload.get("sub")
+    if not user_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token payload",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    user = user_cache.get(user_id)
+    if user is None:
+        # Get user from database
+        result = await db.execute(
+            select(User.id, User.is_active, User.is_verified).where(User.id == user_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        user = AuthenticatedUser(row.id, bool(row.is_active), bool(row.is_verified))
+        user_cache.set(user_id, user)
+    
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Inactive user"
+        )
+    
+    return user
+
+@event.listens_for(Session, "after_flush")
+def _remember_changed_users(session: Session, flush_context):
+    changed = [obj.id for obj in list(session.dirty) + list(session.deleted) if isinstance(obj, User)]
+    if changed:
+        session.info.setdefault(_CHANGED_USERS_KEY, set()).update(changed)
+
+@event.listens_for(Session, "after_commit")
+def _evict_changed_users(session: Session):
+    # Evict on commit, not flush, so requests reading after the commit re-cache
+    # the new row. One that read the old row before the commit may still cache
+    # it afterwards; the TTL bounds how long that entry is served.
+    for user_id in session.info.pop(_CHANGED_USERS_KEY, ()):
+        user_cache.pop(user_id)
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changed_users(session: Session):
+    session.info.pop(_CHANGED_USERS_KEY, None)
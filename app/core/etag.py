@@ -0,0 +1,67 @@
+from datetime import datetime
+import hashlib
+from typing import Callable, Optional
+
+from fastapi import Depends, Request, Response, status
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_async_db
+from app.core.dependencies import AuthenticatedUser, get_current_user
+from app.models.sync_change import SyncChange
+
+class CollectionETag:
+    """ETag for a per-user collection, checked against If-None-Match"""
+
+    def __init__(self, etag: str, if_none_match: Optional[str]):
+        self.etag = etag
+        self.if_none_match = if_none_match
+
+    @property
+    def not_modified(self) -> bool:
+        if not self.if_none_match:
+            return False
+        candidates = [candidate.strip() for candidate in self.if_none_match.split(",")]
+        # Weak comparison (RFC 9110 13.1.2): compression changes the bytes, not the content
+        return "*" in candidates or _opaque(self.etag) in {_opaque(candidate) for candidate in candidates}
+
+    def not_modified_response(self) -> Response:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": self.etag})
+
+    def apply(self, response: Response):
+        response.headers["ETag"] = self.etag
+
+def collection_etag(daily: bool = False, extra: Optional[Callable] = None):
+    """Dependency computing a collection ETag from the sync change log
+
+    The version is the user's latest change id plus the latest shared
+    (category) change id, read with one indexed query before any rows are
+    loaded. daily=True adds the UTC date for collections with per-day
+    fields (today_count, streaks). extra(user_id) may return another scalar
+    subquery for state written outside the change log.
+
+    Endpoints return etag.not_modified_response() when etag.not_modified,
+    and otherwise call etag.apply(response).
+    """
+    async def dependency(
+        request: Request,
+        current_user: AuthenticatedUser = Depends(get_current_user),
+        db: AsyncSession = Depends(get_async_db)
+    ) -> CollectionETag:
+        columns = [
+            select(func.max(SyncChange.id)).where(SyncChange.user_id == current_user.id).scalar_subquery(),
+            select(func.max(SyncChange.id)).where(SyncChange.user_id.is_(None)).scalar_subquery()
+        ]
+        if extra is not None:
+            columns.append(extra(current_user.id))
+        version = [str(value) for value in (await db.execute(select(*columns))).one()]
+        if daily:
+            version.append(datetime.utcnow().strftime("%Y%m%d"))
+        digest = hashlib.blake2b("|".join(version).encode(), digest_size=12).hexdigest()
+        etag = f'W/"{digest}"'
+        return CollectionETag(etag, request.headers.get("if-none-match"))
+
+    return dependency
+
+def _opaque(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
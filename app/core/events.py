@@ -0,0 +1,225 @@
+import asyncio
+import logging
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.responses import render_json
+from app.models.sync_change import PENDING_CHANGES_KEY, TRUNCATED_CHANGES_KEY
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+# Sent to a subscriber whose queue overflowed; the client should call GET /sync
+RESYNC_FRAME = b"event: resync\ndata: {}\n\n"
+
+class EventBackend:
+    """Carries published frames to the hubs that have subscribers
+
+    The default delivers within this process. Subclass to fan out across
+    workers; start() receives the hub's deliver(user_id, frame) callback.
+    """
+
+    async def start(self, deliver: Callable):
+        self.deliver = deliver
+
+    async def stop(self):
+        pass
+
+    async def publish(self, user_id: Optional[str], frame: bytes):
+        self.deliver(user_id, frame)
+
+class RedisEventBackend(EventBackend):
+    """Fan-out through one pub/sub channel on any Redis-protocol server
+
+    Every worker subscribes to the channel and delivers to its own
+    connections, so a change committed in one worker reaches the user's
+    clients connected to any other. A lost subscription is retried with
+    exponential backoff; once it is back every local stream is sent a
+    resync frame, since frames published meanwhile were missed.
+    """
+
+    RECONNECT_MIN_SECONDS = 0.5
+    RECONNECT_MAX_SECONDS = 30.0
+
+    def __init__(self, url: str, channel: str = "habit-events"):
+        if aioredis is None:
+            raise RuntimeError("EVENTS_BACKEND=redis requires the redis package")
+        self.url = url
+        self.channel = channel
+        self._client = None
+        self._reader = None
+
+    async def start(self, deliver: Callable):
+        await super().start(deliver)
+        self._client = aioredis.from_url(self.url)
+        pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self.channel)
+        self._reader = asyncio.create_task(self._read(pubsub))
+
+    async def stop(self):
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def publish(self, user_id: Optional[str], frame: bytes):
+        # "<user_id>\n<frame>"; an empty user_id is a change shared by all users
+        await self._client.publish(self.channel, (user_id or "").encode() + b"\n" + frame)
+
+    async def _read(self, pubsub):
+        delay = self.RECONNECT_MIN_SECONDS
+        while True:
+            try:
+                if pubsub is None:
+                    pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+                    await pubsub.subscribe(self.channel)
+                    logger.info(f"Resubscribed to event channel {self.channel}")
+                    self.deliver(None, RESYNC_FRAME)
+                    delay = self.RECONNECT_MIN_SECONDS
+                async for message in pubsub.listen():
+                    user_id, _, frame = message["data"].partition(b"\n")
+                    self.deliver(user_id.decode() or None, frame)
+                error = "subscription ended"
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                error = exc
+            finally:
+                if pubsub is not None:
+                    await pubsub.aclose()
+                    pubsub = None
+            logger.warning(f"Event channel {self.channel} lost ({error}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.RECONNECT_MAX_SECONDS)
+
+class EventHub:
+    """Pushes committed changes to each user's connected event streams
+
+    Every subscriber owns a bounded queue of ready-made SSE frames. A commit
+    publishes one frame per affected user (changes shared by all users, such
+    as categories, go to everyone); a subscriber that falls queue_size frames
+    behind is sent a single resync frame instead.
+
+    publish() may be called from any thread; it is a no-op until start().
+    """
+
+    def __init__(self, backend: Optional[EventBackend] = None, queue_size: int = 100):
+        self.backend = backend or EventBackend()
+        self.queue_size = queue_size
+        self._subscribers = defaultdict(set)
+        self._loop = None
+        self._tasks = set()
+        self.published = 0
+        self.overflows = 0
+
+    @property
+    def connections(self) -> int:
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    async def start(self):
+        self._loop = asyncio.get_running_loop()
+        await self.backend.start(self._deliver)
+
+    async def stop(self):
+        self._loop = None
+        await self.backend.stop()
+        # End every open stream
+        for queues in self._subscribers.values():
+            for queue in queues:
+                _replace_contents(queue, None)
+
+    @asynccontextmanager
+    async def subscribe(self, user_id: str):
+        queue = asyncio.Queue(self.queue_size)
+        self._subscribers[user_id].add(queue)
+        try:
+            yield queue
+        finally:
+            queues = self._subscribers.get(user_id)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._subscribers[user_id]
+
+    def publish_changes(self, pending: dict, truncated: set = frozenset()):
+        """Publish {user_id: [(entity_type, entity_id, operation), ...]} as one frame per user"""
+        if self._loop is None:
+            return
+        for user_id, changes in pending.items():
+            payload = {
+                "changes": [
+                    {"entity_type": entity_type, "id": entity_id, "operation": operation}
+                    for entity_type, entity_id, operation in changes
+                ],
+                "truncated": user_id in truncated
+            }
+            self.publish(user_id, b"event: change\ndata: " + render_json(payload) + b"\n\n")
+
+    def publish(self, user_id: Optional[str], frame: bytes):
+        loop = self._loop
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(self._schedule, user_id, frame)
+
+    def _schedule(self, user_id: Optional[str], frame: bytes):
+        task = asyncio.ensure_future(self.backend.publish(user_id, frame))
+        self._tasks.add(task)
+        task.add_done_callback(self._published)
+
+    def _published(self, task: asyncio.Task):
+        self._tasks.discard(task)
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            logger.error(f"Event publish failed: {task.exception()}")
+        else:
+            self.published += 1
+
+    def _deliver(self, user_id: Optional[str], frame: bytes):
+        if user_id is None:
+            targets = [queue for queues in self._subscribers.values() for queue in queues]
+        else:
+            targets = self._subscribers.get(user_id, ())
+        for queue in targets:
+            try:
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                self.overflows += 1
+                _replace_contents(queue, RESYNC_FRAME)
+
+def _replace_contents(queue: asyncio.Queue, item):
+    while not queue.empty():
+        queue.get_nowait()
+    queue.put_nowait(item)
+
+def create_event_backend() -> EventBackend:
+    if settings.EVENTS_BACKEND == "redis":
+        return RedisEventBackend(settings.REDIS_URL)
+    if settings.EVENTS_BACKEND != "local":
+        raise ValueError(f"Unknown EVENTS_BACKEND {settings.EVENTS_BACKEND!r}")
+    return EventBackend()
+
+event_hub = EventHub(create_event_backend(), queue_size=settings.EVENTS_QUEUE_SIZE)
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed_changes(session: Session):
+    pending = session.info.pop(PENDING_CHANGES_KEY, None)
+    truncated = session.info.pop(TRUNCATED_CHANGES_KEY, set())
+    if pending:
+        event_hub.publish_changes(pending, truncated)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_changes(session: Session):
+    session.info.pop(PENDING_CHANGES_KEY, None)
+    session.info.pop(TRUNCATED_CHANGES_KEY, None)
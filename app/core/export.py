@@ -0,0 +1,123 @@
+import csv
+import io
+import os
+import sqlite3
+from typing import Callable, Iterator, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.interactions import interaction_user_key
+from app.core.responses import render_json
+from app.models.completion import Completion
+from app.models.habit import Habit
+
+# Union of the fields of every record type, in CSV column order
+EXPORT_FIELDS = (
+    "record_type", "id", "habit_id", "title", "description", "frequency_type", "frequency_value",
+    "target_count", "is_active", "completed_at", "notes", "mood_rating", "difficulty_rating",
+    "query", "response", "intent", "sentiment", "created_at"
+)
+
+def iter_export_records(
+    db: Session,
+    user_id: str,
+    interactions_db_path: Optional[str] = None,
+    batch_size: int = 1000
+) -> Iterator[dict]:
+    """Yield a user's habits, completions and AI interactions one record at a time
+
+    Every source is read through a server-side cursor (yield_per for the
+    app database, a lazily stepped sqlite3 cursor for the AI Teacher
+    database), so memory use does not grow with the user's history.
+    """
+    habits = db.execute(
+        select(
+            Habit.id, Habit.title, Habit.description, Habit.frequency_type, Habit.frequency_value,
+            Habit.target_count, Habit.is_active, Habit.created_at
+        )
+        .where(Habit.user_id == user_id)
+        .order_by(Habit.created_at)
+        .execution_options(yield_per=batch_size)
+    )
+    for row in habits:
+        yield {"record_type": "habit", **row._asdict()}
+
+    completions = db.execute(
+        select(
+            Completion.id, Completion.habit_id, Completion.completed_at, Completion.notes,
+            Completion.mood_rating, Completion.difficulty_rating, Completion.created_at
+        )
+        .where(Completion.user_id == user_id)
+        .order_by(Completion.completed_at)
+        .execution_options(yield_per=batch_size)
+    )
+    for row in completions:
+        yield {"record_type": "completion", **row._asdict()}
+
+    if interactions_db_path and os.path.exists(interactions_db_path):
+        yield from _iter_interactions(interactions_db_path, user_id, batch_size)
+
+def _iter_interactions(path: str, user_id: str, batch_size: int) -> Iterator[dict]:
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        cursor = conn.execute(
+            "SELECT id, query, response, intent, sentiment, timestamp FROM interactions "
+            "WHERE user_id = ? ORDER BY id",
+            (interaction_user_key(user_id),)
+        )
+        cursor.arraysize = batch_size
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                return
+            for interaction_id, query, response, intent, sentiment, timestamp in rows:
+                yield {
+                    "record_type": "interaction", "id": interaction_id, "query": query,
+                    "response": response, "intent": intent, "sentiment": sentiment,
+                    "created_at": timestamp
+                }
+    finally:
+        conn.close()
+
+def stream_ndjson(records: Iterator[dict], chunk_rows: int = 500) -> Iterator[bytes]:
+    """One JSON object per line, yielded chunk_rows lines at a time"""
+    return _chunked(records, lambda record: render_json(record) + b"\n", chunk_rows)
+
+def stream_csv(records: Iterator[dict], chunk_rows: int = 500) -> Iterator[bytes]:
+    """CSV with an EXPORT_FIELDS header, yielded chunk_rows rows at a time"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS, extrasaction="ignore")
+
+    def encode(record: Optional[dict]) -> bytes:
+        if record is None:
+            writer.writeheader()
+        else:
+            writer.writerow({key: _csv_value(value) for key, value in record.items()})
+        data = buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+
+    return _chunked(_with_header(records), encode, chunk_rows)
+
+def _with_header(records: Iterator[dict]) -> Iterator[Optional[dict]]:
+    yield None
+    yield from records
+
+def _csv_value(value):
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if hasattr(value, "value"):  # enums
+        return value.value
+    return value
+
+def _chunked(records: Iterator, encode: Callable, chunk_rows: int) -> Iterator[bytes]:
+    chunk = []
+    for record in records:
+        chunk.append(encode(record))
+        if len(chunk) >= chunk_rows:
+            yield b"".join(chunk)
+            chunk = []
+    if chunk:
+        yield b"".join(chunk)
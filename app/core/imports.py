@@ -0,0 +1,151 @@
+import csv
+import io
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Iterator, Optional, TextIO
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.core.streaks import recompute_habit_streak
+from app.models.completion import Completion
+from app.models.habit import Habit
+from app.models.rollup import CompletionRollup
+from app.models.sync_change import UPSERT, SyncChange
+
+IMPORT_COLUMNS = ("id", "user_id", "habit_id", "completed_at", "notes", "mood_rating", "difficulty_rating")
+
+# Errors reported back to the client; the rest are only counted
+MAX_REPORTED_ERRORS = 20
+
+def import_completions_csv(db: Session, user_id: str, stream: TextIO, chunk_size: int = 5000) -> dict:
+    """Load completions from a CSV stream, chunk by chunk, in one transaction
+
+    Expected columns: habit_id, completed_at (ISO 8601) and optionally
+    notes, mood_rating, difficulty_rating. Each chunk's habit IDs are
+    checked against the user's habits with one IN query (IDs already seen
+    are not queried again), then the chunk is loaded with COPY on
+    PostgreSQL or one executemany elsewhere. Streaks and counters of the
+    touched habits are rebuilt once at the end. Invalid rows are skipped
+    and reported. The caller commits.
+    """
+    start = time.perf_counter()
+    owned = set()
+    rejected = set()
+    imported = 0
+    skipped = 0
+    errors = []
+
+    for chunk in _chunks(csv.DictReader(stream), chunk_size):
+        unknown = {row.get("habit_id") for _, row in chunk} - owned - rejected - {None, ""}
+        if unknown:
+            found = set(db.scalars(select(Habit.id).where(Habit.id.in_(unknown), Habit.user_id == user_id)))
+            owned |= found
+            rejected |= unknown - found
+
+        rows = []
+        for line, row in chunk:
+            try:
+                rows.append(_parse_row(row, user_id, owned))
+            except ValueError as error:
+                skipped += 1
+                if len(errors) < MAX_REPORTED_ERRORS:
+                    errors.append(f"line {line}: {error}")
+
+        _load_rows(db, rows)
+        imported += len(rows)
+
+    if owned:
+        for habit in db.scalars(select(Habit).where(Habit.id.in_(owned))).all():
+            recompute_habit_streak(db, habit)
+        db.flush()
+
+    elapsed = time.perf_counter() - start
+    return {
+        "imported": imported,
+        "skipped": skipped,
+        "errors": errors,
+        "habits_updated": len(owned),
+        "elapsed_seconds": round(elapsed, 3),
+        "rows_per_second": round(imported / elapsed) if elapsed > 0 else imported
+    }
+
+def utc_naive(value: Optional[datetime]) -> Optional[datetime]:
+    """Store client timestamps as naive UTC, like datetime.utcnow() elsewhere"""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+def _chunks(reader: csv.DictReader, chunk_size: int) -> Iterator[list]:
+    chunk = []
+    for row in reader:
+        # line_num is the physical line just read, so the header is line 1
+        chunk.append((reader.line_num, row))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _parse_row(row: dict, user_id: str, owned: set) -> dict:
+    habit_id = (row.get("habit_id") or "").strip()
+    if habit_id not in owned:
+        raise ValueError(f"unknown habit_id {habit_id!r}")
+
+    completed_at = (row.get("completed_at") or "").strip()
+    if not completed_at:
+        raise ValueError("completed_at is required")
+    try:
+        completed_at = utc_naive(datetime.fromisoformat(completed_at))
+    except ValueError:
+        raise ValueError(f"invalid completed_at {completed_at!r}")
+
+    return {
+        "id": str(uuid.uuid4()),
+        "user_id": user_id,
+        "habit_id": habit_id,
+        "completed_at": completed_at,
+        "notes": (row.get("notes") or "").strip() or None,
+        "mood_rating": _parse_rating(row, "mood_rating"),
+        "difficulty_rating": _parse_rating(row, "difficulty_rating")
+    }
+
+def _parse_rating(row: dict, field: str) -> Optional[int]:
+    value = (row.get(field) or "").strip()
+    if not value:
+        return None
+    if not value.isdigit() or not 1 <= int(value) <= 10:
+        raise ValueError(f"{field} must be 1-10, got {value!r}")
+    return int(value)
+
+def _load_rows(db: Session, rows: list):
+    if not rows:
+        return
+    connection = db.connection()
+    if connection.dialect.name == "postgresql" and connection.dialect.driver == "psycopg2":
+        _copy_rows(connection, rows)
+    else:
+        connection.execute(insert(Completion.__table__), rows)
+
+    SyncChange.record(db, [(row["user_id"], "completion", row["id"], UPSERT) for row in rows])
+    CompletionRollup.apply(db, [
+        (row["habit_id"], row["user_id"], row["completed_at"], row["mood_rating"], row["difficulty_rating"], 1)
+        for row in rows
+    ])
+
+def _copy_rows(connection, rows: list):
+    """COPY a chunk into completions inside the session's transaction"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([
+            "" if row[column] is None else row[column].isoformat() if column == "completed_at" else row[column]
+            for column in IMPORT_COLUMNS
+        ])
+    buffer.seek(0)
+    cursor = connection.connection.driver_connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY completions ({', '.join(IMPORT_COLUMNS)}) FROM STDIN WITH (FORMAT csv)", buffer)
+    finally:
+        cursor.close()
@@ -0,0 +1,14 @@
+import hashlib
+
+# Shared by the app's data export and the standalone AI Teacher API, so this
+# module has no app dependencies.
+
+def interaction_user_key(user_id: str) -> int:
+    """Integer key the AI Teacher stores a user's interactions under
+
+    Numeric ids are used as they are; others (the app's UUIDs) map to a
+    56-bit blake2b digest, which is the same in every process, unlike hash().
+    """
+    if user_id.isdigit():
+        return int(user_id)
+    return int.from_bytes(hashlib.blake2b(user_id.encode(), digest_size=7).digest(), "big")
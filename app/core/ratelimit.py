@@ -0,0 +1,246 @@
+import logging
+import math
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from starlette.routing import compile_path
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import settings
+from app.core.security import get_user_id_from_token
+
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import NoScriptError
+except ImportError:
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+# Paths never limited (prefix match)
+EXEMPT_PREFIXES = ("/health", "/docs", "/redoc", "/openapi.json")
+
+# (period seconds, seconds of budget one unit of cost uses)
+Limit = Tuple[float, float]
+
+def make_limits(per_minute: int, per_hour: int) -> List[Limit]:
+    return [(60.0, 60.0 / per_minute), (3600.0, 3600.0 / per_hour)]
+
+class LocalRateLimitBackend:
+    """GCRA (token bucket) state for this process, one timestamp per key and limit
+
+    A key's theoretical arrival time (TAT) advances by cost * interval per
+    request; a request is refused if that would put it more than a period
+    ahead of now. Only touched from the event loop, so no lock. Keys whose
+    buckets are full again are pruned once max_keys is exceeded.
+    """
+
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max_keys
+        self._tats = {}
+
+    async def hit(self, key: str, cost: int, limits: List[Limit]) -> float:
+        """Seconds until the request would be allowed, or 0 if it was (and is counted)"""
+        now = time.monotonic()
+        tats = self._tats.get(key)
+        new_tats = []
+        retry_after = 0.0
+        for index, (period, interval) in enumerate(limits):
+            tat = tats[index] if tats is not None and tats[index] > now else now
+            new_tat = tat + cost * interval
+            retry_after = max(retry_after, new_tat - now - period)
+            new_tats.append(new_tat)
+        if retry_after > 0:
+            return retry_after
+
+        self._tats[key] = new_tats
+        if len(self._tats) > self.max_keys:
+            self._prune(now)
+        return 0.0
+
+    async def close(self):
+        pass
+
+    def _prune(self, now: float):
+        self._tats = {key: tats for key, tats in self._tats.items() if max(tats) > now}
+        # Still full of active keys: forget the oldest rather than grow
+        while len(self._tats) > self.max_keys:
+            del self._tats[next(iter(self._tats))]
+
+# GCRA over every limit at once, on the server clock, so all workers share
+# one bucket per key. KEYS: one per limit. ARGV: cost, then period and
+# interval (ms) per limit. Returns ms until allowed, 0 if counted.
+_GCRA_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local cost = tonumber(ARGV[1])
+local new_tats = {}
+local retry_after = 0
+for i, key in ipairs(KEYS) do
+    local period = tonumber(ARGV[2 * i])
+    local interval = tonumber(ARGV[2 * i + 1])
+    local tat = tonumber(redis.call('GET', key) or now)
+    if tat < now then
+        tat = now
+    end
+    new_tats[i] = tat + cost * interval
+    retry_after = math.max(retry_after, new_tats[i] - now - period)
+end
+if retry_after > 0 then
+    -- Integer reply: round up so a refusal never reads as 0
+    return math.ceil(retry_after)
+end
+for i, key in ipairs(KEYS) do
+    redis.call('SET', key, new_tats[i], 'PX', math.max(1, math.ceil(new_tats[i] - now)))
+end
+return 0
+"""
+
+class RedisRateLimitBackend:
+    """The same GCRA buckets in any Redis-protocol server, shared by all workers"""
+
+    def __init__(self, url: str):
+        if aioredis is None:
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis requires the redis package")
+        self._client = aioredis.from_url(url)
+        self._sha = None
+
+    async def hit(self, key: str, cost: int, limits: List[Limit]) -> float:
+        # The hash tag keeps a key's buckets in one cluster slot
+        keys = [f"ratelimit:{{{key}}}:{int(period)}" for period, _ in limits]
+        args = [cost]
+        for period, interval in limits:
+            args.extend((period * 1000, interval * 1000))
+        if self._sha is not None:
+            try:
+                return int(await self._client.evalsha(self._sha, len(keys), *keys, *args)) / 1000
+            except NoScriptError:
+                pass  # Server restarted or flushed its script cache
+        self._sha = await self._client.script_load(_GCRA_SCRIPT)
+        return int(await self._client.evalsha(self._sha, len(keys), *keys, *args)) / 1000
+
+    async def close(self):
+        await self._client.aclose()
+
+class RateLimiter:
+    """Per-key limits over several windows; fails open if the backend errors"""
+
+    def __init__(self, backend, limits: List[Limit]):
+        self.backend = backend
+        self.limits = limits
+        self.allowed = 0
+        self.limited = 0
+        self.errors = 0
+
+    async def hit(self, key: str, cost: int = 1) -> float:
+        try:
+            retry_after = await self.backend.hit(key, cost, self.limits)
+        except Exception as error:
+            self.errors += 1
+            logger.warning(f"Rate limit backend failed, allowing request: {error}")
+            return 0.0
+        if retry_after > 0:
+            self.limited += 1
+        else:
+            self.allowed += 1
+        return retry_after
+
+    def snapshot(self) -> dict:
+        return {"allowed": self.allowed, "limited": self.limited, "errors": self.errors}
+
+def create_rate_limiter() -> RateLimiter:
+    limits = make_limits(settings.RATE_LIMIT_PER_MINUTE, settings.RATE_LIMIT_PER_HOUR)
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        return RateLimiter(RedisRateLimitBackend(settings.REDIS_URL), limits)
+    if settings.RATE_LIMIT_BACKEND != "local":
+        raise ValueError(f"Unknown RATE_LIMIT_BACKEND {settings.RATE_LIMIT_BACKEND!r}")
+    return RateLimiter(LocalRateLimitBackend(), limits)
+
+class RateLimitMiddleware:
+    """Refuses requests over the limiter's budget with 429 and Retry-After
+
+    Requests with a valid bearer token are counted per user, others per
+    client IP. Behind trusted_proxy_hops proxies the IP is that many entries
+    from the end of X-Forwarded-For, the ones those proxies appended; any
+    earlier entries come from the client and are ignored. Each path
+    in costs uses that many units of budget instead of one, so expensive
+    endpoints run out sooner; paths may be route templates such as
+    "/users/{user_id}/query". CORS preflights and EXEMPT_PREFIXES are free.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: RateLimiter,
+        costs: Optional[Dict[str, int]] = None,
+        exempt_prefixes: Iterable[str] = EXEMPT_PREFIXES,
+        trusted_proxy_hops: int = 0
+    ):
+        self.app = app
+        self.limiter = limiter
+        # Exact paths are one dict lookup; templates are matched only on a miss
+        self.costs = {}
+        self.template_costs = []
+        for path, cost in (costs or {}).items():
+            if "{" in path:
+                self.template_costs.append((compile_path(path)[0], cost))
+            else:
+                self.costs[path] = cost
+        self.exempt_prefixes = tuple(exempt_prefixes)
+        self.trusted_proxy_hops = trusted_proxy_hops
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] == "OPTIONS"
+            or scope["path"].startswith(self.exempt_prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        key = _client_key(scope, self.trusted_proxy_hops)
+        retry_after = await self.limiter.hit(key, self._cost(scope["path"]))
+        if retry_after > 0:
+            await _send_too_many_requests(send, retry_after)
+            return
+        await self.app(scope, receive, send)
+
+    def _cost(self, path: str) -> int:
+        cost = self.costs.get(path)
+        if cost is not None:
+            return cost
+        for pattern, cost in self.template_costs:
+            if pattern.match(path):
+                return cost
+        return 1
+
+def _client_key(scope: Scope, trusted_proxy_hops: int) -> str:
+    forwarded = []
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer":
+                # Served from the token cache; invalid tokens fall back to the IP
+                user_id = get_user_id_from_token(token.strip())
+                if user_id:
+                    return f"user:{user_id}"
+        elif name == b"x-forwarded-for" and trusted_proxy_hops:
+            forwarded.extend(value.decode("latin-1").split(","))
+    if trusted_proxy_hops and len(forwarded) >= trusted_proxy_hops:
+        return f"ip:{forwarded[-trusted_proxy_hops].strip()}"
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+_TOO_MANY_REQUESTS_BODY = b'{"detail":"Rate limit exceeded"}'
+
+async def _send_too_many_requests(send: Send, retry_after: float):
+    await send({
+        "type": "http.response.start",
+        "status": 429,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(_TOO_MANY_REQUESTS_BODY)).encode()),
+            (b"retry-after", str(math.ceil(retry_after)).encode())
+        ]
+    })
+    await send({"type": "http.response.body", "body": _TOO_MANY_REQUESTS_BODY})
@@ -0,0 +1,297 @@
+import logging
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.orm import Session
+
+from app.models.reminder import Reminder
+
+logger = logging.getLogger(__name__)
+
+# Columns handed to senders for each due reminder
+DISPATCH_COLUMNS = (
+    Reminder.id,
+    Reminder.user_id,
+    Reminder.habit_id,
+    Reminder.title,
+    Reminder.message,
+    Reminder.reminder_time,
+    Reminder.days_mask,
+    Reminder.is_recurring,
+    Reminder.next_send
+)
+
+class ReminderSender(ABC):
+    """Delivers a batch of due reminders; subclass to push, email, etc.
+
+    send() receives rows with the DISPATCH_COLUMNS fields. Raising leaves the
+    whole batch due so it is retried on a later poll.
+    """
+
+    @abstractmethod
+    def send(self, reminders: list):
+        pass
+
+class LoggingReminderSender(ReminderSender):
+    """Default sender that only logs each reminder"""
+
+    def send(self, reminders: list):
+        for reminder in reminders:
+            logger.info(f"Reminder {reminder.id} for user {reminder.user_id}: {reminder.title}")
+
+class DispatchStats:
+    """Dispatch counters plus a rolling window of lag samples (now - next_send)"""
+
+    def __init__(self, window: int = 10000):
+        self._lock = threading.Lock()
+        self._lags = deque(maxlen=window)
+        self.dispatched = 0
+        self.batches = 0
+        self.failures = 0
+
+    def record_batch(self, lags: List[float]):
+        with self._lock:
+            self._lags.extend(lags)
+            self.dispatched += len(lags)
+            self.batches += 1
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            lags = sorted(self._lags)
+            stats = {
+                "dispatched": self.dispatched,
+                "batches": self.batches,
+                "failures": self.failures,
+                "lag_samples": len(lags)
+            }
+        for label, fraction in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99)):
+            stats[f"lag_{label}_seconds"] = _percentile(lags, fraction)
+        stats["lag_max_seconds"] = lags[-1] if lags else 0.0
+        return stats
+
+class ReminderDispatcher:
+    """Claims due reminders in batches, sends them and schedules the next send
+
+    Due reminders are found through the (is_active, next_send) index. On
+    PostgreSQL a batch is claimed with FOR UPDATE SKIP LOCKED inside the
+    dispatch transaction; elsewhere (SQLite, MySQL) a short lease is written
+    to lease_owner/lease_until so concurrent dispatchers never claim the same
+    rows, and an expired lease makes a crashed batch due again.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        sender: Optional[ReminderSender] = None,
+        batch_size: int = 500,
+        lease_seconds: int = 60,
+        poll_interval: float = 1.0
+    ):
+        self.session_factory = session_factory
+        self.sender = sender or LoggingReminderSender()
+        self.batch_size = batch_size
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.worker_id = uuid.uuid4().hex
+        self.stats = DispatchStats()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def dispatch_due(self, now: Optional[datetime] = None) -> int:
+        """Dispatch one batch of due reminders; returns how many were sent"""
+        now = now or datetime.utcnow()
+        db = self.session_factory()
+        try:
+            if db.get_bind().dialect.name == "postgresql":
+                reminders = self._claim_skip_locked(db, now)
+            else:
+                reminders = self._claim_with_lease(db, now)
+            if not reminders:
+                db.rollback()
+                return 0
+
+            try:
+                self.sender.send(reminders)
+            except Exception:
+                self.stats.record_failure()
+                logger.exception(f"Reminder sender failed for a batch of {len(reminders)}")
+                db.rollback()
+                return 0
+
+            self._reschedule(db, reminders, now)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        self.stats.record_batch([
+            max((now - _naive(reminder.next_send)).total_seconds(), 0.0) for reminder in reminders
+        ])
+        return len(reminders)
+
+    def dispatch_all_due(self, now: Optional[datetime] = None) -> int:
+        """Drain every reminder due at now, batch by batch"""
+        total = 0
+        while True:
+            sent = self.dispatch_due(now)
+            total += sent
+            if sent < self.batch_size:
+                return total
+
+    def _due_query(self, now: datetime):
+        return (
+            select(*DISPATCH_COLUMNS)
+            .where(Reminder.is_active.is_(True), Reminder.next_send <= now)
+            .order_by(Reminder.next_send)
+            .limit(self.batch_size)
+        )
+
+    def _claim_skip_locked(self, db: Session, now: datetime) -> list:
+        return db.execute(self._due_query(now).with_for_update(skip_locked=True)).all()
+
+    def _claim_with_lease(self, db: Session, now: datetime) -> list:
+        # Candidates first, then a plain UPDATE by id: MySQL rejects LIMIT in
+        # an IN subquery and selecting from the table being updated
+        candidate_ids = db.execute(
+            select(Reminder.id)
+            .where(
+                Reminder.is_active.is_(True),
+                Reminder.next_send <= now,
+                (Reminder.lease_until.is_(None)) | (Reminder.lease_until < now)
+            )
+            .order_by(Reminder.next_send)
+            .limit(self.batch_size)
+        ).scalars().all()
+        if not candidate_ids:
+            return []
+
+        # Re-checking the lease makes the UPDATE skip rows another dispatcher claimed meanwhile
+        db.execute(
+            update(Reminder)
+            .where(
+                Reminder.id.in_(candidate_ids),
+                (Reminder.lease_until.is_(None)) | (Reminder.lease_until < now)
+            )
+            .values(lease_owner=self.worker_id, lease_until=now + timedelta(seconds=self.lease_seconds))
+            .execution_options(synchronize_session=False)
+        )
+        # Commit the lease so other dispatchers skip these rows while we send
+        db.commit()
+        return db.execute(
+            select(*DISPATCH_COLUMNS)
+            .where(Reminder.id.in_(candidate_ids), Reminder.lease_owner == self.worker_id)
+            .order_by(Reminder.next_send)
+        ).all()
+
+    def _reschedule(self, db: Session, reminders: list, now: datetime):
+        """Write next_send/last_sent for the whole batch with one executemany UPDATE"""
+        next_sends = compute_next_sends(
+            [reminder.reminder_time for reminder in reminders],
+            [reminder.days_mask for reminder in reminders],
+            now
+        )
+        params = [
+            {
+                "target_id": reminder.id,
+                "new_next_send": next_send if reminder.is_recurring else None,
+                "new_last_sent": now
+            }
+            for reminder, next_send in zip(reminders, next_sends)
+        ]
+
+        table = Reminder.__table__
+        db.connection().execute(
+            update(table)
+            .where(table.c.id == bindparam("target_id"))
+            .values(
+                next_send=bindparam("new_next_send"),
+                last_sent=bindparam("new_last_sent"),
+                lease_owner=None,
+                lease_until=None
+            ),
+            params
+        )
+
+    def run_forever(self):
+        """Poll until stop() is called, draining the backlog between sleeps"""
+        while not self._stop.is_set():
+            try:
+                self.dispatch_all_due()
+            except Exception:
+                logger.exception("Reminder dispatch failed")
+            self._stop.wait(self.poll_interval)
+
+    def start(self):
+        """Run the dispatcher in a daemon thread"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run_forever, name="reminder-dispatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+def compute_next_sends(reminder_times: Sequence, days_masks: Sequence[int], now: datetime) -> list:
+    """Vectorized Reminder.compute_next_send for a whole batch
+
+    reminder_times are datetime.time values (or minutes past midnight) and
+    days_masks the matching 7-bit day masks. Returns datetimes, or None for
+    reminders with an empty mask.
+    """
+    if len(days_masks) == 0:
+        return []
+
+    if isinstance(reminder_times, np.ndarray):
+        minutes = reminder_times.astype(np.int64)
+    else:
+        minutes = np.fromiter(
+            (t if isinstance(t, (int, np.integer)) else t.hour * 60 + t.minute for t in reminder_times),
+            dtype=np.int64,
+            count=len(reminder_times)
+        )
+    masks = np.asarray(days_masks, dtype=np.int64)
+
+    weekday = now.weekday()
+    midnight = datetime.combine(now.date(), datetime.min.time())
+    seconds_into_day = (now - midnight).total_seconds()
+
+    # candidates[:, k] is True when the reminder fires k days from today (k = 0..7)
+    days_ahead = np.arange(8)
+    day_bits = (weekday + days_ahead) % 7
+    candidates = (masks[:, None] >> day_bits[None, :]) & 1 == 1
+    candidates[:, 0] &= minutes * 60 > seconds_into_day
+
+    has_next = candidates.any(axis=1)
+    offsets = candidates.argmax(axis=1)
+
+    base = np.datetime64(midnight, "s")
+    next_sends = base + offsets.astype("timedelta64[D]") + minutes.astype("timedelta64[m]")
+    return [
+        value if ok else None
+        for value, ok in zip(next_sends.astype("datetime64[us]").tolist(), has_next.tolist())
+    ]
+
+def _naive(value: datetime) -> datetime:
+    """Compare as naive UTC, matching datetime.utcnow() used across the models"""
+    return value.replace(tzinfo=None) if value.tzinfo else value
+
+def _percentile(sorted_values: list, fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(fraction * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
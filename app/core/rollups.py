@@ -0,0 +1,54 @@
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.models.completion import Completion
+from app.models.rollup import GRANULARITIES, CompletionRollup, rollup_period_start
+
+def rebuild_rollups(db: Session, batch_size: int = 500) -> int:
+    """Repopulate completion_rollups from scratch, batch_size habits at a time
+
+    Each chunk of habits' completions is fully fetched, rolled up and
+    written with one executemany before the next is read, so memory is
+    bounded by the chunk and no cursor stays open across writes. The
+    caller commits. Returns the number of completions processed.
+    """
+    db.execute(delete(CompletionRollup))
+
+    processed = 0
+    for habit_ids in Completion.habit_id_chunks(db, batch_size):
+        rows = db.execute(
+            select(
+                Completion.habit_id,
+                Completion.user_id,
+                Completion.completed_at,
+                Completion.mood_rating,
+                Completion.difficulty_rating
+            )
+            .where(Completion.habit_id.in_(habit_ids))
+        ).all()
+
+        periods = {}
+        for row in rows:
+            for granularity in GRANULARITIES:
+                key = (row.habit_id, granularity, rollup_period_start(granularity, row.completed_at))
+                period = periods.get(key)
+                if period is None:
+                    period = periods[key] = {
+                        "habit_id": row.habit_id, "user_id": row.user_id,
+                        "granularity": granularity, "period_start": key[2],
+                        "count": 0, "mood_sum": 0, "mood_count": 0, "difficulty_sum": 0, "difficulty_count": 0
+                    }
+                period["count"] += 1
+                if row.mood_rating is not None:
+                    period["mood_sum"] += row.mood_rating
+                    period["mood_count"] += 1
+                if row.difficulty_rating is not None:
+                    period["difficulty_sum"] += row.difficulty_rating
+                    period["difficulty_count"] += 1
+        _write_rollups(db, list(periods.values()))
+        processed += len(rows)
+    return processed
+
+def _write_rollups(db: Session, params: list):
+    if params:
+        db.connection().execute(insert(CompletionRollup.__table__), params)
@@ -1,20 +1,133 @@
 from datetime import datetime, timedelta
-from typing import Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple, Union
+import asyncio
+import hashlib
+import os
+import threading
+import time
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.config import settings
+from app.core.cache import ExpiringDict, TTLCache
+
+PASSWORD_SCHEMES = ("bcrypt", "argon2")
+
+def build_password_context(
+    scheme: str = settings.PASSWORD_HASH_SCHEME,
+    bcrypt_rounds: int = settings.BCRYPT_ROUNDS,
+    argon2_time_cost: int = settings.ARGON2_TIME_COST,
+    argon2_memory_cost: int = settings.ARGON2_MEMORY_COST,
+    argon2_parallelism: int = settings.ARGON2_PARALLELISM
+) -> CryptContext:
+    """Password context hashing with scheme at the configured cost
+
+    The other scheme stays verifiable, and hashes of the other scheme or
+    of a different cost report needs_update, so logins migrate them.
+    """
+    if scheme not in PASSWORD_SCHEMES:
+        raise ValueError(f"PASSWORD_HASH_SCHEME must be one of {PASSWORD_SCHEMES}, got {scheme!r}")
+    context = CryptContext(
+        schemes=[scheme] + [other for other in PASSWORD_SCHEMES if other != scheme],
+        deprecated="auto",
+        bcrypt__rounds=bcrypt_rounds,
+        argon2__time_cost=argon2_time_cost,
+        argon2__memory_cost=argon2_memory_cost,
+        argon2__parallelism=argon2_parallelism
+    )
+    if not context.handler(scheme).has_backend():
+        raise RuntimeError(f"PASSWORD_HASH_SCHEME={scheme} but no {scheme} backend is installed")
+    return context
 
 # Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = build_password_context()
+
+# Token digest -> decoded claims, each kept until the token's exp
+token_cache = TTLCache(maxsize=settings.TOKEN_CACHE_SIZE)
+
+# Revocations (per process): token digest -> True until its exp, and
+# user id -> cutoff before which that user's tokens were issued. Unbounded,
+# since evicting a revocation early would make a logged-out token valid again.
+_revoked_tokens = ExpiringDict()
+_revoked_before = ExpiringDict(ttl=settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400)
+
+class PasswordHashStats:
+    """Queue depth and throughput of the password hashing pool"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.peak_queued = 0
+
+    def submitted(self):
+        with self._lock:
+            self.queued += 1
+            self.peak_queued = max(self.peak_queued, self.queued)
+
+    def started(self):
+        with self._lock:
+            self.queued -= 1
+            self.running += 1
+
+    def finished(self):
+        with self._lock:
+            self.running -= 1
+            self.completed += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "workers": PASSWORD_HASH_WORKERS,
+                "queued": self.queued,
+                "running": self.running,
+                "completed": self.completed,
+                "peak_queued": self.peak_queued
+            }
+
+# bcrypt takes 100-300 ms of CPU per call. The async helpers run it on this
+# small dedicated pool: a login burst queues here instead of blocking the
+# event loop or occupying the threadpool used for other blocking work.
+PASSWORD_HASH_WORKERS = settings.PASSWORD_HASH_WORKERS or min(4, os.cpu_count() or 1)
+_password_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+password_hash_stats = PasswordHashStats()
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash"""
+    """Verify a password against its hash (blocking; use verify_password_async in handlers)"""
     return pwd_context.verify(plain_password, hashed_password)
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Verify a password; also return a new hash if the stored one is outdated, else None"""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
 def get_password_hash(password: str) -> str:
-    """Generate password hash"""
+    """Generate password hash (blocking; use hash_password_async in handlers)"""
     return pwd_context.hash(password)
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password on the password hashing pool"""
+    return await _run_password_hash(verify_password, plain_password, hashed_password)
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """verify_and_update_password on the password hashing pool"""
+    return await _run_password_hash(verify_and_update_password, plain_password, hashed_password)
+
+async def hash_password_async(password: str) -> str:
+    """get_password_hash on the password hashing pool"""
+    return await _run_password_hash(get_password_hash, password)
+
+async def _run_password_hash(func, *args):
+    def run():
+        password_hash_stats.started()
+        try:
+            return func(*args)
+        finally:
+            password_hash_stats.finished()
+
+    password_hash_stats.submitted()
+    return await asyncio.get_running_loop().run_in_executor(_password_executor, run)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token"""
     to_encode = data.copy()
@@ -24,7 +137,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "iat": time.time()})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
@@ -32,18 +145,36 @@ def create_refresh_token(data: dict) -> str:
     """Create JWT refresh token"""
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    to_encode.update({"exp": expire, "type": "refresh"})
+    to_encode.update({"exp": expire, "iat": time.time(), "type": "refresh"})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 def verify_token(token: str) -> Optional[dict]:
-    """Verify and decode JWT token"""
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
-    except JWTError:
+    """Verify and decode JWT token
+
+    Claims of a token that verified once are served from token_cache until
+    its exp, so repeat requests skip the signature check. Revoked tokens
+    are rejected either way.
+    """
+    key = _token_key(token)
+    payload = token_cache.get(key)
+    if payload is None:
+        try:
+            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        except JWTError:
+            return None
+        remaining = _remaining_seconds(payload)
+        if remaining is not None and remaining > 0:
+            token_cache.set(key, payload, ttl=remaining)
+    elif _remaining_seconds(payload) <= 0:
+        # Entry outlived exp by a clock tick
+        token_cache.pop(key)
         return None
 
+    if _is_revoked(key, payload):
+        return None
+    return dict(payload)
+
 def get_user_id_from_token(token: str) -> Optional[str]:
     """Extract user ID from JWT token"""
     payload = verify_token(token)
@@ -57,8 +188,40 @@ def is_token_expired(token: str) -> bool:
     if not payload:
         return True
     
+    remaining = _remaining_seconds(payload)
+    return remaining is None or remaining <= 0
+
+def revoke_token(token: str):
+    """Reject this token from now until it expires, e.g. on logout"""
+    key = _token_key(token)
+    token_cache.pop(key)
+    try:
+        claims = jwt.get_unverified_claims(token)
+    except JWTError:
+        return
+    remaining = _remaining_seconds(claims)
+    if remaining is not None and remaining > 0:
+        _revoked_tokens.set(key, True, ttl=remaining)
+
+def revoke_user_tokens(user_id: str):
+    """Reject every token issued to user_id before now, e.g. on password change
+
+    Tokens issued before iat was added carry no issue time and are rejected too.
+    iat has sub-second precision, so only tokens issued after this call pass.
+    """
+    _revoked_before.set(user_id, time.time())
+
+def _token_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+def _remaining_seconds(payload: dict) -> Optional[float]:
     exp = payload.get("exp")
-    if not exp:
+    if not isinstance(exp, (int, float)):
+        return None
+    return exp - time.time()
+
+def _is_revoked(key: bytes, payload: dict) -> bool:
+    if _revoked_tokens.get(key):
         return True
-    
-    return datetime.utcnow() > datetime.fromtimestamp(exp)
+    cutoff = _revoked_before.get(payload.get("sub"))
+    return cutoff is not None and (payload.get("iat") or 0) <= cutoff
@@ -0,0 +1,47 @@
+from typing import Dict, Optional, Union
+
+# Connect-time PRAGMA profiles for SQLite databases. This module has no app
+# dependencies so the standalone AI Teacher can use it too.
+SQLITE_PROFILES: Dict[str, Dict[str, Union[str, int]]] = {
+    # Leave SQLite's rollback journal and defaults untouched
+    "default": {},
+    # WAL lets readers run alongside a writer; NORMAL sync is durable across app crashes in WAL mode
+    "performance": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,  # milliseconds
+        "cache_size": -20000,  # negative = KiB, i.e. ~20 MB page cache
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY"
+    }
+}
+
+def get_sqlite_pragmas(
+    profile: str,
+    busy_timeout_ms: Optional[int] = None,
+    cache_size_kb: Optional[int] = None,
+    mmap_size_mb: Optional[int] = None
+) -> Dict[str, Union[str, int]]:
+    """Get the PRAGMAs for a profile, with any overrides given"""
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(f"Unknown SQLite profile '{profile}', expected one of {list(SQLITE_PROFILES)}")
+
+    pragmas = dict(SQLITE_PROFILES[profile])
+    if busy_timeout_ms is not None:
+        pragmas["busy_timeout"] = busy_timeout_ms
+    if cache_size_kb is not None:
+        pragmas["cache_size"] = -cache_size_kb
+    if mmap_size_mb is not None:
+        pragmas["mmap_size"] = mmap_size_mb * 1024 * 1024
+    return pragmas
+
+def apply_sqlite_pragmas(dbapi_connection, pragmas: Dict[str, Union[str, int]]):
+    """Run PRAGMA statements on a freshly opened DBAPI connection"""
+    if not pragmas:
+        return
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
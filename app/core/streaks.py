@@ -0,0 +1,219 @@
+from datetime import date, datetime
+from types import SimpleNamespace
+from typing import Optional
+
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.models.completion import Completion
+from app.models.habit import FrequencyType, Habit
+from app.models.rollup import CompletionRollup
+from app.models.sync_change import UPSERT, SyncChange
+
+# A Monday, so weekly periods always start on Mondays
+PERIOD_EPOCH = date(1970, 1, 5)
+
+STREAK_FIELDS = ("current_streak", "longest_streak", "streak_period", "period_completions")
+
+def period_index(frequency_type: Optional[FrequencyType], frequency_value: Optional[int], moment) -> int:
+    """Number of the frequency period containing moment
+
+    DAILY/CUSTOM periods are frequency_value days long, WEEKLY periods are
+    frequency_value weeks starting on Monday, MONTHLY periods are
+    frequency_value calendar months.
+    """
+    length = max(frequency_value or 1, 1)
+    day = moment.date() if isinstance(moment, datetime) else moment
+
+    if frequency_type == FrequencyType.WEEKLY:
+        return (day - PERIOD_EPOCH).days // (7 * length)
+    if frequency_type == FrequencyType.MONTHLY:
+        return (day.year * 12 + day.month - 1) // length
+    return (day - PERIOD_EPOCH).days // length
+
+def apply_completion(state, period: int, target_count: Optional[int]) -> bool:
+    """Fold one completion into a streak state in O(1)
+
+    state carries current_streak, longest_streak, streak_period (the latest
+    period with completions) and period_completions (completions in it).
+    Returns False if the completion lands before streak_period, in which
+    case the state is untouched and the habit must be recomputed.
+    """
+    target_count = max(target_count or 1, 1)
+
+    if state.streak_period is None or period > state.streak_period:
+        previous_qualified = (
+            state.streak_period is not None
+            and period == state.streak_period + 1
+            and (state.period_completions or 0) >= target_count
+        )
+        if not previous_qualified:
+            state.current_streak = 0
+        state.streak_period = period
+        state.period_completions = 0
+    elif period < state.streak_period:
+        return False
+
+    state.period_completions = (state.period_completions or 0) + 1
+    # The period counts towards the streak exactly once, when it reaches target_count
+    if state.period_completions == target_count:
+        state.current_streak = (state.current_streak or 0) + 1
+        state.longest_streak = max(state.longest_streak or 0, state.current_streak)
+    return True
+
+def get_current_streak(habit: Habit, now: Optional[datetime] = None) -> int:
+    """Streak as seen at now; it lapses once a whole period passes unqualified"""
+    if not habit.current_streak or habit.streak_period is None:
+        return 0
+
+    current_period = period_index(habit.frequency_type, habit.frequency_value, now or datetime.utcnow())
+    target_count = max(habit.target_count or 1, 1)
+    last_qualified = habit.streak_period if (habit.period_completions or 0) >= target_count else habit.streak_period - 1
+    return habit.current_streak if current_period - last_qualified <= 1 else 0
+
+def record_completion(db: Session, completion: Completion) -> Habit:
+    """Add a completion and update its habit's counters in the same transaction
+
+    The habit row is locked (FOR UPDATE where supported) so concurrent
+    completions for one habit apply in order. The caller commits.
+    """
+    habit = db.get(Habit, completion.habit_id, with_for_update=True)
+    if habit is None:
+        raise ValueError(f"Habit {completion.habit_id} not found")
+
+    db.add(completion)
+    habit.total_completions = (habit.total_completions or 0) + 1
+
+    period = period_index(habit.frequency_type, habit.frequency_value, completion.completed_at)
+    if not apply_completion(habit, period, habit.target_count):
+        # Backdated completion: the O(1) state can't absorb it, rebuild this habit
+        db.flush()
+        recompute_habit_streak(db, habit)
+    return habit
+
+def record_completions(db: Session, habits: dict, rows: list) -> int:
+    """Bulk-insert completion rows and update each affected habit once
+
+    habits maps habit id to the already loaded (ideally locked) Habit for
+    every habit_id in rows; rows are Completion column dicts with ids set.
+    The insert is a single executemany. Streak state is folded in
+    completed_at order per habit, and a habit is only rebuilt from its
+    completions when the batch reaches back before its streak_period.
+    The caller commits. Returns the number of rows inserted.
+    """
+    if not rows:
+        return 0
+
+    db.execute(insert(Completion), rows)
+    SyncChange.record(db, [(row["user_id"], "completion", row["id"], UPSERT) for row in rows])
+    CompletionRollup.apply(db, [
+        (row["habit_id"], row["user_id"], row["completed_at"], row.get("mood_rating"), row.get("difficulty_rating"), 1)
+        for row in rows
+    ])
+
+    by_habit = {}
+    for row in rows:
+        by_habit.setdefault(row["habit_id"], []).append(row["completed_at"])
+
+    for habit_id, completed_ats in by_habit.items():
+        habit = habits[habit_id]
+        periods = sorted(
+            period_index(habit.frequency_type, habit.frequency_value, completed_at)
+            for completed_at in completed_ats
+        )
+        if habit.streak_period is not None and periods[0] < habit.streak_period:
+            recompute_habit_streak(db, habit)
+            continue
+
+        habit.total_completions = (habit.total_completions or 0) + len(periods)
+        for period in periods:
+            apply_completion(habit, period, habit.target_count)
+    return len(rows)
+
+def recompute_habit_streak(db: Session, habit: Habit):
+    """Rebuild one habit's streak state from its completions"""
+    state = _new_state()
+    completed_ats = db.scalars(
+        select(Completion.completed_at)
+        .where(Completion.habit_id == habit.id)
+        .order_by(Completion.completed_at)
+    )
+    total = 0
+    for completed_at in completed_ats:
+        apply_completion(state, period_index(habit.frequency_type, habit.frequency_value, completed_at), habit.target_count)
+        total += 1
+
+    for field in STREAK_FIELDS:
+        setattr(habit, field, getattr(state, field))
+    habit.total_completions = total
+
+def recompute_all_streaks(db: Session, batch_size: int = 500) -> int:
+    """Rebuild every habit's streak state, batch_size habits at a time
+
+    Each chunk of habits' completions is fully fetched in completed_at
+    order and its states written with one executemany UPDATE before the
+    next is read, so no cursor stays open across writes. Habits without
+    completions are reset. The rebuild is not written to the sync change
+    log. The caller commits. Returns the number of completions processed.
+    """
+    db.execute(update(Habit).values(
+        current_streak=0, longest_streak=0, total_completions=0,
+        streak_period=None, period_completions=0
+    ))
+
+    processed = 0
+    for habit_ids in Completion.habit_id_chunks(db, batch_size):
+        rows = db.execute(
+            select(
+                Completion.habit_id,
+                Completion.completed_at,
+                Habit.frequency_type,
+                Habit.frequency_value,
+                Habit.target_count
+            )
+            .join(Habit, Habit.id == Completion.habit_id)
+            .where(Completion.habit_id.in_(habit_ids))
+            .order_by(Completion.habit_id, Completion.completed_at)
+        ).all()
+
+        pending = []
+        habit_id = None
+        state = None
+        for row in rows:
+            if row.habit_id != habit_id:
+                if state is not None:
+                    pending.append(_state_params(habit_id, state))
+                habit_id = row.habit_id
+                state = _new_state()
+
+            apply_completion(state, period_index(row.frequency_type, row.frequency_value, row.completed_at), row.target_count)
+            state.total_completions += 1
+
+        if state is not None:
+            pending.append(_state_params(habit_id, state))
+        _write_states(db, pending)
+        processed += len(rows)
+    return processed
+
+def _new_state() -> SimpleNamespace:
+    return SimpleNamespace(
+        current_streak=0, longest_streak=0, streak_period=None,
+        period_completions=0, total_completions=0
+    )
+
+def _state_params(habit_id: str, state: SimpleNamespace) -> dict:
+    params = {f"new_{field}": getattr(state, field) for field in STREAK_FIELDS}
+    params["new_total_completions"] = state.total_completions
+    params["target_habit_id"] = habit_id
+    return params
+
+def _write_states(db: Session, params: list):
+    """Write a batch of streak states with one executemany UPDATE"""
+    if not params:
+        return
+    db.connection().execute(
+        update(Habit.__table__)
+        .where(Habit.__table__.c.id == bindparam("target_habit_id"))
+        .values({field: bindparam(f"new_{field}") for field in STREAK_FIELDS + ("total_completions",)}),
+        params
+    )
@@ -1,22 +1,276 @@
-from sqlalchemy import create_engine
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, StaticPool
 from app.config import settings
+from app.core.sqlite import apply_sqlite_pragmas, get_sqlite_pragmas
 
 # Database URL from environment
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
+# Alembic configuration lives at the project root
+ALEMBIC_INI_PATH = Path(__file__).resolve().parent.parent / "alembic.ini"
+
+# Per-backend pool defaults, authoritative for this app. MySQL and PostgreSQL
+# started from backend/hosting/production_config.py; SQLite deliberately
+# differs from its 1/0 pool, since in the default "performance" profile
+# (WAL) readers run alongside the writer.
+POOL_DEFAULTS = {
+    "mysql": {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_timeout": 30,
+        "pool_recycle": 3600,
+        "pool_pre_ping": False
+    },
+    "postgresql": {
+        "pool_size": 20,
+        "max_overflow": 30,
+        "pool_timeout": 30,
+        "pool_recycle": -1,
+        "pool_pre_ping": True
+    },
+    "sqlite": {
+        "pool_size": 5,
+        "max_overflow": 10,
+        "pool_timeout": 30,
+        "pool_recycle": -1,
+        "pool_pre_ping": False
+    }
+}
+
+# asyncio drivers used in place of the default DBAPI for each backend
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "mysql": "aiomysql",
+    "sqlite": "aiosqlite"
+}
+
+
+class PoolStats:
+    """Thread-safe counters describing connection pool usage"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.checked_out = 0
+            self.peak_checked_out = 0
+            self.connections_opened = 0
+            self.acquisitions = 0
+            self.total_wait_time = 0.0
+            self.max_wait_time = 0.0
+            self.timeouts = 0
+
+    def on_checkout(self):
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def on_checkin(self):
+        with self._lock:
+            self.checked_out = max(self.checked_out - 1, 0)
+
+    def on_connect(self):
+        with self._lock:
+            self.connections_opened += 1
+
+    def on_wait(self, elapsed: float, timed_out: bool = False):
+        with self._lock:
+            self.acquisitions += 1
+            self.total_wait_time += elapsed
+            self.max_wait_time = max(self.max_wait_time, elapsed)
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "checked_out": self.checked_out,
+                "peak_checked_out": self.peak_checked_out,
+                "connections_opened": self.connections_opened,
+                "acquisitions": self.acquisitions,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait_time / self.acquisitions * 1000, 3) if self.acquisitions else 0.0,
+                "max_wait_ms": round(self.max_wait_time * 1000, 3)
+            }
+
+
+pool_stats = PoolStats()
+
+
+class _WaitTimingMixin:
+    """Records how long callers wait for a connection from the pool"""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except Exception:
+            pool_stats.on_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        pool_stats.on_wait(time.perf_counter() - start)
+        return record
+
+
+class InstrumentedQueuePool(_WaitTimingMixin, QueuePool):
+    """QueuePool that records connection wait time"""
+
+
+class InstrumentedAsyncQueuePool(_WaitTimingMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records connection wait time"""
+
+
+def is_memory_sqlite(database_url: str) -> bool:
+    """Check if URL points at an in-memory SQLite database"""
+    url = make_url(database_url)
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def shared_memory_sqlite_url(database_url: str) -> str:
+    """Named shared-cache form of an in-memory SQLite URL
+
+    Each plain :memory: connection is its own empty database, so the sync
+    and async engines would not see each other's tables. Both open this one
+    instead; it lives as long as the sync engine's connection.
+    """
+    url = make_url(database_url)
+    return url.set(
+        database="file:habit_tracker_memory",
+        query={"mode": "memory", "cache": "shared", "uri": "true"}
+    ).render_as_string(hide_password=False)
+
+
+def get_pool_config(database_url: str) -> dict:
+    """Get pool settings for the backend, with overrides from settings"""
+    backend = make_url(database_url).get_backend_name()
+    config = dict(POOL_DEFAULTS.get(backend, POOL_DEFAULTS["postgresql"]))
+
+    overrides = {
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING
+    }
+    config.update({key: value for key, value in overrides.items() if value is not None})
+    return config
+
+
+def _instrument_engine(db_engine):
+    """Attach pool usage counters to a sync engine"""
+    event.listen(db_engine, "connect", lambda dbapi_conn, record: pool_stats.on_connect())
+    event.listen(db_engine, "checkout", lambda dbapi_conn, record, proxy: pool_stats.on_checkout())
+    event.listen(db_engine, "checkin", lambda dbapi_conn, record: pool_stats.on_checkin())
+
+    # File-backed SQLite gets the configured PRAGMA profile on every new connection
+    if db_engine.dialect.name == "sqlite":
+        pragmas = get_sqlite_pragmas(
+            settings.SQLITE_PROFILE,
+            busy_timeout_ms=settings.SQLITE_BUSY_TIMEOUT_MS,
+            cache_size_kb=settings.SQLITE_CACHE_SIZE_KB,
+            mmap_size_mb=settings.SQLITE_MMAP_SIZE_MB
+        )
+        event.listen(db_engine, "connect", lambda dbapi_conn, record: apply_sqlite_pragmas(dbapi_conn, pragmas))
+
+
+def create_database_engine(database_url: str):
+    """Create an engine with a pool suited to the database backend"""
+    connect_args = {"check_same_thread": False} if "sqlite" in database_url else {}
+
+    # A single shared connection is the only way to keep an in-memory database alive
+    if is_memory_sqlite(database_url):
+        return create_engine(shared_memory_sqlite_url(database_url), poolclass=StaticPool, connect_args=connect_args)
+
+    pool_config = get_pool_config(database_url)
+    db_engine = create_engine(
+        database_url,
+        poolclass=InstrumentedQueuePool,
+        connect_args=connect_args,
+        **pool_config
+    )
+
+    _instrument_engine(db_engine)
+    return db_engine
+
+
+def get_async_database_url(database_url: str) -> str:
+    """Swap the URL's driver for its asyncio counterpart"""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS or url.get_driver_name() == ASYNC_DRIVERS[backend]:
+        return database_url
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(hide_password=False)
+
+
+def create_async_database_engine(database_url: str):
+    """Create an asyncio engine with the same pool settings as the sync engine"""
+    async_url = get_async_database_url(database_url)
+
+    if is_memory_sqlite(database_url):
+        return create_async_engine(shared_memory_sqlite_url(async_url), poolclass=StaticPool)
+
+    db_engine = create_async_engine(
+        async_url,
+        poolclass=InstrumentedAsyncQueuePool,
+        **get_pool_config(database_url)
+    )
+
+    _instrument_engine(db_engine.sync_engine)
+    return db_engine
+
+
+def get_pool_status() -> dict:
+    """Report pool configuration and usage for sizing against WORKER_PROCESSES"""
+    pool = engine.pool
+    status = {"pool_class": type(pool).__name__}
+
+    if isinstance(pool, QueuePool):
+        pool_size = pool.size()
+        max_overflow = pool._max_overflow
+        status.update({
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "timeout": pool.timeout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "in_use": pool.checkedout(),
+            "worker_processes": settings.WORKER_PROCESSES,
+            "max_connections_all_workers": (pool_size + max(max_overflow, 0)) * settings.WORKER_PROCESSES
+        })
+
+    status.update(pool_stats.snapshot())
+    return status
+
+
 # Create engine
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    poolclass=StaticPool,
-    connect_args={"check_same_thread": False} if "sqlite" in SQLALCHEMY_DATABASE_URL else {}
-)
+engine = create_database_engine(SQLALCHEMY_DATABASE_URL)
+
+# Create async engine (used by handlers that must not block the event loop)
+async_engine = create_async_database_engine(SQLALCHEMY_DATABASE_URL)
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Create AsyncSessionLocal class
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 # Create Base class
 Base = declarative_base()
 
@@ -28,7 +282,29 @@ def get_db():
     finally:
         db.close()
 
-# Create all tables
+# Dependency to get async database session
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+# Upgrade the schema to the latest migration
+def run_migrations():
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(str(ALEMBIC_INI_PATH))
+    config.set_main_option("script_location", str(ALEMBIC_INI_PATH.parent / "alembic"))
+    config.attributes["skip_logging_config"] = True
+
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        tables = inspect(connection).get_table_names()
+        # Databases built by create_tables() before migrations existed match the initial revision
+        if "users" in tables and "alembic_version" not in tables:
+            command.stamp(config, "0001")
+        command.upgrade(config, "head")
+
+# Create all tables (tests and scripts; the app uses run_migrations)
 def create_tables():
     Base.metadata.create_all(bind=engine)
 
@@ -1,29 +1,46 @@
-from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from contextlib import asynccontextmanager
-from sqlalchemy.orm import Session
 
 from app.config import settings
-from app.database import get_db, create_tables
+from app.database import SessionLocal, async_engine, run_migrations, get_pool_status
+from app.core.analytics import analytics_cache
+from app.core.dependencies import user_cache
+from app.core.events import event_hub
+from app.core.reminders import ReminderDispatcher
+from app.core.ratelimit import RateLimitMiddleware, create_rate_limiter
+from app.core.responses import CompressionMiddleware, DefaultJSONResponse
+from app.core.security import password_hash_stats, token_cache
 from app.api.v1.api import api_router
-from app.core.security import verify_token
 
-# Security scheme
-security = HTTPBearer()
+# Background reminder dispatcher
+reminder_dispatcher = ReminderDispatcher(
+    SessionLocal,
+    batch_size=settings.REMINDER_BATCH_SIZE,
+    poll_interval=settings.REMINDER_POLL_SECONDS
+)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup
     print("🚀 Starting Habit Tracker API...")
-    create_tables()
-    print("✅ Database tables ready!")
+    run_migrations()
+    print("✅ Database migrations applied!")
+    if settings.REMINDER_DISPATCHER_ENABLED:
+        reminder_dispatcher.start()
+        print("⏰ Reminder dispatcher started!")
+    await event_hub.start()
+    print(f"📡 Event hub started ({settings.EVENTS_BACKEND} backend)!")
     
     yield
     
     # Shutdown
     print("🛑 Shutting down Habit Tracker API...")
+    reminder_dispatcher.stop()
+    await event_hub.stop()
+    await rate_limiter.backend.close()
+    await async_engine.dispose()
 
 # Create FastAPI app
 app = FastAPI(
@@ -32,9 +49,20 @@ app = FastAPI(
     description="A modern habit tracking API with analytics and reminders",
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
+    default_response_class=DefaultJSONResponse,
     lifespan=lifespan
 )
 
+# Rate limiting (inside CORS, so 429 responses still carry CORS headers)
+rate_limiter = create_rate_limiter()
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(
+        RateLimitMiddleware,
+        limiter=rate_limiter,
+        costs=settings.RATE_LIMIT_ROUTE_COSTS,
+        trusted_proxy_hops=settings.RATE_LIMIT_TRUSTED_PROXY_HOPS
+    )
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -44,56 +72,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Dependency to get current user from token
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-):
-    """Get current authenticated user"""
-    token = credentials.credentials
-    
-    if not token:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    # Verify token
-    payload = verify_token(token)
-    if not payload:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    user_id = payload.get("sub")
-    if not user_id:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token payload",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    # Get user from database
-    from app.models.user import User
-    user = db.query(User).filter(User.id == user_id).first()
-    
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    if not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Inactive user"
-        )
-    
-    return user
+# Compress JSON bodies above the size threshold
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.GZIP_LEVEL,
+    brotli_quality=settings.BROTLI_QUALITY
+)
 
 # Include API router
 app.include_router(api_router, prefix="/api/v1")
@@ -109,6 +94,43 @@ async def health_check():
         "environment": settings.ENVIRONMENT
     }
 
+# Database pool stats endpoint
+@app.get("/health/db")
+async def database_health():
+    """Connection pool usage for sizing pool_size against WORKER_PROCESSES"""
+    return {
+        "status": "healthy",
+        "pool": get_pool_status()
+    }
+
+# Reminder dispatch stats endpoint
+@app.get("/health/reminders")
+async def reminder_health():
+    """Reminder dispatch counters and lag percentiles"""
+    return {
+        "enabled": settings.REMINDER_DISPATCHER_ENABLED,
+        "stats": reminder_dispatcher.stats.snapshot()
+    }
+
+# Password hashing pool and rate limiter stats endpoint
+@app.get("/health/auth")
+async def auth_health():
+    """Queue depth of the password hashing pool and rate limiter counters"""
+    return {
+        **password_hash_stats.snapshot(),
+        "rate_limit": {"enabled": settings.RATE_LIMIT_ENABLED, **rate_limiter.snapshot()}
+    }
+
+# In-process cache stats endpoint
+@app.get("/health/cache")
+async def cache_health():
+    """Hit/miss counters of this worker's token, user and analytics caches"""
+    return {
+        "tokens": token_cache.stats(),
+        "users": user_cache.stats(),
+        "analytics": analytics_cache.stats()
+    }
+
 # Root endpoint
 @app.get("/")
 async def root():
@@ -126,5 +148,6 @@ if __name__ == "__main__":
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        timeout_graceful_shutdown=settings.GRACEFUL_SHUTDOWN_SECONDS
     )
@@ -4,6 +4,8 @@ from .reminder import Reminder
 from .category import Category
 from .completion import Completion
 from .streak import Streak
+from .sync_change import SyncChange
+from .rollup import CompletionRollup
 
 __all__ = [
     "User",
@@ -11,5 +13,7 @@ __all__ = [
     "Reminder",
     "Category",
     "Completion",
-    "Streak"
+    "Streak",
+    "SyncChange",
+    "CompletionRollup"
 ]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Index, select
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -6,10 +6,15 @@ import uuid
 
 class Completion(Base):
     __tablename__ = "completions"
+    __table_args__ = (
+        # Also serve plain habit_id / user_id lookups as left-prefixes
+        Index("ix_completions_habit_id_completed_at", "habit_id", "completed_at"),
+        Index("ix_completions_user_id_completed_at", "user_id", "completed_at"),
+    )
     
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
-    habit_id = Column(String, ForeignKey("habits.id"), nullable=False, index=True)
+    user_id = Column(String, ForeignKey("users.id"), nullable=False)
+    habit_id = Column(String, ForeignKey("habits.id"), nullable=False)
     
     completed_at = Column(DateTime(timezone=True), nullable=False, index=True)
     notes = Column(Text)
@@ -25,6 +30,25 @@ class Completion(Base):
     def __repr__(self):
         return f"<Completion(id={self.id}, habit_id='{self.habit_id}', completed_at='{self.completed_at}')>"
     
+    @classmethod
+    def habit_id_chunks(cls, db, size: int):
+        """Yield the ids of habits with completions, size at a time, in id order
+
+        Each chunk is fully fetched (keyset on the habit_id index) before it is
+        yielded, so the caller may write on the same connection between chunks;
+        MySQL cannot interleave statements with an open streaming cursor.
+        """
+        last_id = None
+        while True:
+            query = select(cls.habit_id).distinct().order_by(cls.habit_id).limit(size)
+            if last_id is not None:
+                query = query.where(cls.habit_id > last_id)
+            habit_ids = db.execute(query).scalars().all()
+            if not habit_ids:
+                return
+            yield habit_ids
+            last_id = habit_ids[-1]
+    
     @property
     def is_today(self):
         """Check if completion was done today"""
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Enum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Enum, Index, and_, case, select
+from sqlalchemy.orm import relationship, object_session
 from sqlalchemy.sql import func
 from app.database import Base
+from datetime import datetime, timedelta
 import uuid
 import enum
 
@@ -13,9 +14,13 @@ class FrequencyType(str, enum.Enum):
 
 class Habit(Base):
     __tablename__ = "habits"
+    __table_args__ = (
+        # Keyset pagination of a user's habits on (created_at, id)
+        Index("ix_habits_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
     
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(String, ForeignKey("users.id"), nullable=False)
     category_id = Column(String, ForeignKey("categories.id"), nullable=False, index=True)
     
     title = Column(String(200), nullable=False)
@@ -31,10 +36,12 @@ class Habit(Base):
     start_date = Column(DateTime(timezone=True), server_default=func.now())
     end_date = Column(DateTime(timezone=True), nullable=True)
     
-    # Streak tracking
+    # Streak tracking (maintained by app.core.streaks)
     current_streak = Column(Integer, default=0)
     longest_streak = Column(Integer, default=0)
     total_completions = Column(Integer, default=0)
+    streak_period = Column(Integer, nullable=True)  # index of the latest frequency period with completions
+    period_completions = Column(Integer, default=0)  # completions within streak_period
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -52,33 +59,145 @@ class Habit(Base):
     @property
     def completion_rate(self):
         """Calculate completion rate for the current period"""
-        if not self.completions:
-            return 0.0
-        
-        # Get completions for current period
-        from datetime import datetime, timedelta
-        now = datetime.utcnow()
-        
-        if self.frequency_type == FrequencyType.DAILY:
-            period_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        elif self.frequency_type == FrequencyType.WEEKLY:
-            period_start = now - timedelta(days=now.weekday())
-        elif self.frequency_type == FrequencyType.MONTHLY:
-            period_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        else:
-            return 0.0
-        
-        period_completions = [c for c in self.completions if c.completed_at >= period_start]
-        return min(len(period_completions) / self.target_count, 1.0) * 100
+        status = self._get_status()
+        return status["completion_rate"]
     
     @property
     def is_due_today(self):
         """Check if habit is due for completion today"""
-        from datetime import datetime, timedelta
-        today = datetime.utcnow().date()
+        status = self._get_status()
+        return status["is_due_today"]
+    
+    def _get_status(self):
+        """Status preloaded by load_statuses, or a single-habit aggregate query"""
+        status = getattr(self, "_status", None)
+        if status is not None:
+            return status
+        
+        session = object_session(self)
+        if session is None or self.id is None:
+            return _build_status(self.frequency_type, self.target_count, 0, 0, 0)
         
-        # Check if there's already a completion for today
-        today_completions = [c for c in self.completions 
-                           if c.completed_at.date() == today]
+        return Habit.get_statuses(session, habit_ids=[self.id]).get(
+            self.id, _build_status(self.frequency_type, self.target_count, 0, 0, 0)
+        )
+    
+    @classmethod
+    def get_statuses(cls, db, user_id: str = None, habit_ids: list = None, now: datetime = None):
+        """Compute today/week/month completion counts for many habits in one SELECT
         
-        return len(today_completions) < self.target_count
+        Returns a dict keyed by habit id with today_count, period_count,
+        completion_rate and is_due_today.
+        """
+        from app.models.completion import Completion
+        
+        now = now or datetime.utcnow()
+        day_start = get_period_start(FrequencyType.DAILY, now)
+        week_start = get_period_start(FrequencyType.WEEKLY, now)
+        month_start = get_period_start(FrequencyType.MONTHLY, now)
+        window_start = min(week_start, month_start)
+        
+        def count_since(start):
+            return func.coalesce(func.sum(case((Completion.completed_at >= start, 1), else_=0)), 0)
+        
+        query = (
+            select(
+                cls.id,
+                cls.frequency_type,
+                cls.target_count,
+                count_since(day_start).label("today_count"),
+                count_since(week_start).label("week_count"),
+                count_since(month_start).label("month_count")
+            )
+            .outerjoin(
+                Completion,
+                and_(Completion.habit_id == cls.id, Completion.completed_at >= window_start)
+            )
+            .group_by(cls.id, cls.frequency_type, cls.target_count)
+        )
+        if user_id is not None:
+            query = query.where(cls.user_id == user_id)
+        if habit_ids is not None:
+            query = query.where(cls.id.in_(habit_ids))
+        
+        return {
+            row.id: _build_status(row.frequency_type, row.target_count, row.today_count, row.week_count, row.month_count)
+            for row in db.execute(query)
+        }
+    
+    @classmethod
+    def completion_counts(cls, user_id: str, now: datetime = None):
+        """Grouped subquery of a user's today/week/month completion counts per habit
+        
+        Outer-join it on habit_id and pass its columns to set_status_counts;
+        served by ix_completions_user_id_completed_at.
+        """
+        from app.models.completion import Completion
+        
+        now = now or datetime.utcnow()
+        day_start = get_period_start(FrequencyType.DAILY, now)
+        week_start = get_period_start(FrequencyType.WEEKLY, now)
+        month_start = get_period_start(FrequencyType.MONTHLY, now)
+        
+        def count_since(start):
+            return func.sum(case((Completion.completed_at >= start, 1), else_=0))
+        
+        return (
+            select(
+                Completion.habit_id,
+                count_since(day_start).label("today_count"),
+                count_since(week_start).label("week_count"),
+                count_since(month_start).label("month_count")
+            )
+            .where(Completion.user_id == user_id, Completion.completed_at >= min(week_start, month_start))
+            .group_by(Completion.habit_id)
+            .subquery()
+        )
+    
+    def set_status_counts(self, today_count, week_count, month_count):
+        """Attach counts from completion_counts so status properties issue no queries"""
+        self._status = _build_status(
+            self.frequency_type, self.target_count, today_count or 0, week_count or 0, month_count or 0
+        )
+    
+    @classmethod
+    def load_statuses(cls, db, habits: list, now: datetime = None):
+        """Attach statuses to already-loaded habits so their properties issue no queries"""
+        if not habits:
+            return habits
+        statuses = cls.get_statuses(db, habit_ids=[habit.id for habit in habits], now=now)
+        for habit in habits:
+            habit._status = statuses.get(habit.id, _build_status(habit.frequency_type, habit.target_count, 0, 0, 0))
+        return habits
+
+def get_period_start(frequency_type: FrequencyType, now: datetime) -> datetime:
+    """Start of the current daily/weekly/monthly period containing now"""
+    day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    if frequency_type == FrequencyType.WEEKLY:
+        return day_start - timedelta(days=now.weekday())
+    if frequency_type == FrequencyType.MONTHLY:
+        return day_start.replace(day=1)
+    return day_start
+
+def _build_status(frequency_type, target_count, today_count, week_count, month_count) -> dict:
+    """Derive completion_rate / is_due_today from period counts"""
+    target_count = target_count or 1
+    period_counts = {
+        FrequencyType.DAILY: today_count,
+        FrequencyType.WEEKLY: week_count,
+        FrequencyType.MONTHLY: month_count
+    }
+    
+    period_count = period_counts.get(frequency_type)
+    if period_count is None:
+        completion_rate = 0.0
+        period_count = 0
+    else:
+        completion_rate = min(period_count / target_count, 1.0) * 100
+    
+    return {
+        "today_count": today_count,
+        "period_count": period_count,
+        "completion_rate": completion_rate,
+        "is_due_today": today_count < target_count
+    }
@@ -1,11 +1,17 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Time
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Time, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
 import uuid
 
+# Bit (day - 1) is set for each day the reminder fires (1=Monday ... 7=Sunday)
+ALL_DAYS_MASK = 0b1111111
+
 class Reminder(Base):
     __tablename__ = "reminders"
+    __table_args__ = (
+        Index("ix_reminders_is_active_next_send", "is_active", "next_send"),
+    )
     
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
@@ -14,13 +20,17 @@ class Reminder(Base):
     title = Column(String(200), nullable=False)
     message = Column(String(500))
     reminder_time = Column(Time, nullable=False)  # Time of day for reminder
-    days_of_week = Column(String(50), default="1,2,3,4,5,6,7")  # Comma-separated days (1=Monday)
+    days_mask = Column(Integer, nullable=False, default=ALL_DAYS_MASK, server_default=str(ALL_DAYS_MASK))
     
     is_active = Column(Boolean, default=True)
     is_recurring = Column(Boolean, default=True)
     last_sent = Column(DateTime(timezone=True))
     next_send = Column(DateTime(timezone=True), index=True)
     
+    # Dispatch lease for databases without SKIP LOCKED (see app.core.reminders)
+    lease_owner = Column(String(64), nullable=True)
+    lease_until = Column(DateTime(timezone=True), nullable=True)
+    
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
@@ -31,45 +41,69 @@ class Reminder(Base):
     def __repr__(self):
         return f"<Reminder(id={self.id}, title='{self.title}', user_id='{self.user_id}')>"
     
+    @staticmethod
+    def days_to_mask(days) -> int:
+        """Convert "1,3,5" or an iterable of 1-7 day numbers to a bitmask"""
+        if isinstance(days, str):
+            days = [int(day) for day in days.split(",") if day.strip()]
+        mask = 0
+        for day in days:
+            if not 1 <= int(day) <= 7:
+                raise ValueError(f"Day of week must be 1-7, got {day}")
+            mask |= 1 << (int(day) - 1)
+        return mask
+    
+    @staticmethod
+    def mask_to_days(mask: int) -> list:
+        """Convert a bitmask to a list of 1-7 day numbers"""
+        return [day for day in range(1, 8) if mask & (1 << (day - 1))]
+    
+    @property
+    def days_of_week(self):
+        """Comma-separated days (1=Monday), kept for API compatibility"""
+        return ",".join(str(day) for day in self.days_list)
+    
+    @days_of_week.setter
+    def days_of_week(self, value):
+        self.days_mask = Reminder.days_to_mask(value)
+    
     @property
     def days_list(self):
-        """Convert days_of_week string to list of integers"""
-        return [int(day) for day in self.days_of_week.split(",")]
+        """Convert days_mask to list of integers"""
+        mask = ALL_DAYS_MASK if self.days_mask is None else self.days_mask
+        return Reminder.mask_to_days(mask)
     
     @property
     def is_due_today(self):
         """Check if reminder should be sent today"""
         from datetime import datetime
-        today = datetime.utcnow().weekday() + 1  # Convert to 1-7 format
-        return str(today) in self.days_of_week.split(",")
+        mask = ALL_DAYS_MASK if self.days_mask is None else self.days_mask
+        return bool(mask & (1 << datetime.utcnow().weekday()))
     
-    def get_next_send_time(self):
+    def get_next_send_time(self, now=None):
         """Calculate next time reminder should be sent"""
+        mask = ALL_DAYS_MASK if self.days_mask is None else self.days_mask
+        return Reminder.compute_next_send(self.reminder_time, mask, now)
+    
+    @staticmethod
+    def compute_next_send(reminder_time, days_mask: int, now=None):
+        """Next send time strictly after now for a time of day and day bitmask
+
+        See app.core.reminders.compute_next_sends for the batch version.
+        """
         from datetime import datetime, timedelta
         
-        now = datetime.utcnow()
-        today = now.weekday() + 1  # Convert to 1-7 format
+        now = now or datetime.utcnow()
+        weekday = now.weekday()  # 0=Monday, matching bit 0
+        reminder_clock = reminder_time.replace(second=0, microsecond=0)
         
-        # Check if reminder is due today
-        if str(today) in self.days_of_week.split(","):
-            # Check if it's already past reminder time today
-            reminder_datetime = now.replace(
-                hour=self.reminder_time.hour,
-                minute=self.reminder_time.minute,
-                second=0,
-                microsecond=0
-            )
-            
-            if now < reminder_datetime:
-                return reminder_datetime
+        # Today counts only if the reminder time is still ahead
+        if days_mask & (1 << weekday) and now < datetime.combine(now.date(), reminder_clock):
+            return datetime.combine(now.date(), reminder_clock)
         
-        # Find next day when reminder should be sent
-        days_ahead = 1
-        while days_ahead <= 7:
-            next_day = (today + days_ahead - 1) % 7 + 1
-            if str(next_day) in self.days_of_week.split(","):
-                next_date = now.date() + timedelta(days=days_ahead)
-                return datetime.combine(next_date, self.reminder_time)
-            days_ahead += 1
+        # Find next day when reminder should be sent (7 = same weekday next week)
+        for days_ahead in range(1, 8):
+            if days_mask & (1 << ((weekday + days_ahead) % 7)):
+                return datetime.combine(now.date() + timedelta(days=days_ahead), reminder_clock)
         
         return None
@@ -0,0 +1,149 @@
+from sqlalchemy import Column, Date, ForeignKey, Index, Integer, String, bindparam, case, delete, event, inspect
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.database import Base
+from datetime import date, datetime, timedelta
+
+GRANULARITIES = ("day", "week", "month")
+
+# Completion attributes that move a completion between rollup rows
+ROLLUP_ATTRIBUTES = ("habit_id", "user_id", "completed_at", "mood_rating", "difficulty_rating")
+
+class CompletionRollup(Base):
+    """Completion counts and rating sums per habit per day/week/month
+
+    Maintained incrementally on every completion insert, update and delete
+    (ORM flushes automatically, Core bulk writes via apply()); rebuilt from
+    scratch by app.core.rollups.rebuild_rollups. Averages are kept as sums
+    and counts so they stay exact under deletes.
+    """
+    __tablename__ = "completion_rollups"
+    __table_args__ = (
+        # "chart for user X by period"
+        Index("ix_completion_rollups_user_id_granularity_period_start", "user_id", "granularity", "period_start"),
+    )
+
+    habit_id = Column(String, ForeignKey("habits.id", ondelete="CASCADE"), primary_key=True)
+    granularity = Column(String(10), primary_key=True)
+    period_start = Column(Date, primary_key=True)
+    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+
+    count = Column(Integer, nullable=False, default=0)
+    mood_sum = Column(Integer, nullable=False, default=0)
+    mood_count = Column(Integer, nullable=False, default=0)
+    difficulty_sum = Column(Integer, nullable=False, default=0)
+    difficulty_count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<CompletionRollup(habit_id='{self.habit_id}', {self.granularity} {self.period_start}, count={self.count})>"
+
+    @property
+    def mood_avg(self):
+        return self.mood_sum / self.mood_count if self.mood_count else None
+
+    @property
+    def difficulty_avg(self):
+        return self.difficulty_sum / self.difficulty_count if self.difficulty_count else None
+
+    @classmethod
+    def apply(cls, db: Session, deltas: list):
+        """Fold completion deltas into the rollups with one executemany upsert
+
+        Each delta is (habit_id, user_id, completed_at, mood_rating,
+        difficulty_rating, sign) with sign +1 for an insert and -1 for a
+        delete. Totals are clamped at zero, so removing a completion missing
+        from its rollup (rows written around the listeners) cannot drive
+        them negative.
+        """
+        params = {}
+        for habit_id, user_id, completed_at, mood_rating, difficulty_rating, sign in deltas:
+            for granularity in GRANULARITIES:
+                key = (habit_id, granularity, rollup_period_start(granularity, completed_at))
+                row = params.get(key)
+                if row is None:
+                    row = params[key] = {
+                        "habit_id": habit_id, "granularity": granularity, "period_start": key[2],
+                        "user_id": user_id, "count": 0, "mood_sum": 0, "mood_count": 0,
+                        "difficulty_sum": 0, "difficulty_count": 0
+                    }
+                row["count"] += sign
+                if mood_rating is not None:
+                    row["mood_sum"] += sign * mood_rating
+                    row["mood_count"] += sign
+                if difficulty_rating is not None:
+                    row["difficulty_sum"] += sign * difficulty_rating
+                    row["difficulty_count"] += sign
+        if params:
+            rows = []
+            for row in params.values():
+                # Inserted values start a missing rollup; the deltas update an existing one
+                rows.append({
+                    **row,
+                    **{column: max(row[column], 0) for column in _SUMMED},
+                    **{f"delta_{column}": row[column] for column in _SUMMED}
+                })
+            connection = db.connection()
+            connection.execute(_upsert(connection.dialect.name), rows)
+
+def rollup_period_start(granularity: str, moment) -> date:
+    """First day of the day/week (Monday)/month rollup period containing moment"""
+    day = moment.date() if isinstance(moment, datetime) else moment
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    return day
+
+_SUMMED = ("count", "mood_sum", "mood_count", "difficulty_sum", "difficulty_count")
+
+def _upsert(dialect_name: str):
+    table = CompletionRollup.__table__
+    updates = {}
+    for column in _SUMMED:
+        total = table.c[column] + bindparam(f"delta_{column}")
+        updates[column] = case((total < 0, 0), else_=total)
+    if dialect_name == "mysql":
+        return mysql.insert(table).on_duplicate_key_update(updates)
+    dialect_insert = postgresql.insert if dialect_name == "postgresql" else sqlite.insert
+    return dialect_insert(table).on_conflict_do_update(
+        index_elements=[table.c.habit_id, table.c.granularity, table.c.period_start],
+        set_=updates
+    )
+
+def _completion_delta(completion, sign: int, values: dict = None) -> tuple:
+    values = values or {name: getattr(completion, name) for name in ROLLUP_ATTRIBUTES}
+    return (
+        values["habit_id"], values["user_id"], values["completed_at"],
+        values["mood_rating"], values["difficulty_rating"], sign
+    )
+
+@event.listens_for(Session, "after_flush")
+def _roll_up_flushed_completions(session: Session, flush_context):
+    deleted_habit_ids = {obj.id for obj in session.deleted if getattr(obj, "__tablename__", None) == "habits"}
+    deltas = []
+    for obj in session.new:
+        if getattr(obj, "__tablename__", None) == "completions":
+            deltas.append(_completion_delta(obj, 1))
+    for obj in session.deleted:
+        if getattr(obj, "__tablename__", None) == "completions" and obj.habit_id not in deleted_habit_ids:
+            deltas.append(_completion_delta(obj, -1))
+    for obj in session.dirty:
+        if getattr(obj, "__tablename__", None) != "completions":
+            continue
+        state = inspect(obj)
+        histories = {name: state.attrs[name].history for name in ROLLUP_ATTRIBUTES}
+        if not any(history.has_changes() for history in histories.values()):
+            continue
+        old = {
+            name: history.deleted[0] if history.deleted else getattr(obj, name)
+            for name, history in histories.items()
+        }
+        deltas.append(_completion_delta(obj, -1, old))
+        deltas.append(_completion_delta(obj, 1))
+
+    CompletionRollup.apply(session, deltas)
+    if deleted_habit_ids:
+        # Also covers SQLite, where ON DELETE CASCADE needs PRAGMA foreign_keys
+        session.connection().execute(
+            delete(CompletionRollup.__table__).where(CompletionRollup.__table__.c.habit_id.in_(deleted_habit_ids))
+        )
@@ -46,36 +46,13 @@ class Streak(Base):
         today = datetime.utcnow().date()
         return (today - self.start_date).days
     
-    def update_streak(self, completed_today: bool):
-        """Update streak based on today's completion"""
-        from datetime import datetime, timedelta
-        
-        today = datetime.utcnow().date()
-        
-        if completed_today:
-            if self.is_active:
-                # Extend current streak
-                self.current_length += 1
-                self.longest_length = max(self.longest_length, self.current_length)
-            else:
-                # Start new streak
-                self.start_date = today
-                self.end_date = None
-                self.current_length = 1
-        else:
-            if self.is_active:
-                # End current streak
-                self.end_date = today - timedelta(days=1)
-        
-        self.updated_at = datetime.utcnow()
-    
     @classmethod
-    def get_current_streak(cls, user_id: str, habit_id: str):
+    def get_current_streak(cls, db, user_id: str, habit_id: str):
         """Get the current active streak for a user and habit"""
-        from datetime import datetime
+        from datetime import datetime, timedelta
         today = datetime.utcnow().date()
         
-        return cls.query.filter(
+        return db.query(cls).filter(
             cls.user_id == user_id,
             cls.habit_id == habit_id,
             cls.end_date.is_(None) | (cls.end_date >= today - timedelta(days=1))
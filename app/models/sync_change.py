@@ -0,0 +1,108 @@
+from sqlalchemy import DDL, BigInteger, Column, DateTime, Integer, String, Index, event, func, insert, or_, select
+from sqlalchemy.orm import Session
+from app.database import Base
+
+# Synced tables and the entity_type their changes are logged under
+SYNCED_TABLES = {
+    "habits": "habit",
+    "completions": "completion",
+    "reminders": "reminder",
+    "categories": "category",
+}
+
+UPSERT = "upsert"
+DELETE = "delete"
+
+# session.info keys holding the open transaction's changes, per user, until
+# commit publishes them to connected clients (see app.core.events)
+PENDING_CHANGES_KEY = "pending_sync_changes"
+TRUNCATED_CHANGES_KEY = "truncated_sync_changes"
+MAX_PENDING_CHANGES = 200
+
+class SyncChange(Base):
+    """Append-only log of changes to synced rows, read by GET /sync
+
+    The auto-increment id is the sync token: a client that has seen id N
+    asks for changes with id > N. ORM flushes are logged automatically;
+    Core bulk writes must call SyncChange.record() themselves.
+    """
+    __tablename__ = "sync_changes"
+    __table_args__ = (
+        # "changes for user X after token T"
+        Index("ix_sync_changes_user_id_id", "user_id", "id"),
+    )
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    user_id = Column(String, nullable=True)  # None for rows shared by all users (categories)
+    entity_type = Column(String(20), nullable=False)
+    entity_id = Column(String, nullable=False)
+    operation = Column(String(10), nullable=False)
+    changed_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<SyncChange(id={self.id}, {self.operation} {self.entity_type} {self.entity_id})>"
+
+    @classmethod
+    def record(cls, db: Session, changes: list):
+        """Log (user_id, entity_type, entity_id, operation) tuples with one executemany"""
+        if not changes:
+            return
+        connection = db.connection()
+        if connection.dialect.name != "sqlite":
+            # Ids are handed out before commit, so a reader could see id N+1
+            # committed while N is still in flight and skip N forever. Every
+            # reader also sees shared changes, so all writers take the same
+            # lock until commit (SQLite already has a single writer).
+            connection.execute(select(SyncLogLock.id).with_for_update()).scalar_one()
+        connection.execute(insert(cls.__table__), [
+            {"user_id": user_id, "entity_type": entity_type, "entity_id": entity_id, "operation": operation}
+            for user_id, entity_type, entity_id, operation in changes
+        ])
+        cls._remember(db, changes)
+
+    @staticmethod
+    def _remember(db: Session, changes: list):
+        # Bounded per user: a client told its list was truncated resyncs instead
+        pending = db.info.setdefault(PENDING_CHANGES_KEY, {})
+        for user_id, entity_type, entity_id, operation in changes:
+            entries = pending.setdefault(user_id, [])
+            if len(entries) < MAX_PENDING_CHANGES:
+                entries.append((entity_type, entity_id, operation))
+            else:
+                db.info.setdefault(TRUNCATED_CHANGES_KEY, set()).add(user_id)
+
+    @classmethod
+    def changes_since(cls, user_id: str, since: int, limit: int):
+        """Query for a user's (and shared) changes after token since, oldest first"""
+        return (
+            select(cls.id, cls.entity_type, cls.entity_id, cls.operation)
+            .where(or_(cls.user_id == user_id, cls.user_id.is_(None)), cls.id > since)
+            .order_by(cls.id)
+            .limit(limit)
+        )
+
+class SyncLogLock(Base):
+    """Single row locked by each transaction that writes sync_changes"""
+    __tablename__ = "sync_log_lock"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+
+event.listen(SyncLogLock.__table__, "after_create", DDL("INSERT INTO sync_log_lock (id) VALUES (1)"))
+
+def _entity_change(obj, operation: str):
+    entity_type = SYNCED_TABLES.get(getattr(obj, "__tablename__", None))
+    if entity_type is None:
+        return None
+    return (getattr(obj, "user_id", None), entity_type, obj.id, operation)
+
+@event.listens_for(Session, "after_flush")
+def _log_flushed_changes(session: Session, flush_context):
+    changes = []
+    for obj in session.new:
+        changes.append(_entity_change(obj, UPSERT))
+    for obj in session.dirty:
+        if session.is_modified(obj, include_collections=False):
+            changes.append(_entity_change(obj, UPSERT))
+    for obj in session.deleted:
+        changes.append(_entity_change(obj, DELETE))
+    SyncChange.record(session, [change for change in changes if change is not None])
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -8,8 +8,8 @@ class User(Base):
     __tablename__ = "users"
     
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    email = Column(String(255), unique=True, nullable=False, index=True)
-    username = Column(String(50), unique=True, nullable=False, index=True)
+    email = Column(String(255), nullable=False)
+    username = Column(String(50), nullable=False)
     hashed_password = Column(String(255), nullable=False)
     first_name = Column(String(100))
     last_name = Column(String(100))
@@ -21,12 +21,34 @@ class User(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     last_login = Column(DateTime(timezone=True))
     
+    __table_args__ = (
+        # Case-insensitive uniqueness; also the only indexes for login lookups,
+        # which must compare lower(column) to use them (see login_filters)
+        Index("ix_users_lower_email", func.lower(email), unique=True),
+        Index("ix_users_lower_username", func.lower(username), unique=True),
+    )
+    
     # Relationships
     habits = relationship("Habit", back_populates="user", cascade="all, delete-orphan")
     reminders = relationship("Reminder", back_populates="user", cascade="all, delete-orphan")
     completions = relationship("Completion", back_populates="user", cascade="all, delete-orphan")
     streaks = relationship("Streak", back_populates="user", cascade="all, delete-orphan")
     
+    @classmethod
+    def login_filters(cls, identifier: str) -> tuple:
+        """WHERE clauses to try in order for a login identifier
+        
+        An identifier with "@" is looked up as an email, then as a username
+        (usernames registered before "@" was disallowed may contain one); any
+        other identifier only as a username. Each clause is a single probe of
+        its lower() unique index rather than an OR across two indexes.
+        """
+        identifier = identifier.strip().lower()
+        by_username = func.lower(cls.username) == identifier
+        if "@" in identifier:
+            return (func.lower(cls.email) == identifier, by_username)
+        return (by_username,)
+    
     def __repr__(self):
         return f"<User(id={self.id}, username='{self.username}', email='{self.email}')>"
     
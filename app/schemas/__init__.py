@@ -1,13 +1,23 @@
 from .auth import UserLogin, UserRegister, TokenResponse, UserResponse
-from .habit import HabitCreate, HabitUpdate, HabitResponse, HabitListResponse
-from .category import CategoryCreate, CategoryUpdate, CategoryResponse
-from .completion import CompletionCreate, CompletionUpdate, CompletionResponse
+from .habit import HabitResponse, HabitListResponse
+from .category import CategoryResponse
+from .completion import (
+    CompletionCreate, CompletionUpdate, CompletionResponse,
+    CompletionBatchCreate, CompletionBatchResponse, CompletionImportResponse, HabitCounters
+)
 from .reminder import ReminderCreate, ReminderUpdate, ReminderResponse
+from .sync import SyncDeleted, SyncResponse
+from .analytics import HeatmapResponse, TrendPoint, TrendsResponse
+from .dashboard import DashboardDay, DashboardSummary, DashboardResponse
 
 __all__ = [
     "UserLogin", "UserRegister", "TokenResponse", "UserResponse",
-    "HabitCreate", "HabitUpdate", "HabitResponse", "HabitListResponse",
-    "CategoryCreate", "CategoryUpdate", "CategoryResponse",
+    "HabitResponse", "HabitListResponse",
+    "CategoryResponse",
     "CompletionCreate", "CompletionUpdate", "CompletionResponse",
-    "ReminderCreate", "ReminderUpdate", "ReminderResponse"
+    "CompletionBatchCreate", "CompletionBatchResponse", "CompletionImportResponse", "HabitCounters",
+    "ReminderCreate", "ReminderUpdate", "ReminderResponse",
+    "SyncDeleted", "SyncResponse",
+    "HeatmapResponse", "TrendPoint", "TrendsResponse",
+    "DashboardDay", "DashboardSummary", "DashboardResponse"
 ]
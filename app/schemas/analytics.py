@@ -0,0 +1,25 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import date
+
+class HeatmapResponse(BaseModel):
+    """Year-long completion heatmap response schema"""
+    year: int
+    habit_id: Optional[str] = None
+    start_date: date
+    counts: List[int] = Field(..., description="Completions per UTC day; index 0 is start_date")
+    total: int
+    max_count: int
+
+class TrendPoint(BaseModel):
+    """One period of a trend chart"""
+    period_start: date
+    count: int
+    mood_avg: Optional[float] = None
+    difficulty_avg: Optional[float] = None
+
+class TrendsResponse(BaseModel):
+    """Completion trend response schema"""
+    granularity: str
+    habit_id: Optional[str] = None
+    points: List[TrendPoint]
@@ -10,7 +10,8 @@ class UserLogin(BaseModel):
 class UserRegister(BaseModel):
     """User registration request schema"""
     email: EmailStr = Field(..., description="User email")
-    username: str = Field(..., min_length=3, max_length=50, description="Username")
+    # No "@": logins treat identifiers containing one as emails
+    username: str = Field(..., min_length=3, max_length=50, pattern=r"^[^@]+$", description="Username")
     password: str = Field(..., min_length=6, description="Password")
     first_name: Optional[str] = Field(None, max_length=100, description="First name")
     last_name: Optional[str] = Field(None, max_length=100, description="Last name")
@@ -0,0 +1,60 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import datetime
+
+# Upper bound on completions accepted by one POST /completions/batch
+MAX_BATCH_SIZE = 5000
+
+class CompletionCreate(BaseModel):
+    """Completion creation request schema"""
+    id: Optional[str] = Field(None, max_length=64, description="Client-generated ID; makes offline retries idempotent")
+    habit_id: str = Field(..., description="Habit ID")
+    completed_at: Optional[datetime] = Field(None, description="When the habit was completed (defaults to now)")
+    notes: Optional[str] = Field(None, description="Notes")
+    mood_rating: Optional[int] = Field(None, ge=1, le=10, description="Mood rating (1-10)")
+    difficulty_rating: Optional[int] = Field(None, ge=1, le=10, description="Difficulty rating (1-10)")
+
+class CompletionUpdate(BaseModel):
+    """Completion update request schema"""
+    notes: Optional[str] = Field(None, description="Notes")
+    mood_rating: Optional[int] = Field(None, ge=1, le=10, description="Mood rating (1-10)")
+    difficulty_rating: Optional[int] = Field(None, ge=1, le=10, description="Difficulty rating (1-10)")
+
+class CompletionResponse(BaseModel):
+    """Completion response schema"""
+    id: str
+    habit_id: str
+    completed_at: datetime
+    notes: Optional[str] = None
+    mood_rating: Optional[int] = None
+    difficulty_rating: Optional[int] = None
+    created_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+class CompletionBatchCreate(BaseModel):
+    """Batch completion request schema, e.g. completions queued while offline"""
+    completions: List[CompletionCreate] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+class HabitCounters(BaseModel):
+    """Habit counters after a batch was applied"""
+    habit_id: str
+    total_completions: int
+    current_streak: int
+    longest_streak: int
+
+class CompletionBatchResponse(BaseModel):
+    """Batch completion response schema"""
+    created: int
+    skipped: int = Field(0, description="Completions whose ID already existed")
+    habits: List[HabitCounters]
+
+class CompletionImportResponse(BaseModel):
+    """CSV import result schema"""
+    imported: int
+    skipped: int
+    errors: List[str] = Field([], description="First invalid rows, with line numbers")
+    habits_updated: int
+    elapsed_seconds: float
+    rows_per_second: int
@@ -0,0 +1,28 @@
+from pydantic import BaseModel, Field
+from typing import List
+from datetime import date
+
+from app.schemas.habit import HabitResponse
+from app.schemas.reminder import ReminderResponse
+
+class DashboardSummary(BaseModel):
+    """Home screen statistics over the user's active habits"""
+    total_habits: int = 0
+    due_today: int = Field(0, description="Active habits still short of today's target")
+    completed_today: int = Field(0, description="Active habits that met today's target")
+    completion_rate: float = Field(0.0, description="Mean current-period completion rate, 0-100")
+    best_current_streak: int = 0
+    longest_streak: int = 0
+    total_completions: int = 0
+
+class DashboardDay(BaseModel):
+    """Completions on one UTC day"""
+    date: date
+    count: int
+
+class DashboardResponse(BaseModel):
+    """Everything the home screen needs in one payload"""
+    summary: DashboardSummary
+    habits: List[HabitResponse]
+    upcoming_reminders: List[ReminderResponse]
+    last_7_days: List[DashboardDay] = Field(..., description="Oldest first, ending today")
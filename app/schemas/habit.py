@@ -0,0 +1,49 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import datetime
+
+from app.core.streaks import get_current_streak
+from app.models.habit import FrequencyType, Habit
+from app.schemas.category import CategoryResponse
+
+class HabitResponse(BaseModel):
+    """Habit response schema"""
+    id: str
+    category_id: str
+    category: Optional[CategoryResponse] = None
+    title: str
+    description: Optional[str] = None
+    frequency_type: FrequencyType
+    frequency_value: int
+    target_count: int
+    color: Optional[str] = None
+    icon: Optional[str] = None
+    is_active: bool
+    is_public: bool
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    current_streak: int = 0
+    longest_streak: int = 0
+    total_completions: int = 0
+    today_count: int = 0
+    completion_rate: float = 0.0
+    is_due_today: bool = True
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+    
+    @classmethod
+    def from_habit(cls, habit: Habit, now: Optional[datetime] = None) -> "HabitResponse":
+        """Build from a habit whose category and status are already loaded"""
+        response = cls.model_validate(habit)
+        response.today_count = habit._get_status()["today_count"]
+        response.current_streak = get_current_streak(habit, now)
+        return response
+
+class HabitListResponse(BaseModel):
+    """Keyset-paginated habit list response schema"""
+    items: List[HabitResponse]
+    next_cursor: Optional[str] = Field(None, description="Pass as ?cursor= to fetch the next page")
+    has_more: bool = False
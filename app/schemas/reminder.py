@@ -0,0 +1,38 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import datetime, time
+
+class ReminderCreate(BaseModel):
+    """Reminder creation request schema"""
+    habit_id: Optional[str] = Field(None, description="Habit ID (omit for a general reminder)")
+    title: str = Field(..., min_length=1, max_length=200, description="Reminder title")
+    message: Optional[str] = Field(None, max_length=500, description="Reminder message")
+    reminder_time: time = Field(..., description="Time of day to send")
+    days_of_week: List[int] = Field([1, 2, 3, 4, 5, 6, 7], description="Days to send on (1=Monday ... 7=Sunday)")
+    is_recurring: bool = Field(True, description="Repeat on the chosen days")
+
+class ReminderUpdate(BaseModel):
+    """Reminder update request schema"""
+    title: Optional[str] = Field(None, min_length=1, max_length=200, description="Reminder title")
+    message: Optional[str] = Field(None, max_length=500, description="Reminder message")
+    reminder_time: Optional[time] = Field(None, description="Time of day to send")
+    days_of_week: Optional[List[int]] = Field(None, description="Days to send on (1=Monday ... 7=Sunday)")
+    is_active: Optional[bool] = Field(None, description="Whether the reminder is active")
+    is_recurring: Optional[bool] = Field(None, description="Repeat on the chosen days")
+
+class ReminderResponse(BaseModel):
+    """Reminder response schema"""
+    id: str
+    habit_id: Optional[str] = None
+    title: str
+    message: Optional[str] = None
+    reminder_time: time
+    days_list: List[int]
+    is_active: bool
+    is_recurring: bool
+    last_sent: Optional[datetime] = None
+    next_send: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
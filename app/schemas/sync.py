@@ -0,0 +1,24 @@
+from pydantic import BaseModel, Field
+from typing import List
+
+from app.schemas.category import CategoryResponse
+from app.schemas.completion import CompletionResponse
+from app.schemas.habit import HabitResponse
+from app.schemas.reminder import ReminderResponse
+
+class SyncDeleted(BaseModel):
+    """IDs deleted since the previous token, per entity type"""
+    habits: List[str] = []
+    completions: List[str] = []
+    reminders: List[str] = []
+    categories: List[str] = []
+
+class SyncResponse(BaseModel):
+    """Delta sync response schema"""
+    token: str = Field(..., description="Pass as ?since= on the next sync")
+    has_more: bool = Field(False, description="More changes are waiting; sync again with the new token")
+    habits: List[HabitResponse] = []
+    completions: List[CompletionResponse] = []
+    reminders: List[ReminderResponse] = []
+    categories: List[CategoryResponse] = []
+    deleted: SyncDeleted = SyncDeleted()
@@ -12,6 +12,7 @@ app_dir = Path(__file__).parent / "app"
 sys.path.insert(0, str(app_dir))
 
 # Import and run the FastAPI app
+from app.config import settings
 from app.main import app
 
 if __name__ == "__main__":
@@ -26,5 +27,6 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=port,
         reload=False,
-        log_level="info"
+        log_level="info",
+        timeout_graceful_shutdown=settings.GRACEFUL_SHUTDOWN_SECONDS
     )
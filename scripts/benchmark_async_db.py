@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark sync Session vs AsyncSession request handling
+Runs the user lookup done by get_current_user through both session types
+with 100 concurrent clients and reports requests/sec for each path
+
+The default temporary SQLite file has no network round-trip, so the blocking
+path looks cheap there; point --url at the production Postgres/MySQL server
+to measure the in-flight concurrency the async path buys.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Sync vs async DB session benchmark")
+    parser.add_argument("--url", help="Database URL (defaults to a temporary SQLite file)")
+    parser.add_argument("--clients", type=int, default=100, help="Concurrent clients")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per path")
+    return parser.parse_args()
+
+
+args = parse_args()
+if args.url:
+    os.environ["DATABASE_URL"] = args.url
+else:
+    db_file = os.path.join(tempfile.mkdtemp(), "benchmark.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_file}"
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import SessionLocal, async_engine, create_tables, get_async_db
+from app.models import User
+
+app = FastAPI()
+
+
+@app.get("/sync/{user_id}")
+async def sync_lookup(user_id: str):
+    """Blocking lookup inside an async handler (the old get_current_user path)
+
+    The session is closed inline: with get_db the connection is only released
+    after the response, which deadlocks the loop once the pool is exhausted.
+    """
+    with SessionLocal() as db:
+        user = db.query(User).filter(User.id == user_id).first()
+        return {"id": user.id}
+
+
+@app.get("/async/{user_id}")
+async def async_lookup(user_id: str, db: AsyncSession = Depends(get_async_db)):
+    """Non-blocking lookup via AsyncSession"""
+    result = await db.execute(select(User).where(User.id == user_id))
+    user = result.scalar_one_or_none()
+    return {"id": user.id}
+
+
+def seed_user() -> str:
+    """Create the tables and a single user to look up"""
+    create_tables()
+    db = SessionLocal()
+    try:
+        user = User(email="bench@example.com", username="bench", hashed_password="x")
+        db.add(user)
+        db.commit()
+        return user.id
+    finally:
+        db.close()
+
+
+async def run_path(client: httpx.AsyncClient, path: str, clients: int, total: int) -> float:
+    """Fire `total` requests at `path` from `clients` concurrent workers"""
+    remaining = iter(range(total))
+
+    async def worker():
+        for _ in remaining:
+            response = await client.get(path)
+            response.raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(clients)))
+    return total / (time.perf_counter() - start)
+
+
+async def main():
+    user_id = seed_user()
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm up both pools
+        await run_path(client, f"/sync/{user_id}", 10, 100)
+        await run_path(client, f"/async/{user_id}", 10, 100)
+
+        print(f"📊 {args.requests} requests, {args.clients} concurrent clients")
+        print(f"🗄️ Database: {os.environ['DATABASE_URL'].split('://')[0]}")
+        for label, path in (("sync Session", "/sync"), ("AsyncSession", "/async")):
+            rps = await run_path(client, f"{path}/{user_id}", args.clients, args.requests)
+            print(f"   {label:<14} {rps:10.1f} req/s")
+
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
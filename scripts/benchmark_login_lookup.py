@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark login identifier lookups on a large users table
+Migrates a scratch database to 0008, seeds --users users and times the old
+email-OR-username login query, then upgrades to head (the lower() unique
+indexes) and times the first User.login_filters probe for emails and
+usernames. Verifies with EXPLAIN that each new lookup probes exactly one
+index; exits non-zero otherwise.
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+parser = argparse.ArgumentParser(description="Login lookup plans and timings")
+parser.add_argument("--users", type=int, default=1000000, help="Users to seed")
+parser.add_argument("--lookups", type=int, default=2000, help="Timed lookups per query")
+parser.add_argument("--url", help="Scratch database URL (defaults to a temporary SQLite file)")
+args = parser.parse_args()
+
+os.environ["DATABASE_URL"] = args.url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'logins.db')}"
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import insert, select, text
+
+from app.database import ALEMBIC_INI_PATH, engine
+from app.models import User
+
+BATCH_SIZE = 50000
+
+
+def upgrade(revision: str):
+    config = Config(str(ALEMBIC_INI_PATH))
+    config.set_main_option("script_location", str(ALEMBIC_INI_PATH.parent / "alembic"))
+    config.attributes["skip_logging_config"] = True
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, revision)
+
+
+def seed(connection):
+    for start in range(0, args.users, BATCH_SIZE):
+        connection.execute(insert(User), [
+            {"id": f"u{i}", "email": f"User{i}@Example.com", "username": f"User{i}", "hashed_password": "x"}
+            for i in range(start, min(start + BATCH_SIZE, args.users))
+        ])
+    connection.execute(text("ANALYZE"))
+
+
+def old_login_query(identifier: str):
+    return select(User.id).where((User.email == identifier) | (User.username == identifier))
+
+
+def new_login_query(identifier: str):
+    # The username fallback for "@" identifiers only runs when the email probe misses
+    return select(User.id).where(User.login_filters(identifier)[0])
+
+
+def explain(connection, statement) -> str:
+    sql = str(statement.compile(engine, compile_kwargs={"literal_binds": True}))
+    if engine.dialect.name == "sqlite":
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+        return "\n".join(str(row[-1]) for row in rows)
+    rows = connection.exec_driver_sql(f"EXPLAIN {sql}").fetchall()
+    return "\n".join(" ".join(str(col) for col in row) for row in rows)
+
+
+def time_lookups(connection, make_query, identifiers: list) -> float:
+    """Mean µs per lookup; every identifier must resolve to a user"""
+    start = time.perf_counter()
+    for identifier in identifiers:
+        if connection.execute(make_query(identifier)).scalar_one_or_none() is None:
+            raise SystemExit(f"❌ No user found for {identifier!r}")
+    return (time.perf_counter() - start) / len(identifiers) * 1e6
+
+
+def report(label: str, plan: str, mean: float):
+    print(f"   {label:<34} {mean:8.1f} µs/lookup")
+    for line in plan.splitlines():
+        print(f"     {line}")
+
+
+def main():
+    sample = random.sample(range(args.users), min(args.lookups, args.users))
+    emails = [f"user{i}@example.com" for i in sample]
+    usernames = [f"user{i}" for i in sample]
+
+    upgrade("0008")
+    start = time.perf_counter()
+    with engine.begin() as connection:
+        seed(connection)
+    print(f"📊 {args.users} users seeded in {time.perf_counter() - start:.1f} s ({engine.dialect.name})")
+
+    with engine.connect() as connection:
+        # The old query matched case-sensitively, so look up the stored spelling
+        stored = [f"User{i}" for i in sample]
+        plan = explain(connection, old_login_query(stored[0]))
+        report("before: email OR username", plan, time_lookups(connection, old_login_query, stored))
+
+    start = time.perf_counter()
+    upgrade("head")
+    print(f"   lower() indexes built in {time.perf_counter() - start:.1f} s")
+    with engine.begin() as connection:
+        connection.execute(text("ANALYZE"))
+
+    failures = 0
+    with engine.connect() as connection:
+        for label, identifiers, index_name, other_index in (
+            ("after: email (any case)", emails, "ix_users_lower_email", "ix_users_lower_username"),
+            ("after: username (any case)", usernames, "ix_users_lower_username", "ix_users_lower_email"),
+        ):
+            plan = explain(connection, new_login_query(identifiers[0]))
+            report(label, plan, time_lookups(connection, new_login_query, identifiers))
+            single = index_name in plan and other_index not in plan
+            failures += not single
+            print(f"   {'✅' if single else '❌'} single probe of {index_name}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
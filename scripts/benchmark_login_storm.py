@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Load test: /health latency during a login storm on one worker
+Starts the API under uvicorn against a scratch database, probes /health
+while idle, then again while --concurrency clients log in back to back.
+bcrypt runs on the password hashing pool, so /health p99 should stay
+close to its idle value instead of growing with each queued login.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="/health latency during a login storm")
+    parser.add_argument("--concurrency", type=int, default=50, help="Concurrent login clients")
+    parser.add_argument("--seconds", type=float, default=10.0, help="Length of each phase")
+    parser.add_argument("--port", type=int, default=8766)
+    return parser.parse_args()
+
+
+args = parse_args()
+db_file = os.path.join(tempfile.mkdtemp(), "logins.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{db_file}"
+
+import httpx
+from sqlalchemy import insert
+
+from app.core.security import get_password_hash
+from app.database import SessionLocal, run_migrations
+from app.models import User
+
+PASSWORD = "correct horse battery"
+
+
+def seed():
+    """One user per login client, all sharing one precomputed hash"""
+    run_migrations()
+    hashed = get_password_hash(PASSWORD)
+    db = SessionLocal()
+    try:
+        db.execute(insert(User), [
+            {"id": f"u{i}", "email": f"u{i}@example.com", "username": f"user{i}", "hashed_password": hashed}
+            for i in range(args.concurrency)
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+
+def start_server() -> subprocess.Popen:
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(args.port), "--log-level", "warning"],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env={**os.environ, "RATE_LIMIT_ENABLED": "false"}
+    )
+    for _ in range(100):
+        try:
+            httpx.get(f"http://127.0.0.1:{args.port}/health", timeout=1).raise_for_status()
+            return server
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    server.kill()
+    raise SystemExit("❌ Server did not start")
+
+
+async def probe(client: httpx.AsyncClient, seconds: float) -> list:
+    """/health latencies in ms, one request every 20 ms"""
+    latencies = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        response = await client.get("/health")
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(0.02)
+    return latencies
+
+
+async def login_loop(client: httpx.AsyncClient, username: str, deadline: float) -> int:
+    logins = 0
+    while time.perf_counter() < deadline:
+        response = await client.post(
+            "/api/v1/auth/login",
+            json={"email_or_username": username, "password": PASSWORD}
+        )
+        response.raise_for_status()
+        logins += 1
+    return logins
+
+
+def percentile(values: list, q: float) -> float:
+    return statistics.quantiles(values, n=100)[int(q) - 1] if len(values) > 1 else values[0]
+
+
+async def main():
+    seed()
+    server = start_server()
+    base_url = f"http://127.0.0.1:{args.port}"
+    limits = httpx.Limits(max_connections=args.concurrency + 10)
+    try:
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+            idle = await probe(client, args.seconds)
+
+            deadline = time.perf_counter() + args.seconds
+            logins = asyncio.gather(*(
+                login_loop(client, f"user{i}", deadline) for i in range(args.concurrency)
+            ))
+            storm = await probe(client, args.seconds)
+            total = sum(await logins)
+            pool = (await client.get("/health/auth")).json()
+
+        print(f"📊 {args.concurrency} concurrent login clients for {args.seconds:.0f} s, one uvicorn worker")
+        print(f"   logins:        {total} ({total / args.seconds:.1f}/s), hashing workers: {pool['workers']}")
+        print(f"   peak queued:   {pool['peak_queued']}")
+        print(f"   /health idle:  p50 {percentile(idle, 50):7.2f} ms   p99 {percentile(idle, 99):7.2f} ms")
+        print(f"   /health storm: p50 {percentile(storm, 50):7.2f} ms   p99 {percentile(storm, 99):7.2f} ms")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
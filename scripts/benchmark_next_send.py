@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Benchmark batch next-send computation for reminders
+Compares the NumPy compute_next_sends against per-reminder
+Reminder.compute_next_send and checks both agree
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from datetime import time as time_of_day
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.reminders import compute_next_sends
+from app.models import Reminder
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Next-send computation benchmark")
+    parser.add_argument("--reminders", type=int, default=100000, help="Reminders per batch")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    times = [time_of_day(rng.randrange(24), rng.randrange(60)) for _ in range(args.reminders)]
+    masks = [rng.randrange(128) for _ in range(args.reminders)]
+    now = datetime(2026, 10, 16, 12, 30, 15) + timedelta(days=rng.randrange(7))
+
+    start = time.perf_counter()
+    vectorized = compute_next_sends(times, masks, now)
+    vectorized_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scalar = [Reminder.compute_next_send(t, mask, now) for t, mask in zip(times, masks)]
+    scalar_elapsed = time.perf_counter() - start
+
+    mismatches = sum(1 for a, b in zip(vectorized, scalar) if a != b)
+    print(f"📊 {args.reminders} reminders")
+    print(f"   NumPy batch   {vectorized_elapsed * 1000:8.1f} ms")
+    print(f"   Per-reminder  {scalar_elapsed * 1000:8.1f} ms")
+    print(f"   {'✅' if not mismatches else '❌'} {mismatches} mismatches")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark and check RateLimitMiddleware
+Drives a bare ASGI app with and without the middleware and reports the
+added cost per request for anonymous (per-IP) and bearer-token (per-user)
+clients, then checks that the 61st request in a minute is refused with
+Retry-After and that clients behind a proxy are keyed by the forwarded
+hop it appended. Pass --redis-url to test the Redis backend against a server,
+or --fake-redis to start a local Redis-protocol stand-in (needs fakeredis).
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.ratelimit import (
+    LocalRateLimitBackend,
+    RateLimiter,
+    RateLimitMiddleware,
+    RedisRateLimitBackend,
+    make_limits
+)
+from app.core.security import create_access_token
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Rate limit middleware overhead")
+    parser.add_argument("--requests", type=int, default=50000, help="Requests per measurement")
+    parser.add_argument("--clients", type=int, default=1000, help="Distinct IPs / users")
+    parser.add_argument("--redis-url", help="Also measure the Redis backend on this server")
+    parser.add_argument("--fake-redis", action="store_true", help="Start a local fakeredis server for the Redis backend")
+    return parser.parse_args()
+
+
+async def bare_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+def make_scope(ip: str, token: str = None, path: str = "/api/v1/habits", forwarded_for: str = None) -> dict:
+    headers = [(b"host", b"bench")]
+    if token:
+        headers.append((b"authorization", f"Bearer {token}".encode()))
+    if forwarded_for:
+        headers.append((b"x-forwarded-for", forwarded_for.encode()))
+    return {"type": "http", "method": "GET", "path": path, "headers": headers, "client": (ip, 50000)}
+
+
+async def drive(app, scopes: list, count: int) -> tuple:
+    """Mean µs per request and the status of each response"""
+    statuses = []
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    start = time.perf_counter()
+    for index in range(count):
+        await app(scopes[index % len(scopes)], receive, send)
+    return (time.perf_counter() - start) / count * 1e6, statuses
+
+
+def generous_limiter(backend) -> RateLimiter:
+    # High enough that the timing runs are never limited
+    return RateLimiter(backend, make_limits(10 ** 9, 10 ** 9))
+
+
+async def measure(label: str, backend, args, ip_scopes: list, user_scopes: list, baseline: float):
+    middleware = RateLimitMiddleware(bare_app, generous_limiter(backend))
+    count = args.requests if isinstance(backend, LocalRateLimitBackend) else min(args.requests, 5000)
+    for kind, scopes in (("per IP", ip_scopes), ("per user", user_scopes)):
+        await drive(middleware, scopes, min(count, 1000))  # warm the token cache
+        mean, _ = await drive(middleware, scopes, count)
+        print(f"   {label:<6} {kind:<9} {mean:8.1f} µs/request  (+{mean - baseline:.1f} µs)")
+
+
+async def check_refusal(label: str, backend):
+    limiter = RateLimiter(backend, make_limits(60, 1000))
+    costs = {"/api/v1/auth/login": 5, "/users/{user_id}/query": 5}
+    middleware = RateLimitMiddleware(bare_app, limiter, costs=costs)
+    scope = make_scope(f"10.9.{time.time_ns() % 250}.1")
+    _, statuses = await drive(middleware, [scope], 61)
+    login = make_scope(f"10.8.{time.time_ns() % 250}.1", path="/api/v1/auth/login")
+    _, login_statuses = await drive(middleware, [login], 13)
+    query = make_scope(f"10.7.{time.time_ns() % 250}.1", path="/users/42/query")
+    _, query_statuses = await drive(middleware, [query], 13)
+    ok = (
+        statuses[:60] == [200] * 60 and statuses[60] == 429
+        and login_statuses.count(200) == 12 and query_statuses.count(200) == 12
+    )
+    print(f"   {'✅' if ok else '❌'} {label}: 61st request refused, login and /users/{{id}}/query (cost 5) allow 12 per minute")
+    return ok
+
+
+async def check_forwarded(label: str, backend):
+    """Behind one proxy: keyed by the hop it appended, not by spoofable earlier entries"""
+    limiter = RateLimiter(backend, make_limits(60, 1000))
+    middleware = RateLimitMiddleware(bare_app, limiter, trusted_proxy_hops=1)
+    proxy = "10.6.0.1"
+    spoofer = f"10.5.{time.time_ns() % 250}.1"
+    spoofed = [make_scope(proxy, forwarded_for=f"1.2.3.{i % 250}, {spoofer}") for i in range(61)]
+    _, statuses = await drive(middleware, spoofed, 61)
+    _, other = await drive(middleware, [make_scope(proxy, forwarded_for=f"10.4.{time.time_ns() % 250}.1")], 1)
+    ok = statuses[60] == 429 and other == [200]
+    print(f"   {'✅' if ok else '❌'} {label}: clients behind a proxy keyed by forwarded IP, spoofed entries ignored")
+    return ok
+
+
+def start_fake_redis() -> str:
+    from fakeredis import TcpFakeServer
+
+    server = TcpFakeServer(("127.0.0.1", 0))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    return f"redis://{host}:{port}/0"
+
+
+async def main():
+    args = parse_args()
+    ip_scopes = [make_scope(f"10.0.{i // 250}.{i % 250}") for i in range(args.clients)]
+    user_scopes = [make_scope("10.1.0.1", create_access_token({"sub": f"user-{i}"})) for i in range(args.clients)]
+
+    baseline, _ = await drive(bare_app, ip_scopes, args.requests)
+    print(f"📊 {args.requests} requests over {args.clients} clients")
+    print(f"   {'none':<16} {baseline:8.1f} µs/request")
+
+    backends = [("local", LocalRateLimitBackend)]
+    redis_url = start_fake_redis() if args.fake_redis else args.redis_url
+    if redis_url:
+        backends.append(("redis", lambda: RedisRateLimitBackend(redis_url)))
+
+    failures = 0
+    for label, factory in backends:
+        backend = factory()
+        await measure(label, backend, args, ip_scopes, user_scopes, baseline)
+        failures += not await check_refusal(label, backend)
+        failures += not await check_forwarded(label, backend)
+        await backend.close()
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
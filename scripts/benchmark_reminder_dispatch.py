@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark the reminder dispatcher
+Seeds a backlog of due reminders, drains it with one ReminderDispatcher
+and compares throughput against the 1M reminders/day target
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from datetime import time as time_of_day
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+parser = argparse.ArgumentParser(description="Reminder dispatch benchmark")
+parser.add_argument("--url", help="Scratch database URL (defaults to a temporary SQLite file)")
+parser.add_argument("--reminders", type=int, default=50000, help="Due reminders to seed")
+parser.add_argument("--batch-size", type=int, default=500, help="Dispatcher batch size")
+args = parser.parse_args()
+
+os.environ["DATABASE_URL"] = args.url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'reminders.db')}"
+
+from sqlalchemy import insert
+
+from app.core.reminders import ReminderDispatcher, ReminderSender
+from app.database import SessionLocal, run_migrations
+from app.models import Reminder, User
+
+TARGET_PER_DAY = 1_000_000
+
+
+class NullSender(ReminderSender):
+    """Discards reminders so the benchmark measures database work only"""
+
+    def send(self, reminders: list):
+        pass
+
+
+def seed(count: int, now: datetime):
+    db = SessionLocal()
+    try:
+        db.execute(insert(User), [{"id": "bench", "email": "bench@example.com", "username": "bench", "hashed_password": "x"}])
+        for offset in range(0, count, 10000):
+            db.execute(insert(Reminder), [
+                {
+                    "id": f"r{i}",
+                    "user_id": "bench",
+                    "title": "Reminder",
+                    "reminder_time": time_of_day(i % 24, i % 60),
+                    "days_mask": 0b1111111 if i % 3 else 0b0010101,
+                    "is_active": True,
+                    "is_recurring": True,
+                    "next_send": now - timedelta(seconds=i % 600)
+                }
+                for i in range(offset, min(offset + 10000, count))
+            ])
+        db.commit()
+    finally:
+        db.close()
+
+
+def main():
+    run_migrations()
+    now = datetime.utcnow()
+    seed(args.reminders, now)
+
+    dispatcher = ReminderDispatcher(SessionLocal, sender=NullSender(), batch_size=args.batch_size)
+    start = time.perf_counter()
+    sent = dispatcher.dispatch_all_due(now)
+    elapsed = time.perf_counter() - start
+
+    rate = sent / elapsed
+    stats = dispatcher.stats.snapshot()
+    print(f"📊 Dispatched {sent} reminders in {elapsed:.2f}s ({rate:.0f}/s, batch size {args.batch_size})")
+    print(f"   Capacity: {rate * 86400 / TARGET_PER_DAY:.1f}x the {TARGET_PER_DAY:,}/day target")
+    print(f"   Lag p50 {stats['lag_p50_seconds']:.0f}s  p99 {stats['lag_p99_seconds']:.0f}s  (seeded backlog up to 600s)")
+
+
+if __name__ == "__main__":
+    main()
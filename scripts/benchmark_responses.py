@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSON serialization and compression of typical API payloads
+Compares the stdlib JSONResponse with DefaultJSONResponse (orjson) and
+reports bytes on the wire uncompressed, gzip and brotli (when installed)
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.config import settings
+from app.core.responses import BrotliEncoder, DefaultJSONResponse, GzipEncoder, brotli
+
+
+def habit_page(count: int = 50) -> dict:
+    """A GET /api/v1/habits page as the Flutter app receives it"""
+    now = datetime.utcnow()
+    return {
+        "items": [
+            {
+                "id": f"7f1c2e9a-0b5d-4c8e-9a{i:010d}",
+                "category_id": "2b8f4c6e-1d3a-4f5b-8c7d-9e0a1b2c3d4e",
+                "category": {
+                    "id": "2b8f4c6e-1d3a-4f5b-8c7d-9e0a1b2c3d4e", "name": "Health & Fitness",
+                    "description": None, "color": "#10B981", "icon": "fitness_center",
+                    "is_default": True, "created_at": now, "updated_at": None
+                },
+                "title": f"Morning run #{i}",
+                "description": "Run at least 3km before breakfast",
+                "frequency_type": "daily", "frequency_value": 1, "target_count": 1,
+                "color": "#6366F1", "icon": "check_circle", "is_active": True, "is_public": False,
+                "start_date": now - timedelta(days=90), "end_date": None,
+                "current_streak": i % 17, "longest_streak": 21, "total_completions": 80 + i,
+                "today_count": i % 2, "is_due_today": i % 2 == 0,
+                "created_at": now - timedelta(days=90, minutes=i), "updated_at": now
+            }
+            for i in range(count)
+        ],
+        "next_cursor": "MjAyNi0xMC0xNiAwOTowMDowMHxoMDQ5",
+        "has_more": True
+    }
+
+
+def ai_answer(tokens: int = 1200) -> dict:
+    """An AI Teacher /users/{id}/query answer at the max_tokens limit (~4 chars per token)"""
+    sentence = "Consistency beats intensity: anchor the habit to an existing routine and keep it small. "
+    message = (sentence * (tokens * 4 // len(sentence) + 1))[:tokens * 4]
+    return {
+        "message": message,
+        "suggestions": ["Start with two minutes", "Stack it after coffee", "Track it right after"],
+        "reminders": [{"time": "07:30", "message": "Time for your morning run"}],
+        "motivation": "Small steps every day add up to big results.",
+        "analysis": None,
+        "intent": "advice",
+        "sentiment": "neutral"
+    }
+
+
+def time_render(response_class, content, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        response_class(content)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Response serialization/compression benchmark")
+    parser.add_argument("--iterations", type=int, default=2000, help="Renders per payload and encoder")
+    args = parser.parse_args()
+
+    payloads = {"habit list (50)": habit_page(), "AI answer (1200 tokens)": ai_answer()}
+    for name, payload in payloads.items():
+        content = jsonable_encoder(payload)
+        body = DefaultJSONResponse(content).body
+        stdlib_us = time_render(JSONResponse, content, args.iterations)
+        orjson_us = time_render(DefaultJSONResponse, content, args.iterations)
+
+        print(f"📦 {name}")
+        print(f"   render: json {stdlib_us:.1f}µs  orjson {orjson_us:.1f}µs  ({stdlib_us / orjson_us:.1f}x)")
+        print(f"   bytes:  raw {len(body):,}")
+
+        encoders = [("gzip", lambda: GzipEncoder(settings.GZIP_LEVEL))]
+        if brotli is not None:
+            encoders.append(("br", lambda: BrotliEncoder(settings.BROTLI_QUALITY)))
+        else:
+            print("           br skipped (brotli not installed)")
+        for label, factory in encoders:
+            start = time.perf_counter()
+            for _ in range(args.iterations // 10 or 1):
+                compressed = factory().finish(body)
+            elapsed_us = (time.perf_counter() - start) / (args.iterations // 10 or 1) * 1e6
+            print(f"           {label} {len(compressed):,} ({len(compressed) / len(body):.0%}, {elapsed_us:.0f}µs)")
+
+
+if __name__ == "__main__":
+    main()
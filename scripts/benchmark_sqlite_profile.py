@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark SQLite profiles under concurrent reads and writes
+One writer commits small transactions while reader threads query the same
+file; reports throughput and lock errors for each profile in SQLITE_PROFILES
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.sqlite import SQLITE_PROFILES, get_sqlite_pragmas, apply_sqlite_pragmas
+
+
+def connect(path: str, pragmas: dict) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, check_same_thread=False)
+    apply_sqlite_pragmas(conn, pragmas)
+    return conn
+
+
+def seed(path: str, pragmas: dict, rows: int):
+    conn = connect(path, pragmas)
+    conn.execute("""
+        CREATE TABLE completions (
+            id INTEGER PRIMARY KEY,
+            habit_id INTEGER NOT NULL,
+            completed_at TIMESTAMP NOT NULL
+        )
+    """)
+    conn.execute("CREATE INDEX ix_completions_habit_id ON completions (habit_id)")
+    conn.executemany(
+        "INSERT INTO completions (habit_id, completed_at) VALUES (?, datetime('now'))",
+        ((i % 100,) for i in range(rows))
+    )
+    conn.commit()
+    conn.close()
+
+
+def run_profile(profile: str, readers: int, duration: float, rows: int) -> dict:
+    pragmas = get_sqlite_pragmas(profile)
+    path = os.path.join(tempfile.mkdtemp(), f"{profile}.db")
+    seed(path, pragmas, rows)
+
+    stop = threading.Event()
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    lock = threading.Lock()
+
+    def bump(key):
+        with lock:
+            counts[key] += 1
+
+    def writer():
+        conn = connect(path, pragmas)
+        habit_id = 0
+        while not stop.is_set():
+            try:
+                conn.execute(
+                    "INSERT INTO completions (habit_id, completed_at) VALUES (?, datetime('now'))",
+                    (habit_id % 100,)
+                )
+                conn.commit()
+                bump("writes")
+            except sqlite3.OperationalError:
+                conn.rollback()
+                bump("errors")
+            habit_id += 1
+        conn.close()
+
+    def reader(seed_id):
+        conn = connect(path, pragmas)
+        habit_id = seed_id
+        while not stop.is_set():
+            try:
+                conn.execute(
+                    "SELECT COUNT(*) FROM completions WHERE habit_id = ?",
+                    (habit_id % 100,)
+                ).fetchone()
+                bump("reads")
+            except sqlite3.OperationalError:
+                bump("errors")
+            habit_id += 1
+        conn.close()
+
+    threads = [threading.Thread(target=writer)]
+    threads += [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    return {key: value / duration for key, value in counts.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite profile concurrency benchmark")
+    parser.add_argument("--readers", type=int, default=4, help="Reader threads")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per profile")
+    parser.add_argument("--rows", type=int, default=50000, help="Rows seeded before the run")
+    args = parser.parse_args()
+
+    print(f"📊 1 writer, {args.readers} readers, {args.duration}s per profile, {args.rows} seeded rows")
+    for profile in SQLITE_PROFILES:
+        result = run_profile(profile, args.readers, args.duration, args.rows)
+        print(
+            f"   {profile:<12} reads/s {result['reads']:10.1f}   "
+            f"writes/s {result['writes']:8.1f}   lock errors/s {result['errors']:8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Load test for idle GET /api/v1/events connections on one worker
+Starts the API under uvicorn against a scratch database, opens --connections
+event streams spread over --users users, and reports the worker's memory
+per connection, its CPU use while the streams sit idle, and how long a
+committed completion takes to reach every stream of its user.
+
+Raise the open-file limit first (ulimit -n) for 10k connections: the
+client and the server each need one descriptor per stream.
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Idle SSE connections per worker")
+    parser.add_argument("--connections", type=int, default=10000, help="Event streams to open")
+    parser.add_argument("--users", type=int, default=1000, help="Users the streams are spread over")
+    parser.add_argument("--idle", type=float, default=20.0, help="Seconds to hold the streams idle")
+    parser.add_argument("--port", type=int, default=8765)
+    return parser.parse_args()
+
+
+args = parse_args()
+db_file = os.path.join(tempfile.mkdtemp(), "events.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{db_file}"
+
+import httpx
+from sqlalchemy import insert
+
+from app.core.security import create_access_token
+from app.database import SessionLocal, run_migrations
+from app.models import Category, Habit, User
+
+
+def seed() -> list:
+    """One habit per user; returns (user_id, habit_id) pairs"""
+    run_migrations()
+    pairs = [(f"u{i}", f"h{i}") for i in range(args.users)]
+    db = SessionLocal()
+    try:
+        db.execute(insert(User), [
+            {"id": user_id, "email": f"{user_id}@example.com", "username": user_id, "hashed_password": "x"}
+            for user_id, _ in pairs
+        ])
+        db.execute(insert(Category), [{"id": "c0", "name": "General"}])
+        db.execute(insert(Habit), [
+            {"id": habit_id, "user_id": user_id, "category_id": "c0", "title": "Habit"}
+            for user_id, habit_id in pairs
+        ])
+        db.commit()
+    finally:
+        db.close()
+    return pairs
+
+
+def start_server() -> subprocess.Popen:
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(args.port), "--log-level", "warning",
+         "--backlog", "4096", "--timeout-graceful-shutdown", "5"],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env={**os.environ, "EVENTS_BACKEND": "local", "RATE_LIMIT_ENABLED": "false"}
+    )
+    for _ in range(100):
+        try:
+            httpx.get(f"http://127.0.0.1:{args.port}/health", timeout=1).raise_for_status()
+            return server
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    server.kill()
+    raise SystemExit("❌ Server did not start")
+
+
+def rss_kb(pid: int) -> int:
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+def cpu_seconds(pid: int) -> float:
+    with open(f"/proc/{pid}/stat") as stat:
+        fields = stat.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+class Stream:
+    """One raw event-stream connection; counts change events as they arrive"""
+
+    def __init__(self, user_id: str):
+        self.user_id = user_id
+        self.changes = asyncio.Event()
+        self.writer = None
+
+    async def open(self):
+        reader, self.writer = await asyncio.open_connection("127.0.0.1", args.port)
+        token = create_access_token({"sub": self.user_id})
+        self.writer.write(
+            f"GET /api/v1/events HTTP/1.1\r\nHost: bench\r\nAuthorization: Bearer {token}\r\n"
+            f"Accept: text/event-stream\r\n\r\n".encode()
+        )
+        await self.writer.drain()
+        status = await reader.readline()
+        if b" 200 " not in status:
+            raise RuntimeError(f"Stream for {self.user_id} failed: {status!r}")
+        await reader.readuntil(b": connected\n\n")
+        return reader
+
+    async def listen(self, reader):
+        while True:
+            line = await reader.readline()
+            if not line:
+                return
+            if line.startswith(b"event: change"):
+                self.changes.set()
+
+
+async def main():
+    pairs = seed()
+    server = start_server()
+    streams = [Stream(pairs[i % len(pairs)][0]) for i in range(args.connections)]
+    listeners = []
+    try:
+        baseline = rss_kb(server.pid)
+        handshakes = asyncio.Semaphore(200)
+
+        async def connect(stream):
+            async with handshakes:
+                reader = await stream.open()
+            listeners.append(asyncio.create_task(stream.listen(reader)))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(connect(stream) for stream in streams))
+        connect_seconds = time.perf_counter() - start
+        connected = rss_kb(server.pid)
+
+        cpu_before = cpu_seconds(server.pid)
+        await asyncio.sleep(args.idle)
+        idle_cpu = (cpu_seconds(server.pid) - cpu_before) / args.idle * 100
+
+        # One completion for the first user reaches all of their streams
+        user_id, habit_id = pairs[0]
+        targets = [stream for stream in streams if stream.user_id == user_id]
+        token = create_access_token({"sub": user_id})
+        start = time.perf_counter()
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{args.port}") as client:
+            response = await client.post(
+                "/api/v1/completions/batch",
+                json={"completions": [{"habit_id": habit_id}]},
+                headers={"Authorization": f"Bearer {token}"}
+            )
+            response.raise_for_status()
+        await asyncio.wait_for(asyncio.gather(*(stream.changes.wait() for stream in targets)), 10)
+        fanout_ms = (time.perf_counter() - start) * 1000
+        leaked = sum(stream.changes.is_set() for stream in streams if stream.user_id != user_id)
+
+        print(f"📊 {args.connections} event streams over {args.users} users, one uvicorn worker")
+        print(f"   connect:           {connect_seconds:8.2f} s ({args.connections / connect_seconds:.0f}/s)")
+        print(f"   worker RSS:        {baseline / 1024:8.1f} MB -> {connected / 1024:.1f} MB")
+        print(f"   per connection:    {(connected - baseline) / args.connections:8.1f} KB")
+        print(f"   idle CPU:          {idle_cpu:8.2f} % over {args.idle:.0f} s")
+        print(f"   change fan-out:    {fanout_ms:8.1f} ms to {len(targets)} streams (request included)")
+        print(f"   {'✅' if not leaked else '❌'} other users' streams received {leaked} events")
+    finally:
+        for listener in listeners:
+            listener.cancel()
+        for stream in streams:
+            if stream.writer is not None:
+                stream.writer.close()
+        await asyncio.gather(*listeners, return_exceptions=True)
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
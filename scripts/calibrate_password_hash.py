@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Calibrate the password hash cost for this host
+Times verify at increasing bcrypt rounds (or argon2 time cost at a fixed
+memory cost) and recommends the strongest setting whose median verify
+stays within --target-ms. Run it on the production instance type and put
+the printed settings in its environment; existing hashes are upgraded on
+each user's next login.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.security import build_password_context
+
+# Below these the hash is too cheap to recommend whatever the budget
+# (OWASP password storage guidance)
+MIN_BCRYPT_ROUNDS = 10
+MIN_ARGON2_MEMORY_KIB = 19456
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Recommend password hash parameters for a latency budget")
+    parser.add_argument("--scheme", choices=["bcrypt", "argon2"], default="bcrypt")
+    parser.add_argument("--target-ms", type=float, default=50.0, help="Median verify budget")
+    parser.add_argument("--samples", type=int, default=5, help="Verifies timed per setting")
+    parser.add_argument("--argon2-memory-kib", type=int, default=MIN_ARGON2_MEMORY_KIB)
+    parser.add_argument("--argon2-parallelism", type=int, default=1)
+    return parser.parse_args()
+
+
+def median_verify_ms(context, samples: int) -> float:
+    hashed = context.hash("calibration password")
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        context.verify("calibration password", hashed)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate(args, candidates, make_context) -> list:
+    """(cost, ms) for each candidate, stopping once one exceeds twice the budget"""
+    results = []
+    for cost in candidates:
+        ms = median_verify_ms(make_context(cost), args.samples)
+        results.append((cost, ms))
+        print(f"   {cost:>4}  {ms:9.1f} ms{'  ✅' if ms <= args.target_ms else ''}")
+        if ms > args.target_ms * 2:
+            break
+    return results
+
+
+def main():
+    args = parse_args()
+    print(f"📊 {args.scheme} verify time on this host (target {args.target_ms:.0f} ms, median of {args.samples})")
+
+    if args.scheme == "bcrypt":
+        print("   rounds")
+        results = calibrate(args, range(4, 17), lambda rounds: build_password_context("bcrypt", bcrypt_rounds=rounds))
+        minimum = MIN_BCRYPT_ROUNDS
+        settings_lines = lambda cost: ["PASSWORD_HASH_SCHEME=bcrypt", f"BCRYPT_ROUNDS={cost}"]
+    else:
+        print(f"   time cost at {args.argon2_memory_kib} KiB, parallelism {args.argon2_parallelism}")
+        results = calibrate(args, range(1, 11), lambda time_cost: build_password_context(
+            "argon2",
+            argon2_time_cost=time_cost,
+            argon2_memory_cost=args.argon2_memory_kib,
+            argon2_parallelism=args.argon2_parallelism
+        ))
+        minimum = 2 if args.argon2_memory_kib <= MIN_ARGON2_MEMORY_KIB else 1
+        settings_lines = lambda cost: [
+            "PASSWORD_HASH_SCHEME=argon2",
+            f"ARGON2_TIME_COST={cost}",
+            f"ARGON2_MEMORY_COST={args.argon2_memory_kib}",
+            f"ARGON2_PARALLELISM={args.argon2_parallelism}"
+        ]
+
+    within = [cost for cost, ms in results if ms <= args.target_ms]
+    recommended = max(within) if within else None
+    if recommended is None or recommended < minimum:
+        print(f"⚠️  Nothing at or above the minimum cost ({minimum}) fits {args.target_ms:.0f} ms here;")
+        print("   use the minimum and raise the budget, or give the instance more CPU.")
+        recommended = minimum
+
+    print("✅ Recommended settings:")
+    for line in settings_lines(recommended):
+        print(f"   {line}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Query-count check for GET /api/v1/dashboard
+Migrates a scratch database to head, seeds a small and a large user, and
+verifies the dashboard costs the same fixed number of queries for both.
+Exits non-zero if it grows with the number of habits, completions or reminders.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+from datetime import datetime, time, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+parser = argparse.ArgumentParser(description="Verify the dashboard query count")
+parser.add_argument("--url", help="Scratch database URL (defaults to a temporary SQLite file)")
+args = parser.parse_args()
+
+os.environ["DATABASE_URL"] = args.url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'dashboard.db')}"
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import event
+
+from app.api.v1.api import api_router
+from app.core.security import create_access_token
+from app.database import SessionLocal, async_engine, run_migrations
+from app.models import Category, Completion, Habit, Reminder, User
+
+# get_current_user, habits + counts, categories, reminders, daily rollups
+MAX_QUERIES = 5
+
+# (label, habits, completions per habit, reminders)
+USERS = [
+    ("small", 2, 3, 1),
+    ("large", 200, 30, 50),
+]
+
+app = FastAPI()
+app.include_router(api_router, prefix="/api/v1")
+
+
+def seed(label: str, habits: int, completions: int, reminders: int) -> str:
+    """Create a user with habits across a few categories; completions go through the ORM to fill rollups"""
+    now = datetime.utcnow()
+    db = SessionLocal()
+    try:
+        user = User(email=f"{label}@example.com", username=label, hashed_password="x")
+        categories = [Category(name=f"{label} {i}") for i in range(3)]
+        db.add(user)
+        db.add_all(categories)
+        db.flush()
+        for i in range(habits):
+            habit = Habit(user_id=user.id, category_id=categories[i % 3].id, title=f"Habit {i}")
+            db.add(habit)
+            db.flush()
+            db.add_all(
+                Completion(user_id=user.id, habit_id=habit.id, completed_at=now - timedelta(hours=5 * j))
+                for j in range(completions)
+            )
+        db.add_all(
+            Reminder(
+                user_id=user.id, title="Reminder", reminder_time=time(8, 0),
+                next_send=now + timedelta(hours=i + 1)
+            )
+            for i in range(reminders)
+        )
+        db.commit()
+        return user.id
+    finally:
+        db.close()
+
+
+async def count_queries(client: httpx.AsyncClient, user_id: str) -> tuple:
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    token = create_access_token({"sub": user_id})
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        response = await client.get("/api/v1/dashboard", headers={"Authorization": f"Bearer {token}"})
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+    response.raise_for_status()
+    return len(statements), response.json()
+
+
+async def main():
+    run_migrations()
+    failures = 0
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://check") as client:
+        for label, habits, completions, reminders in USERS:
+            user_id = seed(label, habits, completions, reminders)
+            queries, payload = await count_queries(client, user_id)
+            ok = queries <= MAX_QUERIES and len(payload["habits"]) == habits
+            failures += not ok
+            print(
+                f"{'✅' if ok else '❌'} {label}: {habits} habits, {habits * completions} completions, "
+                f"{reminders} reminders -> {queries} queries (max {MAX_QUERIES})"
+            )
+
+    await async_engine.dispose()
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Query plan check for the hot completion/reminder/habit/login queries
+Migrates a scratch database to head, seeds it, and verifies with EXPLAIN
+that each query is served by its composite index. Exits non-zero otherwise.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from datetime import datetime, time, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+parser = argparse.ArgumentParser(description="Verify composite index usage with EXPLAIN")
+parser.add_argument("--url", help="Scratch database URL (defaults to a temporary SQLite file)")
+args = parser.parse_args()
+
+os.environ["DATABASE_URL"] = args.url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'plans.db')}"
+
+from sqlalchemy import insert, text
+
+from app.database import SessionLocal, engine, run_migrations
+from app.models import Category, Completion, Habit, Reminder, User
+
+# (description, SQL, index expected in the plan)
+QUERIES = [
+    (
+        "completions for habit X in period Y",
+        "SELECT count(*) FROM completions "
+        "WHERE habit_id = :habit_id AND completed_at >= :start AND completed_at < :end",
+        "ix_completions_habit_id_completed_at"
+    ),
+    (
+        "completions for user X by date",
+        "SELECT id, habit_id, completed_at FROM completions "
+        "WHERE user_id = :user_id AND completed_at >= :start ORDER BY completed_at",
+        "ix_completions_user_id_completed_at"
+    ),
+    (
+        "active reminders due before T",
+        "SELECT id FROM reminders WHERE is_active = :active AND next_send <= :now",
+        "ix_reminders_is_active_next_send"
+    ),
+    (
+        "habits page for user X after cursor",
+        "SELECT id FROM habits WHERE user_id = :user_id AND (created_at, id) < (:cursor_at, :cursor_id) "
+        "ORDER BY created_at DESC, id DESC LIMIT 50",
+        "ix_habits_user_id_created_at_id"
+    ),
+    (
+        "user by login email",
+        "SELECT id FROM users WHERE lower(email) = :email",
+        "ix_users_lower_email"
+    ),
+    (
+        "user by login username",
+        "SELECT id FROM users WHERE lower(username) = :username",
+        "ix_users_lower_username"
+    ),
+]
+
+
+def seed(db):
+    """Insert enough rows for the planner to prefer indexes"""
+    now = datetime.utcnow()
+    db.execute(insert(User), [{"id": "u0", "email": "u0@example.com", "username": "u0", "hashed_password": "x"}])
+    db.execute(insert(Category), [{"id": "c0", "name": "General"}])
+    db.execute(insert(Habit), [{"id": f"h{i}", "user_id": "u0", "category_id": "c0", "title": "Habit"} for i in range(50)])
+    db.execute(insert(Completion), [
+        {"id": f"c{i}", "user_id": "u0", "habit_id": f"h{i % 50}", "completed_at": now - timedelta(hours=i)}
+        for i in range(5000)
+    ])
+    db.execute(insert(Reminder), [
+        {
+            "id": f"r{i}", "user_id": "u0", "title": "Reminder", "reminder_time": time(8, 0),
+            "is_active": i % 4 != 0, "next_send": now + timedelta(minutes=i)
+        }
+        for i in range(2000)
+    ])
+    db.commit()
+
+
+def explain(db, sql: str, params: dict) -> str:
+    if engine.dialect.name == "sqlite":
+        rows = db.execute(text(f"EXPLAIN QUERY PLAN {sql}"), params).fetchall()
+        return "\n".join(str(row[-1]) for row in rows)
+    if engine.dialect.name == "postgresql":
+        db.execute(text("ANALYZE"))
+    rows = db.execute(text(f"EXPLAIN {sql}"), params).fetchall()
+    return "\n".join(" ".join(str(col) for col in row) for row in rows)
+
+
+def main():
+    run_migrations()
+    db = SessionLocal()
+    now = datetime.utcnow()
+    params = {
+        "habit_id": "h1",
+        "user_id": "u0",
+        "start": now - timedelta(days=7),
+        "end": now,
+        "active": True,
+        "now": now,
+        "cursor_at": now,
+        "cursor_id": "h25",
+        "email": "u0@example.com",
+        "username": "u0"
+    }
+
+    failures = 0
+    try:
+        seed(db)
+        if engine.dialect.name == "sqlite":
+            db.execute(text("ANALYZE"))
+
+        for description, sql, index_name in QUERIES:
+            plan = explain(db, sql, params)
+            used = index_name in plan
+            failures += not used
+            print(f"{'✅' if used else '❌'} {description}: {index_name}")
+            for line in plan.splitlines():
+                print(f"     {line}")
+    finally:
+        db.close()
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Rebuild the completion_rollups analytics table from the completions table
+Migration 0008 backfills it; run this after backfills or imports
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import SessionLocal
+from app.core.rollups import rebuild_rollups
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild completion rollups from completions")
+    parser.add_argument("--batch-size", type=int, default=500, help="Habits read and rolled up per batch")
+    args = parser.parse_args()
+
+    print("🔁 Rebuilding completion rollups...")
+    start = time.perf_counter()
+    db = SessionLocal()
+    try:
+        processed = rebuild_rollups(db, batch_size=args.batch_size)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"✅ Rolled up {processed} completions in {elapsed:.2f}s")
+
+if __name__ == "__main__":
+    main()
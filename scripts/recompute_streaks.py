@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Rebuild every habit's streak counters from the completions table
+Use after backfills or imports; reads completions a chunk of habits at a time
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import SessionLocal
+from app.core.streaks import recompute_all_streaks
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute habit streaks from completions")
+    parser.add_argument("--batch-size", type=int, default=500, help="Habits read and written per batch")
+    args = parser.parse_args()
+
+    print("🔁 Recomputing habit streaks...")
+    start = time.perf_counter()
+    db = SessionLocal()
+    try:
+        processed = recompute_all_streaks(db, batch_size=args.batch_size)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"✅ Processed {processed} completions in {elapsed:.2f}s")
+
+if __name__ == "__main__":
+    main()